@@ -1,15 +1,45 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.db.models import Count
 from simple_history.admin import SimpleHistoryAdmin
 from django.contrib.auth.admin import UserAdmin
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.core.validators import validate_email
+from django.template.response import TemplateResponse
 from django.utils.html import format_html
-from django.urls import reverse
+from django.urls import path, reverse
 from django.utils.safestring import mark_safe
 
 from accounts.models import CustomUserModel, License
+from accounts.managers.LicenseManager import LicenseQuerySet
 from accounts.forms import CustomCreationForm, CustomChangeForm
+from common.BulkLicenseValidator import BulkLicenseValidator
+from common.ExportAdminMixin import ExportAdminMixin
+from common.LargeTableAdminMixin import LargeTableAdminMixin
+from common.LicenseDashboard import LicenseDashboard
+from common.SearchIndexAdminMixin import SearchIndexAdminMixin
+from common.LoggerApp import log_info
 
 
-class CustomUserModelAdmin(UserAdmin):
+class LicenseCountFilter(admin.SimpleListFilter):
+    """Filtra usuarios por la anotación active_license_count"""
+    title = 'licencias activas'
+    parameter_name = 'licencias'
+
+    def lookups(self, request, model_admin):
+        return (
+            ('con', 'Con licencias'),
+            ('sin', 'Sin licencias'),
+        )
+
+    def queryset(self, request, queryset):
+        if self.value() == 'con':
+            return queryset.filter(active_license_count__gt=0)
+        if self.value() == 'sin':
+            return queryset.filter(active_license_count=0)
+        return queryset
+
+
+class CustomUserModelAdmin(SearchIndexAdminMixin, UserAdmin):
     add_form = CustomCreationForm
     form = CustomChangeForm
 
@@ -58,25 +88,67 @@ class CustomUserModelAdmin(UserAdmin):
     list_filter = (
         'is_active',
         'is_confirmed_mail',
+        LicenseCountFilter,
     )
 
     search_fields = ('email', 'first_name', 'last_name')
 
     ordering = ('-date_joined',)
 
+    def get_queryset(self, request):
+        """
+        Cuenta las licencias vigentes de cada usuario en la misma consulta
+        del listado, en lugar de una consulta por fila.
+        """
+        return super().get_queryset(request).annotate(
+            active_license_count=Count(
+                'licenses', filter=License.valid_q('licenses__')
+            )
+        )
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Un email completo se busca con el índice único sobre Lower(email)
+        en lugar de recorrer la tabla con icontains.
+        """
+        term = search_term.strip()
+        try:
+            validate_email(term)
+        except ValidationError:
+            return super().get_search_results(
+                request, queryset, search_term
+            )
+        return queryset.filter(email__lower=term.lower()), False
+
     def license_count(self, obj):
-        """Mostrar el número de licencias del usuario"""
-        count = obj.licenses.filter(is_active=True).count()
+        """Mostrar el número de licencias vigentes del usuario"""
+        count = obj.active_license_count
         if count > 0:
             url = reverse('admin:accounts_license_changelist') + \
                 f'?user__id__exact={obj.id}'
             return format_html('<a href="{}">{} licencia(s)</a>', url, count)
         return "Sin licencias"
     license_count.short_description = "Licencias Activas"
+    license_count.admin_order_field = 'active_license_count'
+
+
+class LicenseStatusFilter(admin.SimpleListFilter):
+    """Filtra licencias por la anotación status de with_status()"""
+    title = 'estado'
+    parameter_name = 'estado'
+
+    def lookups(self, request, model_admin):
+        return LicenseQuerySet.STATUS_CHOICES
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(status=self.value())
+        return queryset
 
 
 @admin.register(License)
-class LicenseAdmin(admin.ModelAdmin):
+class LicenseAdmin(SearchIndexAdminMixin, LargeTableAdminMixin,
+                   ExportAdminMixin, admin.ModelAdmin):
     list_display = (
         'license_key_short',
         'user_email',
@@ -89,7 +161,11 @@ class LicenseAdmin(admin.ModelAdmin):
         'created_at',
         'is_active_base'
     )
+    list_select_related = ('user',)
+    actions = ('validate_licenses',) + ExportAdminMixin.export_actions
     list_filter = (
+        LicenseStatusFilter,
+        'last_validation_ok',
         'is_active',  # del modelo License/BaseModel
         'is_deleted',
         'enterprise',
@@ -98,24 +174,38 @@ class LicenseAdmin(admin.ModelAdmin):
         'created_at',
         'updated_at'
     )
+    # Búsqueda en el índice de texto (common.SearchIndex); sin índice,
+    # por prefijo con el PrefixIndex de cada campo
     search_fields = (
         'license_key',
         'user__email',
-        'user__first_name',
-        'user__last_name',
-        'enterprise',
-        'notes'
     )
+    search_index_fields = ('license_key', 'user__email')
+    search_help_text = (
+        'Clave, empresa, notas, email o nombre del usuario, o ID'
+    )
+    # Índice keyset de BaseModel (-created_at, -id)
+    date_hierarchy = 'created_at'
     readonly_fields = (
         'created_at',
         'updated_at',
         'is_expired',
         'days_remaining',
+        'last_validated_at',
+        'last_validation_ok',
+        'last_validation_message',
         'id_user_created',
         'id_user_updated'
     )
     raw_id_fields = ('user',)
 
+    STATUS_COLORS = {
+        LicenseQuerySet.ACTIVE: 'green',
+        LicenseQuerySet.INACTIVE: 'orange',
+        LicenseQuerySet.EXPIRED: 'red',
+        LicenseQuerySet.DELETED: 'gray',
+    }
+
     fieldsets = (
         ('Información Principal', {
             'fields': ('user', 'license_key', 'enterprise')
@@ -133,6 +223,13 @@ class LicenseAdmin(admin.ModelAdmin):
             'fields': ('is_expired', 'days_remaining'),
             'classes': ('collapse',)
         }),
+        ('Última Validación', {
+            'fields': (
+                'last_validated_at', 'last_validation_ok',
+                'last_validation_message'
+            ),
+            'classes': ('collapse',)
+        }),
         ('BaseModel Fields', {
             'fields': (
                 'notes', 'is_deleted',
@@ -146,6 +243,70 @@ class LicenseAdmin(admin.ModelAdmin):
         })
     )
 
+    def get_queryset(self, request):
+        """Estado y tiempo restante calculados en la consulta del listado"""
+        return super().get_queryset(request).with_status()
+
+    def get_urls(self):
+        urls = [
+            path(
+                'dashboard/',
+                self.admin_site.admin_view(self.dashboard_view),
+                name='accounts_license_dashboard'
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def changelist_view(self, request, extra_context=None):
+        extra_context = {
+            'dashboard_url': reverse('admin:accounts_license_dashboard'),
+            **(extra_context or {}),
+        }
+        return super().changelist_view(request, extra_context)
+
+    def dashboard_view(self, request):
+        """Panel con los totales por estado, empresa y vencimiento
+        (common.LicenseDashboard)"""
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+
+        summary = LicenseDashboard.get()
+        days = summary['expiry_days']
+        statuses = LicenseQuerySet.STATUS_CHOICES
+        expiries = list(zip(
+            LicenseDashboard.expiry_codes(days),
+            LicenseDashboard.expiry_labels(days)
+        ))
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'title': 'Panel de licencias',
+            'summary': summary,
+            'status_rows': [
+                (code, label, self.STATUS_COLORS[code],
+                 summary['by_status'][code])
+                for code, label in statuses
+            ],
+            'expiry_rows': [
+                (label, summary['by_expiry'][code])
+                for code, label in expiries
+            ],
+            'status_labels': [label for _, label in statuses],
+            'expiry_labels': [label for _, label in expiries],
+            'enterprise_rows': [
+                (
+                    enterprise['enterprise'],
+                    enterprise['total'],
+                    [enterprise['by_status'][code] for code, _ in statuses],
+                    [enterprise['by_expiry'][code] for code, _ in expiries],
+                )
+                for enterprise in summary['enterprises']
+            ],
+        }
+        return TemplateResponse(
+            request, 'admin/accounts/license/dashboard.html', context
+        )
+
     def license_key_short(self, obj):
         """Mostrar versión corta de la clave de licencia"""
         if len(obj.license_key) > 20:
@@ -159,31 +320,21 @@ class LicenseAdmin(admin.ModelAdmin):
                       args=[obj.user.id])
         return format_html('<a href="{}">{}</a>', url, obj.user.email)
     user_email.short_description = "Usuario"
+    user_email.admin_order_field = 'user__email'
 
     def status_badge(self, obj):
         """Mostrar badge colorido del estado"""
-        if obj.is_deleted:
-            color = 'gray'
-            text = 'Eliminada'
-        elif obj.is_active and not obj.is_expired:
-            color = 'green'
-            text = 'Activa'
-        elif obj.is_expired:
-            color = 'red'
-            text = 'Expirada'
-        else:
-            color = 'orange'
-            text = 'Inactiva'
-
         return format_html(
             '<span style="color: {}; font-weight: bold;">{}</span>',
-            color, text
+            self.STATUS_COLORS[obj.status],
+            dict(LicenseQuerySet.STATUS_CHOICES)[obj.status]
         )
     status_badge.short_description = "Estado"
+    status_badge.admin_order_field = 'status'
 
     def days_remaining_display(self, obj):
         """Mostrar días restantes con color"""
-        days = obj.days_remaining
+        days = obj.remaining.days
         if days <= 0:
             color = 'red'
             text = 'Expirada'
@@ -196,6 +347,38 @@ class LicenseAdmin(admin.ModelAdmin):
 
         return format_html('<span style="color: {};">{}</span>', color, text)
     days_remaining_display.short_description = "Días Restantes"
+    days_remaining_display.admin_order_field = 'remaining'
+
+    @admin.action(description='Validar licencias en el servicio externo')
+    def validate_licenses(self, request, queryset):
+        """Valida las licencias seleccionadas de forma concurrente"""
+        # Se valida dentro de la petición: los lotes grandes van al comando
+        limit = BulkLicenseValidator.get_config()['ADMIN_LIMIT']
+        selected = queryset.order_by()[:limit + 1].count()
+        if selected > limit:
+            self.message_user(
+                request,
+                f'Seleccione como máximo {limit} licencias para validar '
+                'desde el admin. Para lotes mayores use: python manage.py '
+                'validate_licenses',
+                messages.ERROR
+            )
+            return
+        summary = BulkLicenseValidator(queryset.order_by()).run()
+        message = (
+            f"{summary['total']} licencia(s) validada(s) en "
+            f"{summary['seconds']} s - {summary['valid']} válida(s), "
+            f"{summary['invalid']} inválida(s)"
+        )
+        log_info(
+            user=request.user,
+            url=request.path,
+            file_name=self.__class__.__name__,
+            message=message,
+            request=request
+        )
+        level = messages.WARNING if summary['invalid'] else messages.SUCCESS
+        self.message_user(request, message, level)
 
     def is_active_base(self, obj):
         """Mostrar estado del BaseModel"""
@@ -206,4 +389,33 @@ class LicenseAdmin(admin.ModelAdmin):
     is_active_base.short_description = "Estado Base"
 
 
+@admin.register(License.history.model)
+class HistoricalLicenseAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    """Historial de licencias de solo lectura"""
+    list_display = (
+        'history_id',
+        'license_key',
+        'history_type',
+        'history_date',
+        'history_user',
+        'history_change_reason',
+    )
+    list_filter = ('history_type',)
+    list_select_related = ('history_user',)
+    search_fields = ('license_key',)
+    search_index_fields = ('license_key',)
+    search_help_text = 'Clave de licencia o ID de la versión'
+    date_hierarchy = 'history_date'
+    keyset_ordering = ('-history_date', '-history_id')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
 admin.site.register(CustomUserModel, CustomUserModelAdmin)
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
+
+    def ready(self):
+        from django.core import checks
+        from django.db.models.signals import post_migrate
+        from accounts import signals  # noqa: F401
+        from common.SharedCache import check_shared_caches
+        post_migrate.connect(signals.create_search_index, sender=self)
+        checks.register(check_shared_caches, checks.Tags.caches)
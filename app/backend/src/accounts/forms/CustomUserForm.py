@@ -1,6 +1,8 @@
 from django import forms
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import UploadedFile
+from common.ImageRenditions import ImageRenditions
 
 User = get_user_model()
 
@@ -58,7 +60,7 @@ class CustomUserForm(forms.ModelForm):
         if email:
             # Verificar si otro usuario ya tiene este email
             existing_user = User.objects.filter(
-                email=email).exclude(pk=self.instance.pk).first()
+                email__lower=email.lower()).exclude(pk=self.instance.pk).first()
             if existing_user:
                 raise ValidationError(
                     'Este correo electrónico ya está siendo utilizado por otro usuario.')
@@ -79,4 +81,19 @@ class CustomUserForm(forms.ModelForm):
                 raise ValidationError(
                     'Formato de archivo no válido. Use JPG, PNG o GIF.')
 
+            # Orientación corregida, sin metadatos y nombre por contenido
+            if isinstance(picture, UploadedFile):
+                try:
+                    picture = ImageRenditions.normalize(picture)
+                except (OSError, ValueError):
+                    raise ValidationError(
+                        'No se pudo procesar la imagen.')
+
         return picture
+
+    def save(self, commit=True):
+        """Genera las versiones de la foto en segundo plano si cambió"""
+        user = super().save(commit=commit)
+        if commit and 'picture' in self.changed_data and user.picture:
+            ImageRenditions.generate_async(user.picture.name)
+        return user
@@ -0,0 +1,138 @@
+"""
+Comando de Django para medir los hashers de contraseña configurados y
+recomendar iteraciones para una latencia objetivo.
+
+Uso:
+python manage.py calibrate_hashers
+python manage.py calibrate_hashers --target-ms 300 --samples 10
+"""
+
+import statistics
+import time
+
+from django.contrib.auth.hashers import get_hashers
+from django.core.management.base import BaseCommand, CommandError
+from common.CalibratedHashers import CalibratedPBKDF2PasswordHasher
+from common.LoggerApp import log_info, log_warning
+
+
+class Command(BaseCommand):
+    help = 'Mide los hashers de contraseña y recomienda iteraciones'
+
+    # Iteraciones mínimas recomendadas para PBKDF2-SHA256 (OWASP 2023)
+    MIN_PBKDF2_ITERATIONS = 600000
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--target-ms',
+            type=float,
+            default=250,
+            help='Latencia objetivo por verificación en milisegundos'
+        )
+        parser.add_argument(
+            '--samples',
+            type=int,
+            default=5,
+            help='Mediciones por hasher'
+        )
+        parser.add_argument(
+            '--bench-iterations',
+            type=int,
+            default=100000,
+            help='Iteraciones usadas en cada medición de PBKDF2'
+        )
+
+    def handle(self, *args, **options):
+        target_ms = options['target_ms']
+        samples = options['samples']
+        if target_ms <= 0 or samples <= 0:
+            raise CommandError('--target-ms y --samples deben ser mayores a 0')
+
+        self.stdout.write(f'Latencia objetivo: {target_ms:.0f} ms')
+        for position, hasher in enumerate(get_hashers()):
+            preferred = ' (preferido)' if position == 0 else ''
+            name = f'{hasher.__class__.__name__}{preferred}'
+            if hasattr(hasher, 'iterations') and \
+                    hasher.algorithm.startswith('pbkdf2'):
+                self._calibrate_pbkdf2(
+                    hasher, name, target_ms, samples,
+                    options['bench_iterations']
+                )
+            else:
+                self._measure(hasher, name, samples)
+
+    def _time_ms(self, func, samples):
+        """Mediana en milisegundos de varias ejecuciones."""
+        timings = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    def _calibrate_pbkdf2(self, hasher, name, target_ms, samples,
+                          bench_iterations):
+        """Calcula las iteraciones de PBKDF2 para la latencia objetivo."""
+        salt = hasher.salt()
+        elapsed_ms = self._time_ms(
+            lambda: hasher.encode('calibracion', salt, bench_iterations),
+            samples
+        )
+        ms_per_iteration = elapsed_ms / bench_iterations
+        current_ms = ms_per_iteration * hasher.iterations
+        recommended = max(
+            1000, int(target_ms / ms_per_iteration) // 1000 * 1000
+        )
+
+        message = (
+            f'{name}: {hasher.iterations} iteraciones = '
+            f'{current_ms:.1f} ms - Recomendado para {target_ms:.0f} ms: '
+            f'{recommended} iteraciones'
+        )
+        self.stdout.write(self.style.SUCCESS(message))
+        log_info(
+            user=None,
+            url='N/A',
+            file_name='calibrate_hashers',
+            message=message
+        )
+
+        if recommended < self.MIN_PBKDF2_ITERATIONS:
+            warning = (
+                f'{name}: {recommended} iteraciones está por debajo del '
+                f'mínimo recomendado ({self.MIN_PBKDF2_ITERATIONS}); '
+                f'considere un objetivo de latencia mayor'
+            )
+            self.stdout.write(self.style.WARNING(warning))
+            log_warning(
+                user=None,
+                url='N/A',
+                file_name='calibrate_hashers',
+                message=warning
+            )
+        elif isinstance(hasher, CalibratedPBKDF2PasswordHasher):
+            self.stdout.write(
+                f'  settings.py: PASSWORD_PBKDF2_ITERATIONS = {recommended}'
+            )
+
+    def _measure(self, hasher, name, samples):
+        """Mide un hasher sin parámetro de iteraciones calibrable."""
+        try:
+            salt = hasher.salt()
+            elapsed_ms = self._time_ms(
+                lambda: hasher.encode('calibracion', salt), samples
+            )
+        except Exception as error:
+            self.stdout.write(
+                self.style.WARNING(f'{name}: no disponible ({error})')
+            )
+            return
+
+        message = f'{name}: {elapsed_ms:.1f} ms por hash'
+        self.stdout.write(message)
+        log_info(
+            user=None,
+            url='N/A',
+            file_name='calibrate_hashers',
+            message=message
+        )
@@ -0,0 +1,111 @@
+"""
+Comando de Django para exportar un modelo a CSV, JSONL o XLSX en streaming.
+
+Uso:
+python manage.py export_model accounts.License --format csv > licencias.csv
+python manage.py export_model accounts.License --format xlsx \
+    --output licencias.xlsx --fields id,license_key,expires_on --state alive
+"""
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from common.LoggerApp import log_info
+from common.ModelExporter import ModelExporter
+
+
+class Command(BaseCommand):
+    help = 'Exporta un modelo a CSV, JSONL o XLSX con memoria constante'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'model',
+            type=str,
+            help='Modelo a exportar (app_label.Model)'
+        )
+        parser.add_argument(
+            '--format',
+            choices=list(ModelExporter.FORMATS),
+            default='csv',
+            help='Formato de salida'
+        )
+        parser.add_argument(
+            '--fields',
+            type=str,
+            default=None,
+            help='Campos separados por coma'
+        )
+        parser.add_argument(
+            '--state',
+            choices=ModelExporter.STATES,
+            default='all',
+            help='Filtro de soft delete'
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            default=None,
+            help='Archivo de salida, por defecto la salida estándar'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='Registros leídos por bloque'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options['model'])
+        except (LookupError, ValueError):
+            raise CommandError(f"Modelo {options['model']} no encontrado")
+
+        fields = None
+        if options['fields']:
+            fields = [name.strip() for name in options['fields'].split(',')]
+
+        export_format = options['format']
+        output = options['output']
+        if export_format == 'xlsx' and not output:
+            raise CommandError('El formato xlsx requiere --output')
+
+        try:
+            exporter = ModelExporter(
+                model._default_manager.order_by('pk'),
+                export_format,
+                fields=fields,
+                state=options['state'],
+                chunk_size=options['chunk_size']
+            )
+        except ValueError as error:
+            raise CommandError(str(error))
+
+        if output:
+            with open(output, 'wb') as output_file:
+                count = exporter.write(output_file)
+        else:
+            count = exporter.write(_TextWriter(self.stdout))
+
+        message = (
+            f'{count} registros de {model._meta.label} exportados a '
+            f'{output or "stdout"} ({export_format})'
+        )
+        log_info(
+            user=None,
+            url='N/A',
+            file_name='export_model',
+            message=message
+        )
+        if output:
+            self.stdout.write(self.style.SUCCESS(message))
+        else:
+            self.stderr.write(message)
+
+
+class _TextWriter:
+    """Adapta la salida del comando para recibir bytes."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, data):
+        self.stream.write(data.decode('utf-8'), ending='')
@@ -0,0 +1,78 @@
+"""
+Comando de Django para generar las versiones (common.ImageRenditions) de
+las fotos de perfil que no las tienen: fotos subidas antes de existir las
+versiones o cuya generación en segundo plano falló.
+
+Uso:
+python manage.py generate_renditions
+python manage.py generate_renditions --user usuario@example.com
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from common.ImageRenditions import ImageRenditions
+from common.LoggerApp import log_error, log_info
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Genera las versiones de las fotos de perfil que no las tienen'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=str,
+            default=None,
+            help='Email del usuario cuya foto se procesa'
+        )
+
+    def handle(self, *args, **options):
+        users = User.objects.exclude(picture='').exclude(picture__isnull=True)
+        if options['user']:
+            try:
+                user = User.objects.get_by_natural_key(options['user'])
+            except User.DoesNotExist:
+                raise CommandError(
+                    f"Usuario con email {options['user']} no encontrado"
+                )
+            users = users.filter(pk=user.pk)
+
+        generated = ready = failed = 0
+        for user in users.order_by('pk').iterator():
+            picture = user.picture
+            # La caché no debe ocultar versiones que falten en el storage
+            ImageRenditions.forget(picture.name)
+            if ImageRenditions.is_ready(picture):
+                ready += 1
+                continue
+            try:
+                ImageRenditions.generate(picture.name, picture.storage)
+            except Exception as error:
+                failed += 1
+                self.stdout.write(self.style.ERROR(
+                    f'  ✗ {user.email}: {error}'
+                ))
+                log_error(
+                    user=None,
+                    url='N/A',
+                    file_name='generate_renditions',
+                    message=f"Error al generar versiones de {picture.name}: "
+                            f"{error}"
+                )
+                continue
+            generated += 1
+
+        message = (
+            f'{generated} foto(s) procesada(s), {ready} ya tenían '
+            f'versiones, {failed} con error'
+        )
+        style = self.style.WARNING if failed else self.style.SUCCESS
+        self.stdout.write(style(message))
+        log_info(
+            user=None,
+            url='N/A',
+            file_name='generate_renditions',
+            message=message
+        )
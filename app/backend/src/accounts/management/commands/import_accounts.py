@@ -0,0 +1,87 @@
+"""
+Comando de Django para importar usuarios y licencias de forma masiva.
+
+Uso:
+python manage.py import_accounts usuarios.csv
+python manage.py import_accounts usuarios.xlsx --workers 4 --batch-size 2000
+python manage.py import_accounts usuarios.csv --dry-run --errors errores.csv
+"""
+
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+from common.AccountImporter import AccountImporter
+from common.LoggerApp import log_info, log_warning
+
+
+class Command(BaseCommand):
+    help = 'Importa usuarios y licencias desde CSV o XLSX'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            type=str,
+            help='Archivo .csv o .xlsx a importar'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Filas por lote'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Procesos para calcular hashes (0 = sin pool)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Solo valida el archivo'
+        )
+        parser.add_argument(
+            '--errors',
+            type=str,
+            default=None,
+            help='Archivo CSV donde guardar los errores por fila'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            importer = AccountImporter(
+                options['path'],
+                batch_size=options['batch_size'],
+                workers=options['workers'],
+                dry_run=options['dry_run']
+            )
+            result = importer.run()
+        except (OSError, ValueError) as error:
+            raise CommandError(str(error))
+
+        for row_number, message in result.errors[:50]:
+            self.stdout.write(self.style.ERROR(f'Fila {row_number}: {message}'))
+        if len(result.errors) > 50:
+            self.stdout.write(
+                self.style.WARNING(
+                    f'... {len(result.errors) - 50} errores más'
+                )
+            )
+
+        if options['errors'] and result.errors:
+            with open(options['errors'], 'w', newline='',
+                      encoding='utf-8') as errors_file:
+                writer = csv.writer(errors_file)
+                writer.writerow(['fila', 'error'])
+                writer.writerows(result.errors)
+
+        prefix = 'Validación' if options['dry_run'] else 'Importación'
+        message = f"{prefix} de {options['path']}: {result}"
+        log_function = log_warning if result.errors else log_info
+        log_function(
+            user=None,
+            url='N/A',
+            file_name='import_accounts',
+            message=message
+        )
+        self.stdout.write(self.style.SUCCESS(message))
@@ -0,0 +1,78 @@
+"""
+Comando de Django para listar y resumir los perfiles de peticiones lentas.
+
+Uso:
+python manage.py list_profiles
+python manage.py list_profiles --limit 5
+python manage.py list_profiles --show <request_id>
+"""
+
+from datetime import datetime
+
+from django.core.management.base import BaseCommand
+from common.RequestProfiler import RequestProfiler
+
+
+class Command(BaseCommand):
+    help = 'Lista y resume los perfiles guardados de peticiones lentas'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=20,
+            help='Cantidad máxima de perfiles a listar'
+        )
+        parser.add_argument(
+            '--show',
+            type=str,
+            default=None,
+            help='Request ID del perfil a resumir'
+        )
+        parser.add_argument(
+            '--sort',
+            type=str,
+            default='cumulative',
+            help='Criterio de ordenamiento (cumulative, tottime, calls)'
+        )
+
+    def handle(self, *args, **options):
+        profiler = RequestProfiler()
+
+        if options['show']:
+            self._show_profile(profiler, options['show'], options['sort'],
+                               options['limit'])
+            return
+
+        profiles = profiler.list_profiles()
+        if not profiles:
+            self.stdout.write(
+                self.style.WARNING(
+                    f'No hay perfiles guardados en {profiler.profile_dir}'
+                )
+            )
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Perfiles encontrados: {len(profiles)}')
+        )
+        for meta in profiles[:options['limit']]:
+            created = datetime.fromtimestamp(meta.get('created_at', 0))
+            self.stdout.write(
+                f"\n{meta['request_id']} | {created:%Y-%m-%d %H:%M:%S} | "
+                f"{meta.get('method')} {meta.get('url')} | "
+                f"Status: {meta.get('status')} | "
+                f"Tiempo: {meta.get('response_time')}ms"
+            )
+            for frame in meta.get('top_frames', [])[:3]:
+                self.stdout.write(f'    - {frame}')
+
+    def _show_profile(self, profiler, request_id, sort_by, limit):
+        """Muestra el resumen de pstats de un perfil."""
+        summary = profiler.summarize(request_id, limit=limit, sort_by=sort_by)
+        if summary is None:
+            self.stdout.write(
+                self.style.ERROR(f'Perfil {request_id} no encontrado')
+            )
+            return
+        self.stdout.write(summary)
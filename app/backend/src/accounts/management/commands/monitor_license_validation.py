@@ -35,7 +35,7 @@ class Command(BaseCommand):
         simulate_request = options.get('simulate_request', False)
 
         try:
-            user = User.objects.get(email=email)
+            user = User.objects.get_by_natural_key(email)
             self.stdout.write(
                 self.style.SUCCESS(f'Usuario encontrado: {user.email}')
             )
@@ -0,0 +1,35 @@
+"""
+Comando de Django para precalcular el panel de licencias del admin
+(common.LicenseDashboard). Con LICENSE_DASHBOARD['PRECOMPUTED'] la página
+solo lee este resumen, por lo que el comando debe programarse (cron).
+
+Uso:
+python manage.py precompute_license_dashboard
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from common.LicenseDashboard import LicenseDashboard
+from common.LoggerApp import log_info
+
+
+class Command(BaseCommand):
+    help = 'Precalcula los totales del panel de licencias'
+
+    def handle(self, *args, **options):
+        start = time.monotonic()
+        summary = LicenseDashboard.precompute()
+        seconds = round(time.monotonic() - start, 2)
+        message = (
+            f"Panel de licencias precalculado: {summary['total']} "
+            f"licencias de {len(summary['enterprises'])} empresa(s) "
+            f"en {seconds} s"
+        )
+        self.stdout.write(self.style.SUCCESS(message))
+        log_info(
+            user=None,
+            url='N/A',
+            file_name='precompute_license_dashboard',
+            message=message
+        )
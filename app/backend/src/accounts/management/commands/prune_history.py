@@ -0,0 +1,114 @@
+"""
+Comando de Django para depurar los registros históricos según la política
+de retención HISTORY_RETENTION de settings.
+
+Uso:
+python manage.py prune_history
+python manage.py prune_history --model accounts.License --dry-run
+python manage.py prune_history --chunk-size 500 --sleep 0.2
+"""
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from common.HistoryPruner import HistoryPruner
+from common.LoggerApp import log_info
+
+
+class Command(BaseCommand):
+    help = 'Depura el historial de los modelos según la política de retención'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            action='append',
+            default=None,
+            help='Modelo a depurar (app_label.Model), puede repetirse'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='Filas eliminadas por bloque'
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=0,
+            help='Pausa en segundos entre bloques'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Solo muestra cuántas filas se eliminarían'
+        )
+
+    def handle(self, *args, **options):
+        models = self._get_models(options['model'])
+        dry_run = options['dry_run']
+
+        for model in models:
+            pruner = HistoryPruner(
+                model,
+                chunk_size=options['chunk_size'],
+                sleep=options['sleep'],
+                dry_run=dry_run,
+                progress=self._progress
+            )
+            self.stdout.write(
+                f'\n{model._meta.label}: política {pruner.policy}'
+            )
+            result = pruner.prune()
+            self._report(result, dry_run)
+
+    def _get_models(self, labels):
+        """Obtiene los modelos con historial a depurar."""
+        history_models = HistoryPruner.history_models()
+        if not labels:
+            return history_models
+
+        models = []
+        for label in labels:
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError):
+                raise CommandError(f'Modelo {label} no encontrado')
+            if model not in history_models:
+                raise CommandError(f'El modelo {label} no tiene historial')
+            models.append(model)
+        return models
+
+    def _progress(self, message):
+        """Muestra y registra el progreso de la depuración."""
+        self.stdout.write(f'  {message}')
+        log_info(
+            user=None,
+            url='N/A',
+            file_name='prune_history',
+            message=message
+        )
+
+    def _report(self, result, dry_run):
+        """Muestra el resumen de la depuración de un modelo."""
+        action = 'Se eliminarían' if dry_run else 'Eliminadas'
+        reclaimed = result['reclaimed_bytes']
+        reclaimed_text = (
+            f'{reclaimed / 1024 / 1024:.2f} MB' if reclaimed is not None
+            else 'no disponible'
+        )
+        message = (
+            f"{result['model']}: {action} {result['deleted']} de "
+            f"{result['rows_before']} versiones - Espacio estimado "
+            f"recuperable: {reclaimed_text}"
+        )
+        self.stdout.write(self.style.SUCCESS(message))
+        log_info(
+            user=None,
+            url='N/A',
+            file_name='prune_history',
+            message=message
+        )
+        if not dry_run and result['deleted']:
+            self.stdout.write(
+                '  El espacio se libera en disco tras VACUUM '
+                '(PostgreSQL/SQLite).'
+            )
@@ -0,0 +1,62 @@
+"""
+Comando de Django para reconstruir el índice de búsqueda de texto
+(common.SearchIndex) de licencias y usuarios.
+
+Uso:
+python manage.py rebuild_search_index
+python manage.py rebuild_search_index --model accounts.License
+"""
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from common.LoggerApp import log_info
+from common.SearchIndex import SearchIndex
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye el índice de búsqueda de licencias y usuarios'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            action='append',
+            default=None,
+            help='Modelo a reindexar (app_label.Model), puede repetirse'
+        )
+
+    def handle(self, *args, **options):
+        for model in self._get_models(options['model']):
+            if SearchIndex.vendor(model) is None:
+                raise CommandError(
+                    'El motor de base de datos no admite el índice de '
+                    'búsqueda (SQLite o PostgreSQL)'
+                )
+            self.stdout.write(f'{model._meta.label}:')
+            total = SearchIndex.rebuild(
+                model,
+                progress=lambda message: self.stdout.write(f'  {message}')
+            )
+            message = f'{model._meta.label}: {total} documentos indexados'
+            self.stdout.write(self.style.SUCCESS(message))
+            log_info(
+                user=None,
+                url='N/A',
+                file_name='rebuild_search_index',
+                message=message
+            )
+
+    def _get_models(self, labels):
+        """Obtiene los modelos indexados a reconstruir."""
+        if not labels:
+            return [apps.get_model(label) for label in SearchIndex.DOCUMENTS]
+
+        models = []
+        for label in labels:
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError):
+                raise CommandError(f'Modelo {label} no encontrado')
+            if not SearchIndex.is_indexed(model):
+                raise CommandError(f'El modelo {label} no está indexado')
+            models.append(model)
+        return models
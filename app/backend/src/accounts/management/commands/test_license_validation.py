@@ -25,7 +25,7 @@ class Command(BaseCommand):
         email = options['email']
         
         try:
-            user = User.objects.get(email=email)
+            user = User.objects.get_by_natural_key(email)
             self.stdout.write(
                 self.style.SUCCESS(f'Usuario encontrado: {user.email}')
             )
@@ -0,0 +1,113 @@
+"""
+Comando de Django para validar licencias de forma concurrente contra su
+servicio externo y guardar el resultado en cada licencia.
+
+Uso:
+python manage.py validate_licenses
+python manage.py validate_licenses --user usuario@example.com
+python manage.py validate_licenses --key ABC-123 --key DEF-456
+python manage.py validate_licenses --all --workers 32 --per-host 8
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.models import License
+from common.BulkLicenseValidator import BulkLicenseValidator
+from common.LoggerApp import log_info
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Valida licencias de forma concurrente contra su servicio externo'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=str,
+            default=None,
+            help='Email del usuario cuyas licencias se validan'
+        )
+        parser.add_argument(
+            '--key',
+            action='append',
+            default=None,
+            help='Clave de licencia a validar, puede repetirse'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Incluye licencias inactivas (por defecto solo las vigentes)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Peticiones simultáneas en total'
+        )
+        parser.add_argument(
+            '--per-host',
+            type=int,
+            default=None,
+            help='Peticiones simultáneas por servidor'
+        )
+        parser.add_argument(
+            '--timeout',
+            type=float,
+            default=None,
+            help='Segundos de espera por petición'
+        )
+
+    def handle(self, *args, **options):
+        licenses = self._get_licenses(options)
+        self.stdout.write(f'Validando {len(licenses)} licencia(s)...')
+
+        summary = BulkLicenseValidator(
+            licenses,
+            workers=options['workers'],
+            per_host=options['per_host'],
+            timeout=options['timeout'],
+            progress=lambda message: self.stdout.write(f'  {message}')
+        ).run()
+
+        message = (
+            f"{summary['total']} licencia(s) validada(s) en "
+            f"{summary['seconds']} s - {summary['valid']} válida(s), "
+            f"{summary['invalid']} inválida(s)"
+        )
+        style = self.style.WARNING if summary['invalid'] else \
+            self.style.SUCCESS
+        self.stdout.write(style(message))
+        log_info(
+            user=None,
+            url='N/A',
+            file_name='validate_licenses',
+            message=message
+        )
+
+        for license_obj in licenses:
+            if not license_obj.last_validation_ok:
+                self.stdout.write(
+                    f'  ✗ {license_obj.license_key}: '
+                    f'{license_obj.last_validation_message}'
+                )
+
+    def _get_licenses(self, options):
+        """Obtiene las licencias a validar según las opciones."""
+        if options['all']:
+            queryset = License.objects.filter(is_deleted=False)
+        else:
+            queryset = License.objects.filter(License.valid_q())
+
+        if options['user']:
+            try:
+                user = User.objects.get_by_natural_key(options['user'])
+            except User.DoesNotExist:
+                raise CommandError(
+                    f"Usuario con email {options['user']} no encontrado"
+                )
+            queryset = queryset.filter(user=user)
+        if options['key']:
+            queryset = queryset.filter(license_key__in=options['key'])
+        return list(queryset.order_by('pk'))
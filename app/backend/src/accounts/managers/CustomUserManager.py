@@ -1,7 +1,40 @@
 from django.contrib.auth.base_user import BaseUserManager
+from django.db import models
 
 
-class CustomUserManager(BaseUserManager):
+class CustomUserQuerySet(models.QuerySet):
+    """
+    QuerySet de usuarios. update() no envía post_save, por lo que invalida
+    aquí la caché de EmailBackEndAuth.get_user y reindexa en
+    common.SearchIndex los usuarios afectados y sus licencias (delete()
+    envía post_delete por usuario y lo atiende accounts.signals).
+    """
+
+    def update(self, **kwargs):
+        # ModelBackend llama a get_user_model() al importarse
+        from common.EmailBackEndAuth import EmailBackEndAuth
+        from common.SearchIndex import SearchIndex
+
+        reindex = SearchIndex.affects_index(self.model, kwargs)
+        pks = []
+        if reindex or EmailBackEndAuth.get_cache_timeout():
+            pks = list(self.values_list('pk', flat=True))
+        updated = super().update(**kwargs)
+        if updated and pks:
+            EmailBackEndAuth.invalidate_users(pks)
+            if reindex:
+                SearchIndex.update(self.model, pks)
+        return updated
+
+
+class CustomUserManager(BaseUserManager.from_queryset(CustomUserQuerySet)):
+
+    def get_by_natural_key(self, email):
+        """
+        Obtiene un usuario por email sin distinguir mayúsculas, usando el
+        índice único sobre Lower(email).
+        """
+        return self.get(email__lower=email.lower())
 
     def create_user(self, email, password=None, **extra_fields):
         """
@@ -0,0 +1,120 @@
+"""
+QuerySet y Manager de licencias con el estado calculado en la base de
+datos, para ordenar y filtrar por estado sin recorrer las filas en Python.
+"""
+
+from datetime import timedelta
+
+from django.db import models
+from django.utils import timezone
+
+from common.BaseManager import BaseManager, BaseQuerySet
+
+
+class LicenseQuerySet(BaseQuerySet):
+    """
+    QuerySet de licencias.
+
+    Uso:
+    License.objects.with_status().filter(status=LicenseQuerySet.EXPIRED)
+    License.objects.with_status().order_by('remaining')
+    License.objects.expiry_summary()
+    """
+
+    ACTIVE = 'activa'
+    INACTIVE = 'inactiva'
+    EXPIRED = 'expirada'
+    DELETED = 'eliminada'
+    STATUS_CHOICES = (
+        (ACTIVE, 'Activa'),
+        (INACTIVE, 'Inactiva'),
+        (EXPIRED, 'Expirada'),
+        (DELETED, 'Eliminada'),
+    )
+    # Grupos de vencimiento de las licencias activas (expiry_summary)
+    NO_EXPIRY = 'sin_vencimiento'
+    LATER = 'posterior'
+
+    def _status_case(self, now):
+        return models.Case(
+            models.When(is_deleted=True, then=models.Value(self.DELETED)),
+            models.When(self.model.valid_q(now=now), then=models.Value(
+                self.ACTIVE
+            )),
+            models.When(expires_on__lte=now, then=models.Value(
+                self.EXPIRED
+            )),
+            default=models.Value(self.INACTIVE),
+            output_field=models.CharField(),
+        )
+
+    def with_status(self):
+        '''Anota el estado y el tiempo restante de cada licencia.
+
+        Anotaciones:
+            status: Estado con la misma prioridad que en el admin
+                    (eliminada, activa, expirada, inactiva)
+            remaining: Tiempo hasta la expiración (DurationField), cero
+                       si expiró o no tiene fecha, igual que days_remaining
+
+        Returns:
+            QuerySet anotado
+        '''
+        now = timezone.now()
+        return self.annotate(
+            status=self._status_case(now),
+            remaining=models.Case(
+                models.When(
+                    expires_on__gt=now,
+                    then=models.ExpressionWrapper(
+                        models.F('expires_on') - models.Value(now),
+                        output_field=models.DurationField()
+                    )
+                ),
+                default=models.Value(timedelta(0)),
+                output_field=models.DurationField(),
+            ),
+        )
+
+    def expiry_summary(self, days=(7, 30, 90), now=None):
+        '''Cuenta las licencias por empresa, estado y vencimiento en una
+        sola consulta agrupada.
+
+        Args:
+            days: Límites en días de los grupos de vencimiento; las
+                  licencias activas que expiran después del último
+                  quedan en LATER y las que no expiran en NO_EXPIRY
+            now: Fecha de referencia, por defecto la actual
+
+        Returns:
+            QuerySet de diccionarios con enterprise, status, expiry
+            (límite en días como texto, LATER, NO_EXPIRY o None si la
+            licencia no está activa) y total
+        '''
+        now = now or timezone.now()
+        buckets = [
+            models.When(
+                expires_on__lte=now + timedelta(days=limit),
+                then=models.Value(str(limit))
+            )
+            for limit in sorted(days)
+        ]
+        return self.annotate(
+            status=self._status_case(now),
+        ).annotate(
+            expiry=models.Case(
+                models.When(~models.Q(status=self.ACTIVE), then=None),
+                models.When(expires_on__isnull=True, then=models.Value(
+                    self.NO_EXPIRY
+                )),
+                *buckets,
+                default=models.Value(self.LATER),
+                output_field=models.CharField(),
+            ),
+        ).order_by().values('enterprise', 'status', 'expiry').annotate(
+            total=models.Count('pk')
+        )
+
+
+class LicenseManager(BaseManager.from_queryset(LicenseQuerySet)):
+    """Manager por defecto de License."""
@@ -4,9 +4,14 @@
 """
 
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ObjectDoesNotExist
 from accounts.managers import CustomUserManager
+from common.PrefixIndex import PrefixIndex
+
+# Permite email__lower='...', que usa el índice único sobre Lower(email)
+models.EmailField.register_lookup(Lower)
 
 
 class CustomUserModel(AbstractUser):
@@ -53,13 +58,31 @@ class CustomUserModel(AbstractUser):
     REQUIRED_FIELDS = []
     objects = CustomUserManager()
 
+    class Meta(AbstractUser.Meta):
+        constraints = [
+            # El email es único sin distinguir mayúsculas; el índice
+            # funcional permite buscar con email__lower sin recorrer la tabla
+            models.UniqueConstraint(
+                Lower('email'),
+                name='customusermodel_email_ci_uniq',
+                violation_error_message=(
+                    'Ya existe un usuario con este correo electrónico.'
+                ),
+            ),
+        ]
+        indexes = [
+            # Búsqueda por prefijo del admin de licencias
+            PrefixIndex('email', name='customuser_email_prefix_idx'),
+        ]
+
 # reemplazo y homescholing LAS DOS SI
     @classmethod
     def get(cls, email):
         try:
-            return cls.objects.get(email=email)
+            return cls.objects.get(email__lower=email.lower())
         except ObjectDoesNotExist:
             return None
 
     def __str__(self):
         return self.email
+
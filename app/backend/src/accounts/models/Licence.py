@@ -5,7 +5,9 @@ Permite gestionar licencias con fechas de vencimiento y activaciones.
 
 from django.db import models
 from common.BaseModel import BaseModel
+from common.PrefixIndex import PrefixIndex
 from accounts.models import CustomUserModel
+from accounts.managers.LicenseManager import LicenseManager
 from django.utils import timezone
 
 ROLE_CHOICES = (
@@ -17,6 +19,19 @@ ROLE_CHOICES = (
 class License(BaseModel):
     """Licencias asignadas a usuarios"""
 
+    # Se consulta en cada validación y cambia con poca frecuencia
+    cache_by_id = True
+    # El panel de licencias (common.LicenseDashboard) se invalida con la
+    # versión del modelo
+    cache_version = True
+
+    objects = LicenseManager()
+
+    # Búsqueda por prefijo del admin del historial (LargeTableAdminMixin)
+    history_indexes = [
+        PrefixIndex('license_key', name='histlicense_key_prefix_idx'),
+    ]
+
     id = models.AutoField(
         primary_key=True
     )
@@ -55,15 +70,54 @@ class License(BaseModel):
         related_name='licenses',
         verbose_name='usuario'
     )
+    # Resultado de la última validación masiva (common.BulkLicenseValidator)
+    last_validated_at = models.DateTimeField(
+        'validada el',
+        null=True,
+        blank=True
+    )
+    last_validation_ok = models.BooleanField(
+        'última validación correcta',
+        null=True,
+        blank=True
+    )
+    last_validation_message = models.CharField(
+        'resultado de la validación',
+        max_length=250,
+        blank=True,
+        default=''
+    )
 
-    class Meta:
+    class Meta(BaseModel.Meta):
         verbose_name = 'Licencia'
         verbose_name_plural = 'Licencias'
         ordering = ['-created_at']
+        indexes = BaseModel.Meta.indexes + [
+            # Búsqueda por prefijo del admin (LargeTableAdminMixin)
+            PrefixIndex('license_key', name='license_key_prefix_idx'),
+        ]
 
     def __str__(self):
         return 'Licencia de {}'.format(self.user.email)
 
+    @staticmethod
+    def valid_q(prefix='', now=None):
+        """
+        Condición de licencia vigente: activa, no eliminada y sin expirar.
+
+        Args:
+            prefix: Ruta de la relación, por ejemplo 'licenses__' para
+                    filtrar o anotar desde el usuario
+            now: Fecha de referencia, por defecto la actual
+        """
+        now = now or timezone.now()
+        return models.Q(
+            **{f'{prefix}is_active': True, f'{prefix}is_deleted': False}
+        ) & (
+            models.Q(**{f'{prefix}expires_on__isnull': True}) |
+            models.Q(**{f'{prefix}expires_on__gt': now})
+        )
+
     @property
     def is_expired(self):
         """Verificar si la licencia ha expirado"""
@@ -90,3 +144,4 @@ class License(BaseModel):
         """Desactivar la licencia"""
         self.is_active = False
         self.save()
+
@@ -0,0 +1,48 @@
+"""
+Señales de la aplicación de cuentas.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import License
+from common.EmailBackEndAuth import EmailBackEndAuth
+from common.ModelCache import ModelCache
+from common.SearchIndex import SearchIndex
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Invalida el usuario en la caché de get_user (cambio de contraseña,
+    último login, permisos, etc.)."""
+    EmailBackEndAuth.invalidate_user(instance.pk)
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_save, sender=License)
+def update_search_index(sender, instance, update_fields=None, **kwargs):
+    """Reindexa el registro si se guardaron campos del documento (un
+    login solo guarda last_login y no reindexa)."""
+    if SearchIndex.affects_index(sender, update_fields):
+        SearchIndex.update(sender, [instance.pk])
+
+
+@receiver(post_delete, sender=get_user_model())
+@receiver(post_delete, sender=License)
+def delete_from_search_index(sender, instance, **kwargs):
+    SearchIndex.delete(sender, [instance.pk])
+
+
+@receiver(post_delete, sender=License)
+def invalidate_cached_license(sender, instance, **kwargs):
+    """Invalida la licencia y la versión de License también en los
+    borrados en cascada (al eliminar el usuario), que no pasan por
+    BaseModel ni por BaseQuerySet."""
+    ModelCache.invalidate(sender, [instance.pk])
+
+
+def create_search_index(using='default', **kwargs):
+    """Crea las tablas del índice de búsqueda tras migrate."""
+    SearchIndex.create_tables(using)
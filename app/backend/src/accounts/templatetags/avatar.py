@@ -0,0 +1,49 @@
+"""
+Template tags para mostrar la foto de perfil con la versión adecuada.
+
+Uso:
+{% load avatar %}
+{% avatar user 128 'rounded-full' %}
+<img src="{% avatar_url user 64 %}">
+"""
+
+from django import template
+from django.utils.html import format_html
+
+from common.ImageRenditions import ImageRenditions
+
+register = template.Library()
+
+
+@register.simple_tag
+def avatar_url(user, size=128, image_format='jpeg'):
+    """URL de la versión de la foto de perfil para el tamaño pedido."""
+    return ImageRenditions.url(
+        getattr(user, 'picture', None), int(size), image_format
+    )
+
+
+@register.simple_tag
+def avatar(user, size=128, css_class='', alt='Foto de perfil'):
+    """
+    Etiqueta <picture> con WebP y JPEG de respaldo.
+    Si las versiones aún no existen usa la imagen original.
+    """
+    picture = getattr(user, 'picture', None)
+    if not picture:
+        return ''
+    size = int(size)
+    if not ImageRenditions.is_ready(picture):
+        return format_html(
+            '<img src="{}" alt="{}" class="{}" width="{}" height="{}" '
+            'loading="lazy" />',
+            picture.url, alt, css_class, size, size
+        )
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}" />'
+        '<img src="{}" alt="{}" class="{}" width="{}" height="{}" '
+        'loading="lazy" /></picture>',
+        ImageRenditions.rendition_url(picture, size, 'webp'),
+        ImageRenditions.rendition_url(picture, size, 'jpeg'),
+        alt, css_class, size, size
+    )
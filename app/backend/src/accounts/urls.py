@@ -4,6 +4,7 @@ from .views.LoguoutRedView import LogoutRedView
 from .views.ProfileTempView import ProfileTempView
 from .views.ProfileUpdtView import ProfileUpdtView
 from .views.ChangePassUpdtView import ChangePassUpdtView
+from .views.SearchTypeaheadView import SearchTypeaheadView
 
 
 app_name = 'accounts'
@@ -13,5 +14,7 @@ urlpatterns = [
     path('logout/', LogoutRedView.as_view(), name='logout'),
     path('profile/', ProfileTempView.as_view(), name='profile'),
     path('profile/edit/', ProfileUpdtView.as_view(), name='profile_edit'),
-    path('profile/change-password/', ChangePassUpdtView.as_view(),name='change_password')
+    path('profile/change-password/', ChangePassUpdtView.as_view(),name='change_password'),
+    path('search/typeahead/', SearchTypeaheadView.as_view(),
+         name='search_typeahead'),
 ]
@@ -1,8 +1,14 @@
-import json
+import hashlib
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import View
 from django.http import JsonResponse
 from django.contrib.auth import update_session_auth_hash
+from django.template.loader import get_template, render_to_string
+from django.utils.cache import (
+    get_conditional_response, patch_cache_control, patch_vary_headers
+)
+from django.utils.crypto import salted_hmac
+from django.utils.http import quote_etag
 from django.views.decorators.csrf import csrf_protect
 from django.utils.decorators import method_decorator
 from django.middleware.csrf import get_token
@@ -14,6 +20,10 @@ from common.LoggerApp import log_info, log_warning, log_error
 class ChangePassUpdtView(LoginRequiredMixin, View):
     """Vista para cambio de contraseña por AJAX"""
     login_url = 'accounts:login'
+    template_name = 'forms/change_password.html'
+    # Segundos del fragmento en la caché; la clave incluye la versión
+    fragment_timeout = 86400
+    _form_version = None
 
     def post(self, request, *args, **kwargs):
         """Procesa el cambio de contraseña"""
@@ -89,81 +99,72 @@ class ChangePassUpdtView(LoginRequiredMixin, View):
             })
 
     def get(self, request, *args, **kwargs):
-        """Devuelve el formulario vacío para el modal"""
+        """
+        Devuelve el formulario vacío para el modal.
+
+        El ETag depende de la versión del formulario y del secreto CSRF
+        del usuario (no del token enmascarado, que cambia en cada
+        petición), por lo que al volver a abrir el modal el navegador
+        recibe 304 y reutiliza la respuesta anterior, cuyo token sigue
+        siendo válido mientras no cambie el secreto.
+        """
         log_info(
             user=request.user,
             url=request.path,
             file_name="ChangePassUpdtView",
-            message=(
+            message=lambda: (
                 f"Solicitud de formulario de cambio de contraseña "
                 f"para: {request.user.email}"
             ),
             request=request
         )
-        
-        form = ChangePasswordForm(user=request.user)
-
-        # Renderizar el formulario como HTML para AJAX
-        form_html = self._render_form_html(form)
 
-        return JsonResponse({
-            'success': True,
-            'form_html': form_html
-        })
-
-    def _render_form_html(self, form):
-        """Genera el HTML del formulario"""
-        csrf_token = get_token(self.request)
-
-        html = f"""
-        <form id="changePasswordForm" method="post">
-            <input type="hidden" name="csrfmiddlewaretoken" value="{csrf_token}">
-            
-            <!-- Contraseña actual -->
-            <div class="form-control mb-4">
-                <label for="id_old_password" class="label">
-                    <span class="label-text font-medium">{form.fields['old_password'].label}</span>
-                </label>
-                {form['old_password']}
-                <div id="old_password_errors" class="label hidden">
-                    <span class="label-text-alt text-error"></span>
-                </div>
-            </div>
-
-            <!-- Nueva contraseña -->
-            <div class="form-control mb-4">
-                <label for="id_new_password1" class="label">
-                    <span class="label-text font-medium">{form.fields['new_password1'].label}</span>
-                </label>
-                {form['new_password1']}
-                <div class="label">
-                    <span class="label-text-alt">{form.fields['new_password1'].help_text or ''}</span>
-                </div>
-                <div id="new_password1_errors" class="label hidden">
-                    <span class="label-text-alt text-error"></span>
-                </div>
-            </div>
-
-            <!-- Confirmar nueva contraseña -->
-            <div class="form-control mb-6">
-                <label for="id_new_password2" class="label">
-                    <span class="label-text font-medium">{form.fields['new_password2'].label}</span>
-                </label>
-                {form['new_password2']}
-                <div id="new_password2_errors" class="label hidden">
-                    <span class="label-text-alt text-error"></span>
-                </div>
-            </div>
-
-            <!-- Botones -->
-            <div class="modal-action">
-                <button type="button" class="btn btn-ghost" onclick="closeChangePasswordModal()">
-                    <i class="las la-times"></i> Cancelar
-                </button>
-                <button type="submit" class="btn btn-primary">
-                    <i class="las la-key"></i> Cambiar Contraseña
-                </button>
-            </div>
-        </form>
+        etag = self._get_etag()
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = JsonResponse({
+                'success': True,
+                'form_html': self._render_form_html()
+            })
+        response['ETag'] = etag
+        # Se revalida siempre; solo el navegador del usuario la guarda
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ('Cookie',))
+        return response
+
+    @classmethod
+    def get_form_version(cls):
+        """
+        Huella del formulario: cambia si cambia la plantilla o los
+        campos (etiquetas, ayudas y atributos). Se calcula una vez por
+        proceso.
         """
-        return html
+        if cls._form_version is None:
+            form = ChangePasswordForm(user=None)
+            parts = [get_template(cls.template_name).template.source]
+            for name, field in form.fields.items():
+                parts.append(repr((
+                    name, field.label, field.help_text,
+                    sorted(field.widget.attrs.items())
+                )))
+            cls._form_version = hashlib.md5(
+                '\n'.join(parts).encode()
+            ).hexdigest()[:12]
+        return cls._form_version
+
+    def _get_etag(self):
+        get_token(self.request)
+        secret = self.request.META['CSRF_COOKIE']
+        digest = salted_hmac(
+            'accounts.ChangePassUpdtView', secret
+        ).hexdigest()[:16]
+        return quote_etag(f'{self.get_form_version()}-{digest}')
+
+    def _render_form_html(self):
+        """Renderiza el formulario; el fragmento estático sale de la
+        caché y solo se inserta el token CSRF de la petición."""
+        return render_to_string(self.template_name, {
+            'form': ChangePasswordForm(user=self.request.user),
+            'form_version': self.get_form_version(),
+            'fragment_timeout': self.fragment_timeout,
+        }, request=self.request)
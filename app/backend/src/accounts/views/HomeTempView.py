@@ -11,7 +11,9 @@ class HomeTempView(LoginRequiredMixin, TemplateView):
             user=self.request.user,
             url=self.request.path,
             file_name="HomeTempView",
-            message=f"Acceso a página principal por: {self.request.user.email}",
+            message=lambda: (
+                f"Acceso a página principal por: {self.request.user.email}"
+            ),
             request=self.request
         )
         
@@ -5,6 +5,7 @@ from django.utils import timezone
 import requests
 from accounts.models import License
 from common.LoggerApp import log_info, log_warning, log_error
+from common.LoginThrottle import LoginThrottle
 
 
 class LoginTempView(LoginView):
@@ -14,6 +15,27 @@ class LoginTempView(LoginView):
     def get_success_url(self):
         return self.get_redirect_url() or reverse_lazy('home')
 
+    def post(self, request, *args, **kwargs):
+        """
+        Rechaza los intentos que exceden LOGIN_THROTTLE antes de calcular
+        el hash de la contraseña y de validar licencias.
+        """
+        self.throttle = LoginThrottle(request, request.POST.get('username'))
+        retry_after = self.throttle.hit()
+        if retry_after:
+            messages.error(
+                request,
+                'Demasiados intentos de inicio de sesión. '
+                'Intente de nuevo en unos minutos.'
+            )
+            response = self.render_to_response(
+                self.get_context_data(form=self.form_class(request)),
+                status=429
+            )
+            response['Retry-After'] = str(retry_after)
+            return response
+        return super().post(request, *args, **kwargs)
+
     def validate_license_with_external_service(self, license_obj):
         """
         Valida la licencia contra el servicio externo.
@@ -130,10 +152,17 @@ class LoginTempView(LoginView):
             bool: True si tiene al menos una licencia válida,
                   False en caso contrario
         """
-        # Obtener licencias activas y no expiradas del usuario
-        active_licenses = License.objects.filter(user=user)
+        # IDs de las licencias activas del usuario (índice de user_id); cada
+        # licencia se lee con get_by_id desde la caché compartida
+        license_ids = License.objects.alive().filter(
+            user=user
+        ).values_list('pk', flat=True)
+        active_licenses = [
+            license_obj for license_obj in map(License.get_by_id, license_ids)
+            if license_obj
+        ]
 
-        if not active_licenses.exists():
+        if not active_licenses:
             log_warning(
                 user=user,
                 url=getattr(self.request, 'path', 'N/A'),
@@ -214,6 +243,7 @@ class LoginTempView(LoginView):
         # Si las licencias son válidas, proceder con el login normal
         remember = self.request.POST.get('remember')
         response = super().form_valid(form)
+        self.throttle.reset_email()
 
         if remember:
             self.request.session.set_expiry(1209600)  # 14 días
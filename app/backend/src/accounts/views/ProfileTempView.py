@@ -12,7 +12,9 @@ class ProfileTempView(LoginRequiredMixin, TemplateView):
             user=self.request.user,
             url=self.request.path,
             file_name="ProfileTempView",
-            message=f"Acceso a perfil por usuario: {self.request.user.email}",
+            message=lambda: (
+                f"Acceso a perfil por usuario: {self.request.user.email}"
+            ),
             request=self.request
         )
         
@@ -26,7 +26,7 @@ class ProfileUpdtView(LoginRequiredMixin, UpdateView):
             user=self.request.user,
             url=self.request.path,
             file_name="ProfileUpdtView",
-            message=(
+            message=lambda: (
                 f"Acceso a formulario de edición de perfil "
                 f"por: {self.request.user.email}"
             ),
@@ -0,0 +1,71 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.http import JsonResponse
+from django.urls import reverse
+from django.views import View
+from accounts.models import License
+from common.SearchIndex import SearchIndex
+
+
+class SearchTypeaheadView(LoginRequiredMixin, UserPassesTestMixin, View):
+    """Autocompletado de licencias y usuarios para el personal (JSON).
+
+    Parámetros GET:
+    - q: Texto buscado (prefijos de palabras)
+    - type: license (por defecto) o user
+
+    Respuesta:
+    {"results": [{"id": 1, "label": "...", "url": "/admin/..."}]}
+    """
+    login_url = 'accounts:login'
+    raise_exception = True
+
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def get(self, request, *args, **kwargs):
+        term = request.GET.get('q', '').strip()
+        search_type = request.GET.get('type', 'license')
+        if search_type not in ('license', 'user'):
+            return JsonResponse({'error': 'Tipo no soportado'}, status=400)
+
+        results = []
+        if len(term) >= 2:
+            limit = SearchIndex.get_config()['TYPEAHEAD_LIMIT']
+            if search_type == 'license':
+                results = self._licenses(term, limit)
+            else:
+                results = self._users(term, limit)
+
+        response = JsonResponse({'results': results})
+        response['Cache-Control'] = 'private, max-age=30'
+        return response
+
+    def _licenses(self, term, limit):
+        ids = SearchIndex.search(License, term, limit) or []
+        licenses = License.objects.select_related('user').in_bulk(ids)
+        return [
+            {
+                'id': pk,
+                'label': f'{licenses[pk].license_key} - '
+                         f'{licenses[pk].user.email}',
+                'url': reverse('admin:accounts_license_change', args=[pk]),
+            }
+            for pk in ids if pk in licenses
+        ]
+
+    def _users(self, term, limit):
+        user_model = get_user_model()
+        ids = SearchIndex.search(user_model, term, limit) or []
+        users = user_model.objects.in_bulk(ids)
+        return [
+            {
+                'id': pk,
+                'label': users[pk].get_full_name() or users[pk].email,
+                'email': users[pk].email,
+                'url': reverse(
+                    'admin:accounts_customusermodel_change', args=[pk]
+                ),
+            }
+            for pk in ids if pk in users
+        ]
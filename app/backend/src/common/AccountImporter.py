@@ -0,0 +1,416 @@
+"""
+Importación masiva de usuarios y licencias desde CSV o XLSX.
+Lee el archivo en streaming, valida por lotes, calcula los hashes de
+contraseña en un pool de procesos e inserta con bulk_create (upsert).
+"""
+
+import csv
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+
+from openpyxl import load_workbook
+
+from accounts.models import License
+from common.BaseManager import get_current_user_pk
+from common.EmailBackEndAuth import EmailBackEndAuth
+from common.ModelCache import ModelCache
+from common.SearchIndex import SearchIndex
+
+
+class ImportResult:
+    """Resumen de una importación."""
+
+    def __init__(self):
+        self.rows = 0
+        self.users_created = 0
+        self.users_updated = 0
+        self.licenses_created = 0
+        self.licenses_updated = 0
+        self.errors = []
+
+    def add_error(self, row_number, message):
+        self.errors.append((row_number, message))
+
+    def __str__(self):
+        return (
+            f'{self.rows} filas - Usuarios: {self.users_created} creados, '
+            f'{self.users_updated} actualizados - Licencias: '
+            f'{self.licenses_created} creadas, {self.licenses_updated} '
+            f'actualizadas - Errores: {len(self.errors)}'
+        )
+
+
+class AccountImporter:
+    """
+    Clase para importar usuarios y sus licencias de forma masiva.
+
+    Cada fila describe un usuario (upsert por email) y, opcionalmente,
+    una licencia del usuario (upsert por license_key). Una celda vacía
+    asigna el valor por defecto del campo; las columnas ausentes no se
+    modifican en los registros existentes. Sin password se conserva la
+    contraseña actual o, si el usuario es nuevo, queda inutilizable.
+
+    Columnas:
+        Usuario: email, password, first_name, last_name, profile_type,
+                 is_active
+        Licencia: license_key, enterprise, activated_on, expires_on,
+                  url_server, license_active
+
+    Uso:
+    result = AccountImporter('usuarios.xlsx', workers=4).run()
+    """
+
+    USER_COLUMNS = {
+        'email': 'email',
+        'first_name': 'first_name',
+        'last_name': 'last_name',
+        'profile_type': 'profile_type',
+        'is_active': 'is_active',
+    }
+    LICENSE_COLUMNS = {
+        'license_key': 'license_key',
+        'enterprise': 'enterprise',
+        'activated_on': 'activated_on',
+        'expires_on': 'expires_on',
+        'url_server': 'url_server',
+        'license_active': 'is_active',
+    }
+    CHANGE_REASON = 'Importación masiva'
+
+    def __init__(self, path, batch_size=None, workers=None, dry_run=False):
+        """
+        Args:
+            path: Archivo .csv o .xlsx con encabezado en la primera fila
+            batch_size: Filas por lote, por defecto IMPORT_BATCH_SIZE
+            workers: Procesos para los hashes, 0 calcula en este proceso
+            dry_run: Solo valida, no escribe en la base de datos
+        """
+        self.path = Path(path)
+        if self.path.suffix.lower() not in ('.csv', '.xlsx'):
+            raise ValueError('Formato no soportado, use .csv o .xlsx')
+
+        self.batch_size = batch_size or getattr(
+            settings, 'IMPORT_BATCH_SIZE', 1000
+        )
+        self.workers = workers
+        self.dry_run = dry_run
+        self.user_model = get_user_model()
+        self.result = ImportResult()
+        self.columns = []
+        self._executor = None
+
+    def run(self):
+        """
+        Ejecuta la importación completa.
+
+        Returns:
+            ImportResult
+        """
+        if self.workers != 0 and not self.dry_run:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            batch = []
+            for row_number, row in self.read_rows():
+                self.result.rows += 1
+                batch.append((row_number, row))
+                if len(batch) >= self.batch_size:
+                    self.process_batch(batch)
+                    batch = []
+            if batch:
+                self.process_batch(batch)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+        return self.result
+
+    def read_rows(self):
+        """Genera (número de fila, diccionario) sin cargar todo el archivo."""
+        if self.path.suffix.lower() == '.csv':
+            with open(self.path, newline='', encoding='utf-8-sig') as file:
+                reader = csv.reader(file)
+                yield from self._rows_from(reader)
+        else:
+            workbook = load_workbook(self.path, read_only=True)
+            try:
+                yield from self._rows_from(
+                    workbook.active.iter_rows(values_only=True)
+                )
+            finally:
+                workbook.close()
+
+    def _rows_from(self, reader):
+        header = next(reader, None)
+        if not header:
+            return
+        self.columns = [
+            str(name).strip().lower() if name is not None else ''
+            for name in header
+        ]
+        if 'email' not in self.columns:
+            raise ValueError('El archivo debe tener la columna email')
+
+        for row_number, values in enumerate(reader, start=2):
+            if not any(value not in (None, '') for value in values):
+                continue
+            yield row_number, dict(zip(self.columns, values))
+
+    def process_batch(self, batch):
+        """Valida un lote y lo guarda en una transacción."""
+        valid = self.validate_batch(batch)
+        if not valid or self.dry_run:
+            return
+
+        try:
+            with transaction.atomic():
+                counts = self.write_batch(valid)
+        except DatabaseError:
+            # Se aísla la fila que falla guardando una por una
+            for item in valid:
+                try:
+                    with transaction.atomic():
+                        counts = self.write_batch([item])
+                except DatabaseError as error:
+                    self.result.add_error(item['row_number'], str(error))
+                else:
+                    self._add_counts(counts)
+        else:
+            self._add_counts(counts)
+
+    def _add_counts(self, counts):
+        for name, value in counts.items():
+            setattr(self.result, name, getattr(self.result, name) + value)
+
+    def validate_batch(self, batch):
+        """
+        Valida y convierte los valores de cada fila.
+
+        Returns:
+            list: Filas válidas con los valores limpios
+        """
+        valid = []
+        seen_keys = {}
+        for row_number, row in batch:
+            try:
+                user_values = self._clean(
+                    self.user_model, self.USER_COLUMNS, row
+                )
+                user_values['email'] = self.user_model.objects.\
+                    normalize_email(user_values['email'])
+                license_values = None
+                if row.get('license_key') not in (None, ''):
+                    license_values = self._clean(
+                        License, self.LICENSE_COLUMNS, row
+                    )
+            except ValidationError as error:
+                self.result.add_error(row_number, self._message(error))
+                continue
+
+            email = user_values['email']
+            if not email:
+                self.result.add_error(row_number, 'email: obligatorio')
+                continue
+            if license_values is not None:
+                key = license_values['license_key']
+                if key in seen_keys:
+                    # Como entre lotes, prevalece la última fila
+                    valid[seen_keys[key]]['license'] = None
+                seen_keys[key] = len(valid)
+
+            password = row.get('password')
+            valid.append({
+                'row_number': row_number,
+                'user': user_values,
+                'password': str(password) if password not in (None, '')
+                else None,
+                'license': license_values,
+            })
+        return valid
+
+    def _clean(self, model, columns, row):
+        """Limpia las columnas presentes con las validaciones del campo."""
+        values = {}
+        errors = {}
+        for column, field_name in columns.items():
+            if column not in self.columns:
+                continue
+            field = model._meta.get_field(field_name)
+            raw = row.get(column)
+            if raw in (None, ''):
+                values[field_name] = field.get_default()
+                continue
+            if isinstance(raw, str):
+                raw = raw.strip()
+            try:
+                values[field_name] = field.clean(raw, None)
+            except ValidationError as error:
+                errors[column] = error.messages
+        if errors:
+            raise ValidationError(errors)
+        return values
+
+    @staticmethod
+    def _message(error):
+        if hasattr(error, 'message_dict'):
+            return '; '.join(
+                f"{field}: {' '.join(messages)}"
+                for field, messages in error.message_dict.items()
+            )
+        return ' '.join(error.messages)
+
+    def hash_passwords(self, passwords):
+        """Calcula los hashes en el pool de procesos."""
+        if not passwords:
+            return []
+        if self._executor is None:
+            return [make_password(password) for password in passwords]
+        workers = self._executor._max_workers
+        chunksize = max(1, len(passwords) // (workers * 4))
+        return list(
+            self._executor.map(make_password, passwords, chunksize=chunksize)
+        )
+
+    def write_batch(self, items):
+        """
+        Guarda usuarios y licencias de un lote con bulk_create.
+
+        Returns:
+            dict: Registros creados y actualizados del lote
+        """
+        users, counts = self._write_users(items)
+        counts.update(self._write_licenses(items, users))
+        return counts
+
+    def _write_users(self, items):
+        """
+        Upsert de usuarios por email sin distinguir mayúsculas. Si el
+        email se repite en el lote prevalecen los valores de la última fila.
+
+        Returns:
+            tuple: (email en minúsculas -> pk, contadores)
+        """
+        emails = {item['user']['email'].lower() for item in items}
+        existing = {
+            email.lower(): (email, password)
+            for email, password in self.user_model.objects.filter(
+                email__lower__in=emails
+            ).values_list('email', 'password')
+        }
+
+        to_hash = [
+            item for item in items
+            if item['password'] and 'password_hash' not in item
+        ]
+        hashes = self.hash_passwords([item['password'] for item in to_hash])
+        for item, password_hash in zip(to_hash, hashes):
+            item['password_hash'] = password_hash
+
+        users = {}
+        for item in items:
+            key = item['user']['email'].lower()
+            values = dict(item['user'])
+            password_hash = item.get('password_hash')
+            if key in existing:
+                # Se conserva el email guardado para que coincida el upsert
+                values['email'], current_hash = existing[key]
+                password_hash = password_hash or current_hash
+            if password_hash is None:
+                password_hash = make_password(None)
+            users[key] = self.user_model(**values, password=password_hash)
+
+        update_fields = [
+            field for column, field in self.USER_COLUMNS.items()
+            if column in self.columns and field != 'email'
+        ] + ['password']
+        self.user_model.objects.bulk_create(
+            users.values(),
+            batch_size=self.batch_size,
+            update_conflicts=True,
+            unique_fields=['email'],
+            update_fields=update_fields,
+        )
+
+        created = len(users.keys() - existing.keys())
+        pks = {
+            email.lower(): pk
+            for email, pk in self.user_model.objects.filter(
+                email__lower__in=emails
+            ).values_list('email', 'pk')
+        }
+        # bulk_create no envía post_save, se invalida la caché de get_user
+        for key in existing:
+            EmailBackEndAuth.invalidate_user(pks[key])
+        # y se reindexan los usuarios (y sus licencias) en bloque
+        SearchIndex.update(self.user_model, pks.values())
+        return pks, {
+            'users_created': created,
+            'users_updated': len(users) - created,
+        }
+
+    def _write_licenses(self, items, users):
+        """
+        Upsert de licencias por license_key y su historial en bloque.
+
+        Returns:
+            dict: Contadores de licencias
+        """
+        licenses = [
+            dict(
+                item['license'], user_id=users[item['user']['email'].lower()]
+            )
+            for item in items if item['license'] is not None
+        ]
+        if not licenses:
+            return {}
+
+        keys = [values['license_key'] for values in licenses]
+        existing = set(
+            License.objects.filter(license_key__in=keys).values_list(
+                'license_key', flat=True
+            )
+        )
+        user_pk = get_current_user_pk() or 0
+        now = timezone.now()
+        objs = [
+            License(
+                **values, id_user_created=user_pk, id_user_updated=user_pk,
+                created_at=now, updated_at=now
+            )
+            for values in licenses
+        ]
+        update_fields = [
+            field for column, field in self.LICENSE_COLUMNS.items()
+            if column in self.columns and field != 'license_key'
+        ] + ['user', 'updated_at', 'id_user_updated']
+        License.objects.bulk_create(
+            objs,
+            batch_size=self.batch_size,
+            update_conflicts=True,
+            unique_fields=['license_key'],
+            update_fields=update_fields,
+        )
+
+        saved = list(License.objects.filter(license_key__in=keys))
+        ModelCache.invalidate(License, [obj.pk for obj in saved])
+        SearchIndex.update(License, [obj.pk for obj in saved])
+        created = [obj for obj in saved if obj.license_key not in existing]
+        updated = [obj for obj in saved if obj.license_key in existing]
+        for objs, is_update in ((created, False), (updated, True)):
+            if objs:
+                License.history.bulk_history_create(
+                    objs,
+                    batch_size=self.batch_size,
+                    update=is_update,
+                    default_change_reason=self.CHANGE_REASON,
+                    default_date=now,
+                )
+        return {
+            'licenses_created': len(created),
+            'licenses_updated': len(updated),
+        }
@@ -0,0 +1,91 @@
+"""
+Mapa de identidad de usuarios de auditoría (creador / actualizador).
+Resuelve los usuarios de BaseModel en una sola consulta IN y los reutiliza
+durante la petición actual.
+"""
+
+from django.contrib.auth import get_user_model
+
+# django-crum
+from crum import get_current_request
+
+
+class AuditUserMap:
+    """
+    Clase para resolver usuarios de auditoría por ID.
+
+    Dentro de una petición los usuarios se guardan en un mapa de identidad
+    asociado al request (django-crum), por lo que cada ID se consulta una
+    sola vez por petición. Fuera de una petición no se guarda nada.
+    """
+
+    REQUEST_ATTRIBUTE = '_audit_user_map'
+
+    @classmethod
+    def _get_identity_map(cls):
+        """Obtiene el mapa de identidad de la petición actual."""
+        request = get_current_request()
+        if request is None:
+            return {}
+        identity_map = getattr(request, cls.REQUEST_ATTRIBUTE, None)
+        if identity_map is None:
+            identity_map = {}
+            setattr(request, cls.REQUEST_ATTRIBUTE, identity_map)
+        return identity_map
+
+    @classmethod
+    def get_users(cls, user_ids):
+        """
+        Obtiene los usuarios de una lista de IDs.
+
+        Args:
+            user_ids: IDs de usuario (se ignoran 0 y None)
+
+        Returns:
+            dict: ID -> usuario o None si no existe
+        """
+        identity_map = cls._get_identity_map()
+        wanted = {user_id for user_id in user_ids if user_id}
+        missing = wanted - identity_map.keys()
+
+        if missing:
+            found = get_user_model().objects.in_bulk(missing)
+            for user_id in missing:
+                identity_map[user_id] = found.get(user_id)
+
+        return {user_id: identity_map[user_id] for user_id in wanted}
+
+    @classmethod
+    def get_user(cls, user_id):
+        """
+        Obtiene un usuario por ID.
+
+        Returns:
+            Usuario o None si no existe
+        """
+        if not user_id:
+            return None
+        return cls.get_users([user_id])[user_id]
+
+    @classmethod
+    def attach(cls, instances):
+        """
+        Asigna a cada instancia sus usuarios creador y actualizador.
+        Ejecuta como máximo una consulta para todas las instancias.
+
+        Args:
+            instances: Instancias de modelos que heredan de BaseModel
+        """
+        instances = [
+            instance for instance in instances
+            if hasattr(instance, 'id_user_created')
+        ]
+        users = cls.get_users(
+            [instance.id_user_created for instance in instances] +
+            [instance.id_user_updated for instance in instances]
+        )
+        for instance in instances:
+            instance._audit_users = {
+                'created': users.get(instance.id_user_created),
+                'updated': users.get(instance.id_user_updated),
+            }
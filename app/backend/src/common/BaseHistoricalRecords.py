@@ -0,0 +1,26 @@
+"""
+HistoricalRecords de BaseModel con índices propios por modelo.
+"""
+
+from simple_history.models import HistoricalRecords
+
+
+class BaseHistoricalRecords(HistoricalRecords):
+    """
+    Añade a la Meta del modelo del historial los índices declarados en
+    history_indexes del modelo; simple_history crea esa Meta sin heredar
+    la del modelo.
+
+    Uso:
+    class License(BaseModel):
+        history_indexes = [PrefixIndex('license_key', name='...')]
+    """
+
+    def get_meta_options(self, model):
+        options = super().get_meta_options(model)
+        indexes = getattr(model, 'history_indexes', ())
+        if indexes:
+            options['indexes'] = list(options.get('indexes', ())) + [
+                index.clone() for index in indexes
+            ]
+        return options
@@ -0,0 +1,242 @@
+"""
+QuerySet y Managers para los modelos que heredan de BaseModel.
+Permiten encadenar los filtros de soft delete y estado del registro.
+"""
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+
+# django-crum
+from crum import get_current_user
+
+from common.AuditUserMap import AuditUserMap
+from common.KeysetPaginator import KeysetPaginator
+from common.ModelCache import ModelCache
+from common.SearchIndex import SearchIndex
+
+
+def get_current_user_pk():
+    """
+    Obtiene el ID del usuario de la petición actual (django-crum).
+
+    Returns:
+        int o None si no hay usuario autenticado
+    """
+    user = get_current_user()
+    if user is None or not getattr(user, 'is_authenticated', False):
+        return None
+    return user.pk
+
+
+class BaseQuerySet(models.QuerySet):
+    """
+    QuerySet con filtros encadenables para el estado de los registros.
+
+    Uso:
+    License.objects.alive().filter(user=user)
+    License.objects.deleted().order_by('-updated_at')
+    License.objects.filter(expires_on__lt=hoy).soft_delete()
+    License.objects.alive().with_audit_users()
+    License.objects.alive().keyset_page(cursor, per_page=50)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._with_audit_users = False
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._with_audit_users = self._with_audit_users
+        return clone
+
+    def _fetch_all(self):
+        resolve_users = self._result_cache is None and self._with_audit_users
+        super()._fetch_all()
+        is_model_query = self._iterable_class is models.query.ModelIterable
+        if resolve_users and is_model_query:
+            AuditUserMap.attach(self._result_cache)
+
+    def update(self, **kwargs):
+        '''Actualiza los registros e invalida su caché por ID.
+
+        Si el modelo usa la caché por ID o cambian campos del índice de
+        búsqueda se leen antes los IDs afectados (update no envía
+        post_save) para invalidar y reindexar solo esos registros.
+        '''
+        reindex = SearchIndex.affects_index(self.model, kwargs)
+        pks = None
+        if reindex or ModelCache.is_enabled(self.model):
+            pks = list(self.values_list('pk', flat=True))
+        updated = super().update(**kwargs)
+        if updated:
+            ModelCache.invalidate(self.model, pks)
+            if reindex and pks:
+                SearchIndex.update(self.model, pks)
+        return updated
+
+    def delete(self):
+        '''Elimina los registros e invalida su caché por ID.'''
+        pks = []
+        if ModelCache.is_enabled(self.model):
+            pks = list(self.values_list('pk', flat=True))
+        result = super().delete()
+        ModelCache.invalidate(self.model, pks)
+        return result
+
+    def with_audit_users(self):
+        '''Resuelve los usuarios creador y actualizador en una consulta.
+
+        Al evaluar el QuerySet se consultan los usuarios de todos los
+        registros con un único IN; get_create_user() y get_update_user()
+        usan estos usuarios sin consultas adicionales.
+        '''
+        clone = self._chain()
+        clone._with_audit_users = True
+        return clone
+
+    def keyset_page(self, cursor=None, per_page=25, ordering=None):
+        '''Obtiene una página por keyset en lugar de OFFSET.
+
+        Args:
+            cursor: Cursor opaco de la página (next_cursor /
+                    previous_cursor) o None para la primera
+            per_page: Registros por página
+            ordering: Ordenamiento único, por defecto (-created_at, -pk)
+
+        Returns:
+            KeysetPage con object_list, next_cursor y previous_cursor
+        '''
+        return KeysetPaginator(
+            self, per_page=per_page, ordering=ordering
+        ).page(cursor)
+
+    def alive(self):
+        '''Registros activos y no eliminados.'''
+        return self.filter(is_active=True, is_deleted=False)
+
+    def deleted(self):
+        '''Registros marcados como eliminados.'''
+        return self.filter(is_deleted=True)
+
+    def inactive(self):
+        '''Registros marcados como inactivos.'''
+        return self.filter(is_active=False)
+
+    def soft_delete(self, chunk_size=None):
+        '''Marca los registros como eliminados de forma masiva.
+
+        Returns:
+            int: Cantidad de registros actualizados
+        '''
+        return self._bulk_set_state(
+            {'is_deleted': True}, 'Eliminación masiva', chunk_size
+        )
+
+    def recover(self, chunk_size=None):
+        '''Marca los registros como no eliminados de forma masiva.
+
+        Returns:
+            int: Cantidad de registros actualizados
+        '''
+        return self._bulk_set_state(
+            {'is_deleted': False}, 'Recuperación masiva', chunk_size
+        )
+
+    def disable(self, chunk_size=None):
+        '''Marca los registros como inactivos de forma masiva.
+
+        Returns:
+            int: Cantidad de registros actualizados
+        '''
+        return self._bulk_set_state(
+            {'is_active': False}, 'Desactivación masiva', chunk_size
+        )
+
+    def enable(self, chunk_size=None):
+        '''Marca los registros como activos de forma masiva.
+
+        Returns:
+            int: Cantidad de registros actualizados
+        '''
+        return self._bulk_set_state(
+            {'is_active': True}, 'Activación masiva', chunk_size
+        )
+
+    def _bulk_set_state(self, state, change_reason, chunk_size=None):
+        '''Actualiza el estado por bloques con un UPDATE por bloque.
+
+        Cada bloque ejecuta un UPDATE, lee las filas actualizadas y crea
+        sus registros históricos con un único bulk_create. Solo se procesan
+        los registros cuyo estado cambia, por lo que el bucle avanza solo.
+
+        Args:
+            state: Diccionario con los campos de estado a asignar
+            change_reason: Motivo guardado en el historial
+            chunk_size: Tamaño del bloque, por defecto
+                        BASEMODEL_BULK_CHUNK_SIZE
+
+        Returns:
+            int: Cantidad de registros actualizados
+        '''
+        if chunk_size is None:
+            chunk_size = getattr(settings, 'BASEMODEL_BULK_CHUNK_SIZE', 1000)
+
+        user = get_current_user()
+        user_pk = get_current_user_pk()
+        history = getattr(self.model, 'history', None)
+        manager = self.model._base_manager.using(self.db)
+        pending = self.exclude(**state).order_by('pk').values_list(
+            'pk', flat=True
+        )
+
+        total = 0
+        while True:
+            chunk = list(pending[:chunk_size])
+            if not chunk:
+                break
+
+            now = timezone.now()
+            values = dict(state, updated_at=now)
+            if user_pk is not None:
+                values['id_user_updated'] = user_pk
+
+            with transaction.atomic(using=self.db):
+                updated = manager.filter(pk__in=chunk).update(**values)
+                if updated:
+                    ModelCache.invalidate(self.model, chunk)
+                if history is not None:
+                    history.bulk_history_create(
+                        list(manager.filter(pk__in=chunk)),
+                        batch_size=chunk_size,
+                        update=True,
+                        default_user=user if user_pk is not None else None,
+                        default_change_reason=change_reason,
+                        default_date=now,
+                    )
+
+            total += updated
+            if updated == 0:
+                break
+
+        return total
+
+    # No se exponen en el Manager para evitar License.objects.disable()
+    soft_delete.queryset_only = True
+    recover.queryset_only = True
+    disable.queryset_only = True
+    enable.queryset_only = True
+
+
+class BaseManager(models.Manager.from_queryset(BaseQuerySet)):
+    """Manager por defecto de BaseModel, incluye todos los registros."""
+
+
+class AliveManager(BaseManager):
+    """
+    Manager que solo devuelve registros activos y no eliminados.
+    Útil para relaciones: user.licenses(manager='alive_objects').all()
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().alive()
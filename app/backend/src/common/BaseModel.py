@@ -10,23 +10,34 @@
         is_active (Boolean): Estado del registro.
         is_deleted (Boolean): Estado de eliminación del registro.
 
+    Managers:
+        objects (BaseManager): Todos los registros, con filtros encadenables
+                               alive(), deleted() e inactive() y operaciones
+                               masivas soft_delete(), recover(), disable()
+                               y enable() sobre el QuerySet, y paginación
+                               por keyset con keyset_page().
+        alive_objects (AliveManager): Solo registros activos y no eliminados.
+
     Methods:
         save: Guarda el registro en la base de datos, 
               incluye el usuario creador y actualizador.
-        get_user: Obtiene el usuario creador o actualizador del registro.
+        get_create_user / get_update_user: Obtiene el usuario creador o
+              actualizador del registro (ver with_audit_users()).
+        get_by_id: Obtiene un registro activo por ID, con caché opcional
+              (cache_by_id = True).
 
 """
 
 
+from django.core import checks
 from django.db import models
-from simple_history.models import HistoricalRecords
 from django.core.exceptions import ObjectDoesNotExist
 
-# django-crum
-from crum import get_current_user
-
-# Modelo de usuario Peronalizado
-from accounts.models.CustomUserModel import CustomUserModel
+from common.AuditUserMap import AuditUserMap
+from common.BaseHistoricalRecords import BaseHistoricalRecords
+from common.BaseManager import BaseManager, AliveManager
+from common.BaseManager import get_current_user_pk
+from common.ModelCache import ModelCache
 
 
 class BaseModel(models.Model):
@@ -75,46 +86,167 @@ class BaseModel(models.Model):
         help_text='Identificador del usuario actualizador del registro.'
     )
 
-    history = HistoricalRecords(inherit=True)
+    history = BaseHistoricalRecords(inherit=True)
 
-    def save(self, *args, **kwargs):
-        user = get_current_user()
+    # Índices del modelo del historial (ver common.BaseHistoricalRecords)
+    history_indexes = ()
+
+    objects = BaseManager()
+    alive_objects = AliveManager()
 
-        if user is None:
-            return super().save(*args, **kwargs)
+    # Caché de get_by_id, se activa por modelo (ver common.ModelCache)
+    cache_by_id = False
+    # Versión de los datos para cachés de agregados, independiente de
+    # cache_by_id (ver common.ModelCache.get_version)
+    cache_version = False
 
-        if not self.pk:
-            self.id_user_created = user.pk
+    # Campos de auditoría que se escriben en toda actualización parcial
+    AUDIT_UPDATE_FIELDS = ('updated_at', 'id_user_updated')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        '''Guarda los valores cargados para detectar campos modificados.'''
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        '''Actualiza los valores cargados tras refrescar el registro.'''
+        super().refresh_from_db(
+            using=using, fields=fields, from_queryset=from_queryset
+        )
+        self._snapshot_loaded_values()
+
+    def _snapshot_loaded_values(self, update_fields=None):
+        '''Registra los valores actuales como valores cargados.
+
+        Args:
+            update_fields: Si se indica, solo se registran esos campos
+        '''
+        loaded = getattr(self, '_loaded_values', None)
+        if update_fields is not None and loaded is not None:
+            for name in update_fields:
+                field = self._meta.get_field(name)
+                loaded[field.attname] = getattr(self, field.attname)
+            return
+
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
+
+    def get_dirty_fields(self):
+        '''Obtiene los campos modificados desde que se cargó el registro.
+
+        Returns:
+            list con los nombres de los campos modificados o None si el
+            registro no se cargó desde la base de datos
+        '''
+        loaded = getattr(self, '_loaded_values', None)
+        if loaded is None:
+            return None
 
-        self.id_user_updated = user.pk
-        return super().save(*args, **kwargs)
+        dirty = []
+        for field in self._meta.concrete_fields:
+            if field.attname in loaded:
+                if getattr(self, field.attname) != loaded[field.attname]:
+                    dirty.append(field.name)
+            elif field.attname in self.__dict__:
+                # Campo diferido asignado después de la carga
+                dirty.append(field.name)
+        return dirty
+
+    def save(self, *args, **kwargs):
+        '''Guarda el registro escribiendo solo los campos modificados.
+
+        En actualizaciones sin update_fields se escriben únicamente los
+        campos modificados y los de auditoría; si no hay cambios no se
+        ejecuta el UPDATE ni se crea registro histórico.
+        '''
+        # Los usuarios de auditoría resueltos pueden cambiar al guardar
+        self.__dict__.pop('_audit_users', None)
+        user_pk = get_current_user_pk()
+
+        update_fields = kwargs.get('update_fields')
+        is_update = (
+            not self._state.adding and
+            not kwargs.get('force_insert') and
+            not args
+        )
+        if is_update and update_fields is None:
+            update_fields = self.get_dirty_fields()
+            if update_fields is not None and not update_fields:
+                return
+
+        if update_fields:
+            kwargs['update_fields'] = (
+                set(update_fields) | set(self.AUDIT_UPDATE_FIELDS)
+            )
+
+        if user_pk is not None:
+            if not self.pk:
+                self.id_user_created = user_pk
+            self.id_user_updated = user_pk
+
+        super().save(*args, **kwargs)
+        self._snapshot_loaded_values(kwargs.get('update_fields'))
+        ModelCache.invalidate(type(self), [self.pk])
+
+    @classmethod
+    def check(cls, **kwargs):
+        '''Verifica que las subclases conserven los índices de BaseModel.'''
+        errors = super().check(**kwargs)
+        index_fields = [list(index.fields) for index in cls._meta.indexes]
+        if ['is_active', 'is_deleted'] not in index_fields:
+            errors.append(checks.Warning(
+                f'{cls.__name__} no tiene índice sobre '
+                '(is_active, is_deleted).',
+                hint='Declare la Meta como class Meta(BaseModel.Meta).',
+                obj=cls,
+                id='common.W001',
+            ))
+        if ['-created_at', '-id'] not in index_fields:
+            errors.append(checks.Warning(
+                f'{cls.__name__} no tiene índice sobre '
+                '(-created_at, -id) para la paginación por keyset.',
+                hint='Declare la Meta como class Meta(BaseModel.Meta).',
+                obj=cls,
+                id='common.W002',
+            ))
+        return errors
 
     def get_create_user(self):
         '''Retorna el usuario creador del registro.'''
-        try:
-            return CustomUserModel.objects.get(pk=self.id_user_created)
-        except ObjectDoesNotExist:
-            return None
+        audit_users = getattr(self, '_audit_users', None)
+        if audit_users is not None:
+            return audit_users['created']
+        return AuditUserMap.get_user(self.id_user_created)
 
     def get_update_user(self):
         '''Retorna el usuario ultimo en actualizar el registro '''
-        try:
-            return CustomUserModel.objects.get(pk=self.id_user_updated)
-        except ObjectDoesNotExist:
-            return None
+        audit_users = getattr(self, '_audit_users', None)
+        if audit_users is not None:
+            return audit_users['updated']
+        return AuditUserMap.get_user(self.id_user_updated)
 
     @classmethod
     def get_by_id(cls, id):
         '''Obtiene un registro por ID, omite los eliminados e inactivos.
 
+        Si el modelo define cache_by_id = True se lee de la caché
+        compartida y solo se consulta la base de datos en un fallo.
+
         Args:
             id: ID del registro a buscar
 
         Returns:
             Instancia del modelo o False si no existe
         '''
+        if cls.cache_by_id:
+            return ModelCache.get(cls, id) or False
         try:
-            return cls.objects.get(pk=id, is_active=True, is_deleted=False)
+            return cls.objects.alive().get(pk=id)
         except ObjectDoesNotExist:
             return False
 
@@ -125,7 +257,7 @@ class BaseModel(models.Model):
         Returns:
             QuerySet con todos los registros activos
         '''
-        return cls.objects.filter(is_active=True, is_deleted=False)
+        return cls.objects.alive()
 
     @classmethod
     def get_by_field(cls, field_name, value):
@@ -138,12 +270,7 @@ class BaseModel(models.Model):
         Returns:
             QuerySet con los registros que coinciden
         '''
-        filter_kwargs = {
-            field_name: value,
-            'is_active': True,
-            'is_deleted': False
-        }
-        return cls.objects.filter(**filter_kwargs)
+        return cls.objects.alive().filter(**{field_name: value})
 
     @classmethod
     def get_deleted(cls):
@@ -152,7 +279,7 @@ class BaseModel(models.Model):
         Returns:
             QuerySet con los registros eliminados
         '''
-        return cls.objects.filter(is_deleted=True)
+        return cls.objects.deleted()
 
     @classmethod
     def get_not_active(cls):
@@ -161,7 +288,7 @@ class BaseModel(models.Model):
         Returns:
             QuerySet con los registros inactivos
         '''
-        return cls.objects.filter(is_active=False)
+        return cls.objects.inactive()
 
     def disable(self):
         '''Marca el registro como inactivo.
@@ -207,3 +334,15 @@ class BaseModel(models.Model):
         abstract = True
         get_latest_by = 'created_at'
         ordering = ['-created_at']
+        # Las subclases deben heredar esta Meta: class Meta(BaseModel.Meta)
+        indexes = [
+            models.Index(
+                fields=['is_active', 'is_deleted'],
+                name='%(class)s_alive_idx'
+            ),
+            # Respalda la paginación por keyset (common.KeysetPaginator)
+            models.Index(
+                fields=['-created_at', '-id'],
+                name='%(class)s_keyset_idx'
+            ),
+        ]
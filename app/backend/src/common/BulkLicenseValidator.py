@@ -0,0 +1,215 @@
+"""
+Validación concurrente de licencias contra su servicio externo.
+Usa un pool de hilos acotado y una cola por servidor que reparte los hilos
+por turnos con un límite de peticiones simultáneas por servidor, y guarda
+el resultado de cada licencia en bloque.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.utils import timezone
+
+import requests
+
+from accounts.models import License
+
+
+class BulkLicenseValidator:
+    """
+    Clase para validar muchas licencias a la vez.
+
+    La respuesta se interpreta como en LoginTempView: 200 con cuerpo "1"
+    es válida; cualquier otra respuesta o error de red es inválida.
+
+    Las licencias se agrupan en una cola por servidor y solo se envía al
+    pool una petición si su servidor está por debajo de PER_HOST, por
+    turnos entre servidores: ningún hilo queda esperando a un servidor
+    ocupado mientras otros servidores tienen licencias pendientes.
+
+    Configuración (LICENSE_VALIDATION en settings.py):
+        WORKERS: Hilos del pool (peticiones simultáneas en total)
+        PER_HOST: Peticiones simultáneas por servidor
+        TIMEOUT: Segundos de espera por petición
+        BATCH_SIZE: Licencias guardadas por bulk_update
+        ADMIN_LIMIT: Máximo de licencias de la acción del admin; los lotes
+                     mayores se validan con el comando validate_licenses
+
+    Uso:
+    summary = BulkLicenseValidator(License.objects.alive()).run()
+    """
+
+    DEFAULT_CONFIG = {
+        'WORKERS': 16,
+        'PER_HOST': 4,
+        'TIMEOUT': 15,
+        'BATCH_SIZE': 200,
+        'ADMIN_LIMIT': 200,
+    }
+    RESULT_FIELDS = (
+        'last_validated_at', 'last_validation_ok', 'last_validation_message'
+    )
+
+    def __init__(self, licenses, workers=None, per_host=None, timeout=None,
+                 progress=None):
+        """
+        Args:
+            licenses: QuerySet o lista de licencias a validar
+            workers: Hilos del pool, por defecto WORKERS
+            per_host: Límite por servidor, por defecto PER_HOST
+            timeout: Timeout por petición, por defecto TIMEOUT
+            progress: Función que recibe los mensajes de progreso
+        """
+        config = self.get_config()
+        self.licenses = list(licenses)
+        self.workers = workers or config['WORKERS']
+        self.per_host = per_host or config['PER_HOST']
+        self.timeout = timeout or config['TIMEOUT']
+        self.batch_size = config['BATCH_SIZE']
+        self.progress = progress or (lambda message: None)
+        self._local = threading.local()
+        self._sessions = []
+
+    @classmethod
+    def get_config(cls):
+        config = dict(cls.DEFAULT_CONFIG)
+        config.update(getattr(settings, 'LICENSE_VALIDATION', {}))
+        return config
+
+    @staticmethod
+    def validation_url(license_obj):
+        """URL de validación, igual que en LoginTempView."""
+        base_url = license_obj.url_server.rstrip('/')
+        return f'{base_url}{license_obj.license_key}'
+
+    def _host_queues(self):
+        """Licencias agrupadas por servidor, en su orden original."""
+        queues = {}
+        for license_obj in self.licenses:
+            host = urlsplit(license_obj.url_server or '').netloc.lower()
+            queues.setdefault(host, deque()).append(license_obj)
+        return queues
+
+    def _session(self):
+        """Sesión HTTP por hilo para reutilizar conexiones."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            self._sessions.append(session)
+        return session
+
+    def check(self, license_obj):
+        """
+        Valida una licencia contra su servidor.
+
+        Returns:
+            tuple: (válida, mensaje)
+        """
+        if not license_obj.url_server or not license_obj.license_key:
+            return False, 'Sin URL de servidor o clave'
+
+        url = self.validation_url(license_obj)
+        try:
+            response = self._session().get(url, timeout=self.timeout)
+        except requests.exceptions.Timeout:
+            return False, 'Timeout'
+        except requests.exceptions.RequestException as error:
+            return False, f'Error de conexión: {error}'[:250]
+
+        body = response.text.strip()
+        if response.status_code == 200 and body == '1':
+            return True, 'Válida'
+        if response.status_code == 404 and body == '0':
+            return False, 'No encontrada en el servicio externo'
+        return False, f'Respuesta inesperada: {response.status_code}'
+
+    def run(self):
+        """
+        Valida todas las licencias y guarda los resultados.
+
+        Returns:
+            dict: total, valid, invalid y seconds
+        """
+        start = time.monotonic()
+        total = len(self.licenses)
+        summary = {'total': total, 'valid': 0, 'invalid': 0, 'seconds': 0}
+        if not total:
+            return summary
+
+        # Informa cada 10% aproximadamente
+        step = max(1, total // 10)
+        pending = []
+        done = 0
+        workers = min(self.workers, total)
+        queues = self._host_queues()
+        active = dict.fromkeys(queues, 0)
+        hosts = deque(queues)
+        running = {}
+
+        def fill():
+            """Ocupa los hilos libres por turnos entre servidores."""
+            skipped = 0
+            while len(running) < workers and skipped < len(hosts):
+                host = hosts[0]
+                hosts.rotate(-1)
+                if not queues[host] or active[host] >= self.per_host:
+                    skipped += 1
+                    continue
+                skipped = 0
+                active[host] += 1
+                license_obj = queues[host].popleft()
+                future = executor.submit(self.check, license_obj)
+                running[future] = (license_obj, host)
+
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix='BulkLicenseValidator'
+        ) as executor:
+            fill()
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    license_obj, host = running.pop(future)
+                    active[host] -= 1
+                    self._record(license_obj, *future.result(), summary)
+                    pending.append(license_obj)
+                    done += 1
+
+                    if len(pending) >= self.batch_size:
+                        self.save(pending)
+                        pending = []
+                    if done % step == 0 or done == total:
+                        self.progress(
+                            f"{done}/{total} validadas - "
+                            f"{summary['valid']} válidas, "
+                            f"{summary['invalid']} inválidas"
+                        )
+                fill()
+
+        for session in self._sessions:
+            session.close()
+        self.save(pending)
+        summary['seconds'] = round(time.monotonic() - start, 2)
+        return summary
+
+    @staticmethod
+    def _record(license_obj, is_valid, message, summary):
+        """Anota el resultado en la licencia y en el resumen."""
+        license_obj.last_validated_at = timezone.now()
+        license_obj.last_validation_ok = is_valid
+        license_obj.last_validation_message = message
+        summary['valid' if is_valid else 'invalid'] += 1
+
+    def save(self, licenses):
+        """
+        Guarda los resultados con bulk_update. No se crea historial: el
+        resultado de la validación no es un cambio de la licencia.
+        """
+        if licenses:
+            License.objects.bulk_update(
+                licenses, self.RESULT_FIELDS, batch_size=self.batch_size
+            )
@@ -0,0 +1,24 @@
+"""
+Hashers de contraseña con parámetros calibrados desde settings.
+Las iteraciones se obtienen con: python manage.py calibrate_hashers
+"""
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class CalibratedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 con iteraciones tomadas de PASSWORD_PBKDF2_ITERATIONS.
+
+    Conserva el algoritmo pbkdf2_sha256, por lo que verifica los hashes
+    existentes. Si las iteraciones guardadas difieren de las configuradas,
+    must_update() devuelve True y Django actualiza el hash en el siguiente
+    login correcto (check_password con setter).
+    """
+
+    @property
+    def iterations(self):
+        return getattr(
+            settings, 'PASSWORD_PBKDF2_ITERATIONS', None
+        ) or PBKDF2PasswordHasher.iterations
@@ -1,23 +1,159 @@
+import hashlib
+
+from django.conf import settings
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.db import router, transaction
+from django.db.models.fields.files import FieldFile
+
+from common.LoggerApp import log_info
+from common.SharedCache import SharedCache
 
 
 class EmailBackEndAuth(ModelBackend):
+    """
+    Backend de autenticación por email.
+
+    get_user() se ejecuta en cada petición autenticada; si
+    AUTH_USER_CACHE_TTL es mayor que 0 y AUTH_USER_CACHE_ALIAS es una caché
+    compartida entre workers, el usuario se lee de la caché con los campos
+    de USER_CACHE_FIELDS. El resto de campos se cargan de forma diferida si
+    se usan. La caché se invalida al guardar o eliminar el usuario
+    (accounts.signals) y en User.objects.update(), incluido el cambio de
+    contraseña o la desactivación, por lo que el hash de sesión siempre se
+    calcula con la contraseña vigente. Con una caché local del proceso la
+    invalidación no llegaría a los demás workers y la caché no se usa.
+    """
+
+    USER_CACHE_FIELDS = (
+        'id', 'password', 'last_login', 'is_superuser', 'email',
+        'first_name', 'last_name', 'is_staff', 'is_active', 'date_joined',
+        'picture', 'is_confirmed_mail', 'profile_type',
+    )
+    USER_CACHE_PREFIX = 'auth:user'
+
     def authenticate(self, request, username=None, password=None, **kwargs):
         UserModel = get_user_model()
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
         try:
-            user = UserModel.objects.get(email=username)
+            user = UserModel._default_manager.get_by_natural_key(username)
         except UserModel.DoesNotExist:
             return None
 
+        stored_hash = user.password
         if user.check_password(password):
+            if user.password != stored_hash:
+                self._log_rehash(request, user, stored_hash)
             return user
 
         return None
 
+    @staticmethod
+    def _log_rehash(request, user, stored_hash):
+        """Registra la actualización transparente del hash al iniciar sesión."""
+        log_info(
+            user=user,
+            url=getattr(request, 'path', 'N/A'),
+            file_name='EmailBackEndAuth',
+            message=lambda: (
+                f"Hash de contraseña actualizado para {user.email}: "
+                f"{stored_hash.split('$', 2)[:2]} -> "
+                f"{user.password.split('$', 2)[:2]}"
+            ),
+            request=request
+        )
+
     def get_user(self, user_id):
         UserModel = get_user_model()
+        timeout = self.get_cache_timeout()
+        if timeout:
+            return self._get_cached_user(UserModel, user_id, timeout)
         try:
             return UserModel.objects.get(pk=user_id)
         except UserModel.DoesNotExist:
-            return None
\ No newline at end of file
+            return None
+
+    @staticmethod
+    def get_cache_alias():
+        return getattr(settings, 'AUTH_USER_CACHE_ALIAS', 'default')
+
+    @classmethod
+    def get_cache(cls):
+        return caches[cls.get_cache_alias()]
+
+    @classmethod
+    def get_cache_timeout(cls):
+        """TTL de la caché; 0 si está desactivada o no es compartida."""
+        timeout = getattr(settings, 'AUTH_USER_CACHE_TTL', 0)
+        if timeout and not SharedCache.is_shared(cls.get_cache_alias()):
+            return 0
+        return timeout
+
+    @classmethod
+    def cache_key(cls, user_id):
+        schema = hashlib.md5(
+            ','.join(cls.USER_CACHE_FIELDS).encode()
+        ).hexdigest()[:8]
+        return f'{cls.USER_CACHE_PREFIX}:{schema}:{user_id}'
+
+    @classmethod
+    def _get_cached_user(cls, UserModel, user_id, timeout):
+        """Lee el usuario de la caché y solo consulta en un fallo."""
+        try:
+            user_id = UserModel._meta.pk.to_python(user_id)
+        except ValidationError:
+            return None
+
+        cache = cls.get_cache()
+        key = cls.cache_key(user_id)
+        # from_db espera los valores en el orden de concrete_fields
+        fields = [
+            field.attname for field in UserModel._meta.concrete_fields
+            if field.name in cls.USER_CACHE_FIELDS
+        ]
+        values = cache.get(key)
+        if values is not None:
+            return UserModel.from_db(
+                router.db_for_read(UserModel), fields, values
+            )
+
+        try:
+            user = UserModel.objects.only(*cls.USER_CACHE_FIELDS).get(
+                pk=user_id
+            )
+        except UserModel.DoesNotExist:
+            return None
+
+        values = []
+        for name in fields:
+            value = user.__dict__[name]
+            if isinstance(value, FieldFile):
+                value = value.name
+            values.append(value)
+        cache.set(key, tuple(values), timeout)
+        return user
+
+    @classmethod
+    def invalidate_user(cls, user_id):
+        cls.invalidate_users([user_id])
+
+    @classmethod
+    def invalidate_users(cls, user_ids):
+        """
+        Elimina los usuarios de la caché de inmediato y al confirmar la
+        transacción, para descartar lecturas hechas antes del COMMIT.
+        """
+        if not cls.get_cache_timeout():
+            return
+        keys = [cls.cache_key(user_id) for user_id in user_ids]
+        cache = cls.get_cache()
+        cache.delete_many(keys)
+        transaction.on_commit(
+            lambda: cache.delete_many(keys),
+            using=router.db_for_write(get_user_model())
+        )
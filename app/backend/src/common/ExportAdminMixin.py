@@ -0,0 +1,83 @@
+"""
+Mixin para ModelAdmin que agrega acciones de exportación en streaming
+(CSV, JSONL y XLSX) usando common.ModelExporter.
+"""
+
+from django.contrib import admin
+from django.http import FileResponse, StreamingHttpResponse
+
+from common.LoggerApp import log_info
+from common.ModelExporter import ModelExporter
+
+
+class ExportAdminMixin:
+    """
+    Agrega las acciones export_csv, export_jsonl y export_xlsx.
+
+    Las acciones se declaran en actions para que el admin las filtre por
+    permisos: solo se ofrecen si has_export_permission lo permite (por
+    defecto, permiso de cambio sobre el modelo). Un admin que define sus
+    propias acciones debe sumar export_actions:
+
+    actions = ('validate_licenses',) + ExportAdminMixin.export_actions
+
+    Attributes:
+        export_fields: Campos a exportar, por defecto todos los concretos
+    """
+
+    export_fields = None
+    export_actions = ('export_csv', 'export_jsonl', 'export_xlsx')
+    actions = export_actions
+
+    def has_export_permission(self, request):
+        """Exportar entrega todas las columnas; no basta con ver el listado."""
+        return self.has_change_permission(request)
+
+    @admin.action(
+        description='Exportar seleccionados a CSV', permissions=('export',)
+    )
+    def export_csv(self, request, queryset):
+        return self.export_queryset(request, queryset, 'csv')
+
+    @admin.action(
+        description='Exportar seleccionados a JSONL', permissions=('export',)
+    )
+    def export_jsonl(self, request, queryset):
+        return self.export_queryset(request, queryset, 'jsonl')
+
+    @admin.action(
+        description='Exportar seleccionados a XLSX', permissions=('export',)
+    )
+    def export_xlsx(self, request, queryset):
+        return self.export_queryset(request, queryset, 'xlsx')
+
+    def export_queryset(self, request, queryset, export_format):
+        """Responde con la exportación sin cargar el QuerySet en memoria."""
+        exporter = ModelExporter(
+            queryset.order_by('pk'), export_format, fields=self.export_fields
+        )
+        filename = exporter.get_filename()
+        log_info(
+            user=request.user,
+            url=request.path,
+            file_name=self.__class__.__name__,
+            message=lambda: (
+                f"Exportación {export_format} de {self.model._meta.label}"
+            ),
+            request=request
+        )
+
+        if export_format == 'xlsx':
+            # El libro se escribe en disco y se envía por bloques
+            return FileResponse(
+                exporter.to_temporary_file(),
+                as_attachment=True,
+                filename=filename,
+                content_type=exporter.content_type
+            )
+
+        response = StreamingHttpResponse(
+            exporter.stream(), content_type=exporter.content_type
+        )
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
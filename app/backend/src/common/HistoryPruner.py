@@ -0,0 +1,215 @@
+"""
+Retención y depuración de registros históricos (django-simple-history).
+Elimina versiones antiguas por bloques acotados recorriendo índices,
+para no mantener bloqueos largos sobre las tablas de historial.
+"""
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Count, Max, Min
+from django.utils import timezone
+
+from simple_history.models import registered_models
+
+
+class HistoryPruner:
+    """
+    Clase que aplica la política de retención al historial de un modelo.
+
+    Política (HISTORY_RETENTION en settings.py, por etiqueta de modelo o
+    'default'):
+        MAX_AGE_DAYS: Antigüedad máxima de una versión en días.
+        MAX_VERSIONS: Máximo de versiones conservadas por registro.
+        KEEP_FIRST: Conserva siempre la primera versión de cada registro.
+        KEEP_LAST: Conserva siempre la última versión de cada registro.
+    """
+
+    DEFAULT_POLICY = {
+        'MAX_AGE_DAYS': None,
+        'MAX_VERSIONS': None,
+        'KEEP_FIRST': True,
+        'KEEP_LAST': True,
+    }
+
+    def __init__(self, model, chunk_size=None, sleep=0, dry_run=False,
+                 progress=None):
+        """
+        Args:
+            model: Modelo con historial (ej: License)
+            chunk_size: Filas por bloque, por defecto HISTORY_PRUNE_CHUNK_SIZE
+            sleep: Pausa en segundos entre bloques
+            dry_run: Solo cuenta las filas que se eliminarían
+            progress: Función que recibe los mensajes de progreso
+        """
+        self.model = model
+        self.history_model = model.history.model
+        self.policy = self.get_policy(model)
+        self.chunk_size = chunk_size or getattr(
+            settings, 'HISTORY_PRUNE_CHUNK_SIZE', 1000
+        )
+        self.sleep = sleep
+        self.dry_run = dry_run
+        self.progress = progress or (lambda message: None)
+        self.deleted = 0
+
+    @classmethod
+    def get_policy(cls, model):
+        """Obtiene la política de retención de un modelo."""
+        retention = getattr(settings, 'HISTORY_RETENTION', {})
+        policy = dict(cls.DEFAULT_POLICY)
+        policy.update(retention.get('default', {}))
+        policy.update(retention.get(model._meta.label, {}))
+        return policy
+
+    @staticmethod
+    def history_models():
+        """Modelos registrados en django-simple-history."""
+        return list(registered_models.values())
+
+    def prune(self):
+        """
+        Aplica la política completa.
+
+        Returns:
+            dict: Filas eliminadas y espacio estimado recuperado
+        """
+        size_before = self.table_size()
+        rows_before = self.history_model.objects.count()
+
+        if self.policy['MAX_AGE_DAYS'] is not None:
+            self.prune_by_age(self.policy['MAX_AGE_DAYS'])
+        if self.policy['MAX_VERSIONS'] is not None:
+            self.prune_by_versions(self.policy['MAX_VERSIONS'])
+
+        reclaimed = None
+        if size_before is not None and rows_before:
+            reclaimed = int(size_before / rows_before * self.deleted)
+
+        return {
+            'model': self.model._meta.label,
+            'rows_before': rows_before,
+            'deleted': self.deleted,
+            'size_before': size_before,
+            'reclaimed_bytes': reclaimed,
+        }
+
+    def prune_by_age(self, max_age_days):
+        """
+        Elimina versiones más antiguas que max_age_days.
+        Recorre el historial por history_id en bloques de chunk_size.
+        """
+        cutoff = timezone.now() - timedelta(days=max_age_days)
+        manager = self.history_model.objects
+        last_seen = 0
+
+        while True:
+            candidates = list(
+                manager.filter(
+                    history_date__lt=cutoff, history_id__gt=last_seen
+                ).order_by('history_id').values_list('history_id', 'id')
+                [:self.chunk_size]
+            )
+            if not candidates:
+                break
+            last_seen = candidates[-1][0]
+
+            protected = self._protected_ids({obj for _, obj in candidates})
+            ids = [hid for hid, _ in candidates if hid not in protected]
+            self._delete(ids, 'antigüedad')
+
+    def prune_by_versions(self, max_versions):
+        """
+        Conserva solo las últimas max_versions versiones de cada registro.
+        """
+        manager = self.history_model.objects
+        over_limit = manager.values('id').annotate(
+            versions=Count('history_id')
+        ).filter(versions__gt=max_versions).order_by('id').values_list(
+            'id', flat=True
+        )
+
+        pending = []
+        for object_id in over_limit.iterator(chunk_size=self.chunk_size):
+            excess = list(
+                manager.filter(id=object_id).order_by('-history_id')
+                .values_list('history_id', flat=True)[max_versions:]
+            )
+            if self.policy['KEEP_FIRST'] and excess:
+                # El último de la lista es la primera versión del registro
+                excess = excess[:-1]
+            pending.extend(excess)
+            while len(pending) >= self.chunk_size:
+                self._delete(pending[:self.chunk_size], 'versiones')
+                pending = pending[self.chunk_size:]
+
+        if pending:
+            self._delete(pending, 'versiones')
+
+    def _protected_ids(self, object_ids):
+        """Versiones que no se deben eliminar (primera y/o última)."""
+        if not (self.policy['KEEP_FIRST'] or self.policy['KEEP_LAST']):
+            return set()
+
+        bounds = self.history_model.objects.filter(
+            id__in=object_ids
+        ).values('id').annotate(
+            first=Min('history_id'), last=Max('history_id')
+        ).order_by()
+
+        protected = set()
+        for row in bounds:
+            if self.policy['KEEP_FIRST']:
+                protected.add(row['first'])
+            if self.policy['KEEP_LAST']:
+                protected.add(row['last'])
+        return protected
+
+    def _delete(self, history_ids, reason):
+        """Elimina un bloque de versiones en su propia transacción."""
+        if not history_ids:
+            return
+
+        if self.dry_run:
+            deleted = len(history_ids)
+        else:
+            with transaction.atomic(using=self.history_model.objects.db):
+                deleted, _ = self.history_model.objects.filter(
+                    history_id__in=history_ids
+                ).delete()
+
+        self.deleted += deleted
+        self.progress(
+            f"{self.model._meta.label}: {deleted} versiones por {reason} "
+            f"(total {self.deleted})"
+        )
+        if self.sleep:
+            time.sleep(self.sleep)
+
+    def table_size(self):
+        """
+        Tamaño en bytes de la tabla de historial.
+
+        Returns:
+            int o None si el motor no permite consultarlo
+        """
+        table = self.history_model._meta.db_table
+        connection = connections[self.history_model.objects.db]
+        if connection.vendor == 'postgresql':
+            sql = 'SELECT pg_total_relation_size(%s)'
+        elif connection.vendor == 'sqlite':
+            sql = 'SELECT SUM(pgsize) FROM dbstat WHERE name = %s'
+        else:
+            return None
+
+        try:
+            with transaction.atomic(using=connection.alias), \
+                    connection.cursor() as cursor:
+                cursor.execute(sql, [table])
+                row = cursor.fetchone()
+        except Exception:
+            # dbstat no está disponible en todas las compilaciones de SQLite
+            return None
+        return row[0] if row else None
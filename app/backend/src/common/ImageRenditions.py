@@ -0,0 +1,236 @@
+"""
+Procesamiento de imágenes de perfil con Pillow.
+Normaliza la imagen al subirla y genera versiones (renditions) WebP/JPEG
+de tamaños fijos en un hilo en segundo plano.
+"""
+
+import hashlib
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+from PIL import Image, ImageOps
+
+from common.LoggerApp import log_error
+
+
+class ImageRenditions:
+    """
+    Clase para normalizar imágenes y generar sus versiones.
+
+    - normalize(): corrige la orientación EXIF, elimina metadatos, limita
+      el tamaño máximo y nombra el archivo con el hash de su contenido
+    - generate(): crea las versiones cuadradas de PICTURE_RENDITION_SIZES
+      en WebP y JPEG junto a la imagen, en la carpeta renditions/
+    - url(): URL de una versión o de la imagen original si aún no existe
+
+    Como los nombres dependen del contenido, los archivos no cambian nunca
+    y se pueden servir con caché de larga duración.
+
+    La disponibilidad de las versiones se obtiene del storage, que es
+    común a todos los workers; la caché recuerda el resultado durante
+    PICTURE_RENDITION_READY_TTL segundos si existen y
+    PICTURE_RENDITION_MISSING_TTL si faltan, para no consultar el storage
+    en cada petición. Las imágenes anteriores o con errores se completan
+    con el comando generate_renditions.
+    """
+
+    FORMATS = {'webp': 'WEBP', 'jpeg': 'JPEG'}
+    EXTENSIONS = {'webp': 'webp', 'jpeg': 'jpg'}
+    RENDITIONS_DIR = 'renditions'
+    CACHE_PREFIX = 'image_renditions'
+
+    _executor = None
+
+    @staticmethod
+    def get_sizes():
+        return tuple(
+            getattr(settings, 'PICTURE_RENDITION_SIZES', (64, 128, 256))
+        )
+
+    @staticmethod
+    def get_quality():
+        return getattr(settings, 'PICTURE_QUALITY', 85)
+
+    @staticmethod
+    def get_ready_ttl():
+        return getattr(settings, 'PICTURE_RENDITION_READY_TTL', 300)
+
+    @staticmethod
+    def get_missing_ttl():
+        return getattr(settings, 'PICTURE_RENDITION_MISSING_TTL', 60)
+
+    @classmethod
+    def normalize(cls, uploaded_file):
+        """
+        Normaliza una imagen subida.
+
+        Args:
+            uploaded_file: Archivo de imagen subido
+
+        Returns:
+            ContentFile JPEG sin metadatos con nombre <hash>.jpg
+        """
+        uploaded_file.seek(0)
+        with Image.open(uploaded_file) as image:
+            image = ImageOps.exif_transpose(image)
+            image = cls._to_rgb(image)
+            max_size = getattr(settings, 'PICTURE_MAX_SIZE', 1024)
+            image.thumbnail((max_size, max_size), Image.LANCZOS)
+
+            output = BytesIO()
+            # Sin exif ni icc: se guardan solo los píxeles
+            image.save(
+                output, 'JPEG', quality=cls.get_quality(), optimize=True
+            )
+
+        content = output.getvalue()
+        digest = hashlib.sha256(content).hexdigest()[:16]
+        return ContentFile(content, name=f'{digest}.jpg')
+
+    @staticmethod
+    def _to_rgb(image):
+        """Convierte a RGB, con fondo blanco si la imagen tiene alfa."""
+        if image.mode in ('RGBA', 'LA', 'P'):
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            return background
+        return image.convert('RGB')
+
+    @classmethod
+    def rendition_name(cls, name, size, image_format):
+        """Nombre de la versión de una imagen."""
+        directory, filename = posixpath.split(name)
+        stem = posixpath.splitext(filename)[0]
+        extension = cls.EXTENSIONS[image_format]
+        return posixpath.join(
+            directory, cls.RENDITIONS_DIR, f'{stem}_{size}.{extension}'
+        )
+
+    @classmethod
+    def _ready_key(cls, name):
+        return f'{cls.CACHE_PREFIX}:{hashlib.md5(name.encode()).hexdigest()}'
+
+    @classmethod
+    def forget(cls, name):
+        """Descarta la disponibilidad recordada en la caché."""
+        cache.delete(cls._ready_key(name))
+
+    @classmethod
+    def generate(cls, name, storage=None):
+        """
+        Genera todas las versiones de una imagen guardada.
+
+        Args:
+            name: Nombre del archivo en el storage
+            storage: Storage, por defecto default_storage
+        """
+        storage = storage or default_storage
+        with storage.open(name, 'rb') as source:
+            with Image.open(source) as image:
+                image = cls._to_rgb(ImageOps.exif_transpose(image))
+                for size in cls.get_sizes():
+                    thumbnail = ImageOps.fit(
+                        image, (size, size), Image.LANCZOS
+                    )
+                    for image_format, pil_format in cls.FORMATS.items():
+                        target = cls.rendition_name(name, size, image_format)
+                        if storage.exists(target):
+                            continue
+                        output = BytesIO()
+                        thumbnail.save(
+                            output, pil_format, quality=cls.get_quality()
+                        )
+                        storage.save(target, ContentFile(output.getvalue()))
+
+        cache.set(cls._ready_key(name), True, cls.get_ready_ttl())
+
+    @classmethod
+    def generate_async(cls, name):
+        """
+        Genera las versiones en un hilo en segundo plano al confirmar la
+        transacción, fuera del hilo de la petición.
+        """
+        if not name:
+            return
+        transaction.on_commit(
+            lambda: cls._get_executor().submit(cls._generate_safe, name)
+        )
+
+    @classmethod
+    def _get_executor(cls):
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'PICTURE_RENDITION_WORKERS', 2),
+                thread_name_prefix='ImageRenditions'
+            )
+        return cls._executor
+
+    @classmethod
+    def _generate_safe(cls, name):
+        try:
+            cls.generate(name)
+        except Exception as error:
+            log_error(
+                user=None,
+                url='N/A',
+                file_name='ImageRenditions',
+                message=f"Error al generar versiones de {name}: {error}"
+            )
+
+    @classmethod
+    def url(cls, field_file, size, image_format='jpeg'):
+        """
+        URL de la versión más cercana al tamaño pedido.
+
+        Si las versiones aún no se generaron devuelve la URL original.
+        """
+        if not cls.is_ready(field_file):
+            return field_file.url if field_file else ''
+        return cls.rendition_url(field_file, size, image_format)
+
+    @classmethod
+    def rendition_url(cls, field_file, size, image_format='jpeg'):
+        """URL de la versión más cercana al tamaño, sin comprobar que
+        exista (después de is_ready)."""
+        sizes = cls.get_sizes()
+        best = next((value for value in sizes if value >= size), sizes[-1])
+        return field_file.storage.url(
+            cls.rendition_name(field_file.name, best, image_format)
+        )
+
+    @classmethod
+    def is_ready(cls, field_file):
+        """
+        True si existen en el storage todas las versiones de la imagen.
+
+        El resultado se recuerda en la caché por poco tiempo: los demás
+        workers usan las versiones como mucho PICTURE_RENDITION_MISSING_TTL
+        segundos después de generarse, también tras reiniciar o vaciar la
+        caché.
+        """
+        if not field_file:
+            return False
+        name = field_file.name
+        key = cls._ready_key(name)
+        ready = cache.get(key)
+        if ready is not None:
+            return ready
+        storage = field_file.storage
+        ready = all(
+            storage.exists(cls.rendition_name(name, size, image_format))
+            for size in cls.get_sizes()
+            for image_format in cls.FORMATS
+        )
+        cache.set(
+            key, ready,
+            cls.get_ready_ttl() if ready else cls.get_missing_ttl()
+        )
+        return ready
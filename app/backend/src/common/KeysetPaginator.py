@@ -0,0 +1,215 @@
+"""
+Paginación por keyset (cursor) para los modelos que heredan de BaseModel.
+En lugar de OFFSET filtra a partir de los valores del último registro
+visto, por lo que el costo de una página no depende de su profundidad.
+"""
+
+import base64
+import binascii
+import datetime
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import Http404
+
+
+class InvalidCursor(InvalidPage):
+    """El cursor recibido no es válido para el ordenamiento."""
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder trunca los datetime a milisegundos; el cursor
+    necesita los microsegundos para no saltar ni repetir registros.
+    """
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPage:
+    """
+    Página de resultados de KeysetPaginator.
+
+    Attributes:
+        object_list: Registros de la página
+        next_cursor: Cursor de la página siguiente o None
+        previous_cursor: Cursor de la página anterior o None
+    """
+
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Paginador por keyset con cursores opacos.
+
+    El ordenamiento debe ser único y de campos no nulos; por defecto
+    (-created_at, -pk), respaldado por el índice %(class)s_keyset_idx de
+    BaseModel. El cursor codifica en base64 los valores del registro
+    frontera y la dirección de la navegación.
+
+    Uso:
+    paginator = KeysetPaginator(License.objects.alive(), per_page=50)
+    page = paginator.page(request.GET.get('cursor'))
+    """
+
+    DEFAULT_ORDERING = ('-created_at', '-pk')
+
+    def __init__(self, queryset, per_page=25, ordering=None):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering or self.DEFAULT_ORDERING)
+        self.fields = [
+            (name.lstrip('-'), name.startswith('-'))
+            for name in self.ordering
+        ]
+
+    def page(self, cursor=None):
+        """
+        Obtiene la página que corresponde a un cursor.
+
+        Args:
+            cursor: Cursor de next_cursor / previous_cursor o None para la
+                    primera página
+
+        Returns:
+            KeysetPage
+
+        Raises:
+            InvalidCursor: Si el cursor no se puede decodificar
+        """
+        backwards = False
+        queryset = self.queryset
+        if cursor:
+            values, backwards = self.decode_cursor(cursor)
+            queryset = queryset.filter(self._seek(values, backwards))
+
+        ordering = self._reverse(self.ordering) if backwards else self.ordering
+        rows = list(queryset.order_by(*ordering)[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if backwards:
+            rows.reverse()
+
+        if not rows:
+            return KeysetPage(rows, None, None)
+
+        has_next = has_more if not backwards else True
+        has_previous = has_more if backwards else bool(cursor)
+        return KeysetPage(
+            rows,
+            self.encode_cursor(rows[-1]) if has_next else None,
+            self.encode_cursor(rows[0], backwards=True)
+            if has_previous else None,
+        )
+
+    def encode_cursor(self, obj, backwards=False):
+        """Codifica el cursor de un registro frontera."""
+        values = [self._get_value(obj, name) for name, _ in self.fields]
+        payload = json.dumps(
+            {'v': values, 'b': backwards}, cls=CursorJSONEncoder,
+            separators=(',', ':')
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        """
+        Decodifica un cursor.
+
+        Returns:
+            tuple: (valores convertidos a Python, dirección hacia atrás)
+        """
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            raw_values = payload['v']
+            backwards = bool(payload['b'])
+            if len(raw_values) != len(self.fields):
+                raise ValueError
+            values = [
+                self._get_field(name).to_python(value)
+                for (name, _), value in zip(self.fields, raw_values)
+            ]
+        except (ValueError, TypeError, KeyError, binascii.Error,
+                ValidationError) as error:
+            raise InvalidCursor('Cursor de paginación inválido') from error
+        return values, backwards
+
+    def _seek(self, values, backwards):
+        """
+        Construye el filtro (a < x) OR (a = x AND b < y) ... equivalente a
+        la comparación de tuplas según la dirección de cada campo.
+        """
+        condition = Q()
+        equal = {}
+        for (name, descending), value in zip(self.fields, values):
+            lookup = 'lt' if descending != backwards else 'gt'
+            condition |= Q(**equal, **{f'{name}__{lookup}': value})
+            equal[name] = value
+        return condition
+
+    def _get_field(self, name):
+        """Obtiene el campo del modelo, admite el alias pk."""
+        opts = self.queryset.model._meta
+        return opts.pk if name == 'pk' else opts.get_field(name)
+
+    def _get_value(self, obj, name):
+        return obj.pk if name == 'pk' else getattr(
+            obj, self._get_field(name).attname
+        )
+
+    @staticmethod
+    def _reverse(ordering):
+        return tuple(
+            name[1:] if name.startswith('-') else f'-{name}'
+            for name in ordering
+        )
+
+
+class KeysetPaginationMixin:
+    """
+    Mixin para ListView que pagina con KeysetPaginator.
+
+    Agrega al contexto page_obj (KeysetPage), object_list y
+    is_paginated. El cursor se recibe en el parámetro cursor_kwarg.
+    """
+
+    paginate_by = 25
+    cursor_kwarg = 'cursor'
+    keyset_ordering = None
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(
+            queryset, per_page=page_size, ordering=self.keyset_ordering
+        )
+        cursor = (self.kwargs.get(self.cursor_kwarg) or
+                  self.request.GET.get(self.cursor_kwarg))
+        try:
+            page = paginator.page(cursor)
+        except InvalidCursor as error:
+            raise Http404(str(error))
+        return paginator, page, page.object_list, page.has_other_pages()
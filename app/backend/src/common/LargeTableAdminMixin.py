@@ -0,0 +1,200 @@
+"""
+Modo de tabla grande para el admin: conteos estimados, paginación por
+keyset y búsqueda por prefijo con índice en lugar de LIKE '%x%'.
+"""
+
+from functools import cached_property
+
+from django.conf import settings
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.utils import lookup_spawns_duplicates
+from django.contrib.admin.views.main import ORDER_VAR, ChangeList
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db import connections, models, transaction
+
+from common.KeysetPaginator import InvalidCursor, KeysetPaginator
+
+# Parámetro GET con el cursor de la página
+CURSOR_VAR = 'cursor'
+
+
+def large_table_config():
+    """Configuración LARGE_TABLE_ADMIN con valores por defecto."""
+    config = {'ESTIMATE_THRESHOLD': 50000, 'COUNT_LIMIT': 10000}
+    config.update(getattr(settings, 'LARGE_TABLE_ADMIN', {}))
+    return config
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator que evita COUNT(*) sobre tablas grandes.
+
+    - Sin filtros usa la estimación del motor (pg_class.reltuples en
+      PostgreSQL, sqlite_stat1 en SQLite) si supera ESTIMATE_THRESHOLD.
+    - Con filtros cuenta como máximo COUNT_LIMIT filas.
+
+    Attributes:
+        is_estimated: True si count no es exacto
+    """
+
+    is_estimated = False
+
+    @cached_property
+    def count(self):
+        config = large_table_config()
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = self.table_estimate(queryset.model, queryset.db)
+            if estimate is not None and \
+                    estimate >= config['ESTIMATE_THRESHOLD']:
+                self.is_estimated = True
+                return estimate
+            return queryset.count()
+
+        limit = config['COUNT_LIMIT']
+        count = queryset.order_by()[:limit + 1].count()
+        if count > limit:
+            self.is_estimated = True
+            return limit
+        return count
+
+    @staticmethod
+    def table_estimate(model, using):
+        """
+        Filas estimadas de la tabla según las estadísticas del motor.
+
+        Returns:
+            int o None si no hay estadísticas
+        """
+        connection = connections[using]
+        table = model._meta.db_table
+        if connection.vendor == 'postgresql':
+            sql = ('SELECT reltuples::bigint FROM pg_class '
+                   'WHERE oid = %s::regclass')
+        elif connection.vendor == 'sqlite':
+            # Se actualiza con ANALYZE; el primer número son las filas
+            sql = 'SELECT stat FROM sqlite_stat1 WHERE tbl = %s'
+        else:
+            return None
+
+        try:
+            with transaction.atomic(using=using), \
+                    connection.cursor() as cursor:
+                cursor.execute(sql, [table])
+                rows = cursor.fetchall()
+        except Exception:
+            # sqlite_stat1 no existe hasta el primer ANALYZE
+            return None
+        values = [int(str(row[0]).split()[0]) for row in rows if row[0]]
+        estimate = max(values, default=None)
+        # reltuples es -1 si la tabla nunca se analizó
+        return estimate if estimate is not None and estimate >= 0 else None
+
+    def validate_number(self, number):
+        """Con un conteo estimado no se valida el límite superior."""
+        if not self.is_estimated:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger('Número de página inválido')
+        if number < 1:
+            raise EmptyPage('Número de página menor que 1')
+        return number
+
+
+class KeysetChangeList(ChangeList):
+    """
+    ChangeList que pagina por keyset con el ordenamiento por defecto.
+    Si el usuario ordena por una columna se usa la paginación normal.
+    """
+
+    keyset_page = None
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_query_string(self, new_params=None, remove=None):
+        """Los enlaces de filtros y orden vuelven a la primera página."""
+        new_params = new_params or {}
+        if CURSOR_VAR not in new_params:
+            remove = list(remove or []) + [CURSOR_VAR]
+        return super().get_query_string(new_params, remove)
+
+    def get_results(self, request):
+        if ORDER_VAR in self.params or self.show_all:
+            return super().get_results(request)
+
+        paginator = self.model_admin.get_paginator(
+            request, self.queryset, self.list_per_page
+        )
+        keyset = KeysetPaginator(
+            self.queryset, per_page=self.list_per_page,
+            ordering=self.model_admin.keyset_ordering
+        )
+        try:
+            page = keyset.page(request.GET.get(CURSOR_VAR))
+        except InvalidCursor:
+            raise IncorrectLookupParameters
+
+        self.keyset_page = page
+        self.result_count = paginator.count
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.result_list = page.object_list
+        self.can_show_all = False
+        self.multi_page = page.has_other_pages()
+        self.paginator = paginator
+
+    @property
+    def next_url(self):
+        return self.get_query_string(
+            {CURSOR_VAR: self.keyset_page.next_cursor}
+        )
+
+    @property
+    def previous_url(self):
+        return self.get_query_string(
+            {CURSOR_VAR: self.keyset_page.previous_cursor}
+        )
+
+
+class LargeTableAdminMixin:
+    """
+    Mixin para ModelAdmin de tablas grandes.
+
+    Attributes:
+        keyset_ordering: Ordenamiento único del keyset, respaldado por un
+                         índice (por defecto el de BaseModel)
+        search_index_fields: Campos buscados por prefijo sin distinguir
+                             mayúsculas (__istartswith); cada campo debe
+                             tener un common.PrefixIndex
+    """
+
+    keyset_ordering = KeysetPaginator.DEFAULT_ORDERING
+    search_index_fields = ()
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    change_list_template = 'admin/large_table_change_list.html'
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term or not self.search_index_fields:
+            return super().get_search_results(request, queryset, search_term)
+
+        condition = models.Q()
+        if term.isdigit() and len(term) < 19:
+            condition |= models.Q(pk=int(term))
+        for field in self.search_index_fields:
+            condition |= models.Q(**{f'{field}__istartswith': term})
+        may_have_duplicates = any(
+            lookup_spawns_duplicates(self.opts, field)
+            for field in self.search_index_fields
+        )
+        return queryset.filter(condition), may_have_duplicates
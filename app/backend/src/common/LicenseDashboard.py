@@ -0,0 +1,187 @@
+"""
+Panel de licencias del admin: totales por estado, por empresa y por
+vencimiento calculados con una consulta agrupada y guardados en caché.
+La caché usa la versión de License de common.ModelCache
+(License.cache_version), que cambia en cada escritura, también en los
+borrados en cascada (accounts.signals); en modo precalculado se muestra
+el último resumen del comando precompute_license_dashboard indicando si
+hay cambios posteriores.
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+
+from accounts.managers.LicenseManager import LicenseQuerySet
+from accounts.models import License
+from common.ModelCache import ModelCache
+
+
+class LicenseDashboard:
+    """
+    Clase para calcular y leer el resumen del panel de licencias.
+
+    Claves:
+        license_dashboard:<versión>:<días>
+            Resumen calculado con la versión actual de License. Vence a
+            los TTL segundos porque los grupos de vencimiento dependen de
+            la fecha aunque no cambien los datos.
+        license_dashboard:latest
+            Último resumen precalculado (precompute_license_dashboard),
+            sin vencimiento.
+
+    Configuración (LICENSE_DASHBOARD en settings.py):
+        CACHE_ALIAS: Alias de CACHES (compartida entre workers)
+        TTL: Segundos de vida del resumen
+        EXPIRY_DAYS: Límites en días de los grupos de vencimiento
+        PRECOMPUTED: True para que la página solo lea el último resumen
+                     precalculado (tablas muy grandes); el comando debe
+                     ejecutarse periódicamente
+
+    Uso:
+    summary = LicenseDashboard.get()
+    LicenseDashboard.precompute()
+    """
+
+    KEY_PREFIX = 'license_dashboard'
+    DEFAULT_CONFIG = {
+        'CACHE_ALIAS': 'default',
+        'TTL': 300,
+        'EXPIRY_DAYS': (7, 30, 90),
+        'PRECOMPUTED': False,
+    }
+
+    @classmethod
+    def get_config(cls):
+        config = dict(cls.DEFAULT_CONFIG)
+        config.update(getattr(settings, 'LICENSE_DASHBOARD', {}))
+        config['EXPIRY_DAYS'] = tuple(sorted(config['EXPIRY_DAYS']))
+        return config
+
+    @classmethod
+    def get_cache(cls):
+        return caches[cls.get_config()['CACHE_ALIAS']]
+
+    @classmethod
+    def cache_key(cls, version):
+        days = '-'.join(str(day) for day in cls.get_config()['EXPIRY_DAYS'])
+        return f'{cls.KEY_PREFIX}:{version}:{days}'
+
+    @classmethod
+    def latest_key(cls):
+        return f'{cls.KEY_PREFIX}:latest'
+
+    @classmethod
+    def get(cls):
+        """
+        Obtiene el resumen desde la caché o lo calcula.
+
+        Con PRECOMPUTED se devuelve el último resumen precalculado aunque
+        haya cambios posteriores (stale=True); solo se calcula en la
+        petición si todavía no existe ninguno.
+
+        Returns:
+            dict del resumen (ver compute) con stale
+        """
+        config = cls.get_config()
+        cache = cls.get_cache()
+        version = ModelCache.get_version(License)
+        summary = cache.get(cls.cache_key(version))
+        if summary is None and config['PRECOMPUTED']:
+            summary = cache.get(cls.latest_key())
+            if summary is not None and \
+                    summary['expiry_days'] != config['EXPIRY_DAYS']:
+                summary = None
+        if summary is None:
+            summary = cls.compute()
+            summary['version'] = version
+            cache.set(cls.cache_key(version), summary, config['TTL'])
+        summary['stale'] = summary['version'] != version
+        return summary
+
+    @classmethod
+    def precompute(cls):
+        """
+        Calcula el resumen y lo guarda como el último precalculado y para
+        la versión actual.
+
+        Returns:
+            dict del resumen
+        """
+        config = cls.get_config()
+        cache = cls.get_cache()
+        version = ModelCache.get_version(License)
+        summary = cls.compute()
+        summary['version'] = version
+        cache.set(cls.cache_key(version), summary, config['TTL'])
+        cache.set(cls.latest_key(), summary, timeout=None)
+        return summary
+
+    @classmethod
+    def compute(cls, now=None):
+        """
+        Calcula el resumen con una consulta agrupada por empresa, estado
+        y grupo de vencimiento.
+
+        Returns:
+            dict con:
+                generated_at: Fecha del cálculo
+                expiry_days: Límites de los grupos de vencimiento
+                total: Total de licencias
+                by_status: {estado: total}
+                by_expiry: {grupo: total} de las licencias activas
+                enterprises: Lista por total descendente de dicts con
+                             enterprise, total, by_status y by_expiry
+        """
+        now = now or timezone.now()
+        days = cls.get_config()['EXPIRY_DAYS']
+        statuses = [code for code, _ in LicenseQuerySet.STATUS_CHOICES]
+        expiries = cls.expiry_codes(days)
+
+        def empty():
+            return {
+                'total': 0,
+                'by_status': dict.fromkeys(statuses, 0),
+                'by_expiry': dict.fromkeys(expiries, 0),
+            }
+
+        summary = empty()
+        enterprises = {}
+        for row in License.objects.expiry_summary(days=days, now=now):
+            enterprise = enterprises.setdefault(row['enterprise'], empty())
+            for group in (summary, enterprise):
+                group['total'] += row['total']
+                group['by_status'][row['status']] += row['total']
+                if row['expiry'] is not None:
+                    group['by_expiry'][row['expiry']] += row['total']
+
+        summary['enterprises'] = [
+            dict(enterprise=name, **values)
+            for name, values in sorted(
+                enterprises.items(), key=lambda item: (-item[1]['total'],
+                                                        item[0])
+            )
+        ]
+        summary['generated_at'] = now
+        summary['expiry_days'] = days
+        return summary
+
+    @staticmethod
+    def expiry_codes(days):
+        """Códigos de los grupos de vencimiento en orden."""
+        return [str(day) for day in days] + [
+            LicenseQuerySet.LATER, LicenseQuerySet.NO_EXPIRY
+        ]
+
+    @staticmethod
+    def expiry_labels(days):
+        """Etiquetas de los grupos de vencimiento en orden."""
+        labels = []
+        start = 0
+        for day in days:
+            labels.append(
+                f'Próximos {day} días' if start == 0
+                else f'{start + 1} a {day} días'
+            )
+            start = day
+        return labels + [f'Más de {start} días', 'Sin vencimiento']
@@ -0,0 +1,307 @@
+"""
+Handler de logging para enviar registros a un colector central.
+Agrupa los registros en lotes y los envía por syslog (UDP/TCP) o HTTP,
+con cola acotada, spool en disco y reintentos con backoff exponencial.
+"""
+
+import json
+import logging
+import os
+import queue
+import random
+import socket
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import requests
+
+
+class LogShippingHandler(logging.Handler):
+    """
+    Handler que envía registros estructurados a un colector.
+
+    Características:
+    - emit() nunca bloquea la petición: si la cola está llena el registro
+      se descarta y se contabiliza en `dropped`
+    - Un hilo en segundo plano envía lotes de `batch_size` registros o
+      cada `flush_interval` segundos
+    - Si el colector no responde, los lotes se guardan en un spool en disco
+      de tamaño máximo `spool_max_bytes` y se reenvían al recuperarse
+    - Los reintentos usan backoff exponencial con jitter hasta `max_backoff`
+
+    Transportes:
+        syslog_udp: un datagrama RFC 5424 por registro
+        syslog_tcp: RFC 5424 con framing por conteo de octetos (RFC 6587)
+        http: POST de un arreglo JSON por lote
+    """
+
+    TRANSPORTS = ('syslog_udp', 'syslog_tcp', 'http')
+    SPOOL_FILE = 'log_spool.jsonl'
+
+    # Severidades syslog (RFC 5424) por nivel de logging
+    SYSLOG_SEVERITY = {
+        logging.DEBUG: 7,
+        logging.INFO: 6,
+        logging.WARNING: 4,
+        logging.ERROR: 3,
+        logging.CRITICAL: 2,
+    }
+    SYSLOG_FACILITY = 16  # local0
+
+    def __init__(self, transport='syslog_udp', host='127.0.0.1', port=514,
+                 url=None, batch_size=100, flush_interval=2.0,
+                 queue_size=10000, spool_dir=None,
+                 spool_max_bytes=50 * 1024 * 1024, max_backoff=60.0,
+                 timeout=5.0, app_name='django_base'):
+        super().__init__()
+        if transport not in self.TRANSPORTS:
+            raise ValueError(f"Transporte de logs no soportado: {transport}")
+        if transport == 'http' and not url:
+            raise ValueError('El transporte http requiere una URL')
+
+        self.transport = transport
+        self.host = host
+        self.port = port
+        self.url = url
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spool_max_bytes = spool_max_bytes
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.app_name = app_name
+        self.hostname = socket.gethostname()
+
+        self.spool_path = None
+        if spool_dir:
+            Path(spool_dir).mkdir(parents=True, exist_ok=True)
+            self.spool_path = Path(spool_dir) / self.SPOOL_FILE
+
+        self.dropped = 0
+        self.sent = 0
+        self._failures = 0
+        self._retry_at = 0.0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._spool_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name='LogShippingHandler', daemon=True
+        )
+        self._thread.start()
+
+    def emit(self, record):
+        """Encola el registro sin bloquear al hilo que registra."""
+        try:
+            self._queue.put_nowait(self.to_dict(record))
+        except queue.Full:
+            self.dropped += 1
+        except Exception:
+            self.handleError(record)
+
+    def to_dict(self, record):
+        """
+        Convierte un LogRecord en un diccionario estructurado.
+        Incluye los campos del AppLogger si vienen en `extra`.
+        """
+        return {
+            'timestamp': datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(),
+            'level': record.levelname,
+            'levelno': record.levelno,
+            'logger': record.name,
+            'host': self.hostname,
+            'pid': record.process,
+            'user': getattr(record, 'app_user', None),
+            'url': getattr(record, 'app_url', None),
+            'file_name': getattr(record, 'app_file', None),
+            'message': getattr(record, 'app_message', record.getMessage()),
+        }
+
+    def flush(self, timeout=10.0):
+        """
+        Espera a que la cola en memoria se procese.
+        Los lotes que no se pudieron enviar quedan en el spool.
+        """
+        deadline = time.monotonic() + timeout
+        while (self._queue.unfinished_tasks and
+               time.monotonic() < deadline and self._thread.is_alive()):
+            time.sleep(0.01)
+
+    def close(self):
+        """Detiene el hilo de envío procesando los registros pendientes."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=self.timeout + self.flush_interval)
+        super().close()
+
+    def _run(self):
+        """Bucle del hilo de envío."""
+        while True:
+            batch = self._collect_batch()
+            if batch:
+                self._ship(batch)
+                for _ in batch:
+                    self._queue.task_done()
+            elif self._stop.is_set():
+                break
+            if not batch:
+                self._replay_spool()
+
+    def _collect_batch(self):
+        """Reúne hasta batch_size registros o espera flush_interval."""
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or (self._stop.is_set() and
+                                  self._queue.empty()):
+                break
+            try:
+                batch.append(self._queue.get(timeout=min(remaining, 0.1)))
+            except queue.Empty:
+                continue
+        return batch
+
+    def _ship(self, batch):
+        """Envía un lote o lo guarda en el spool si el colector falla."""
+        if time.monotonic() < self._retry_at:
+            self._spool(batch)
+            return
+
+        # Primero se vacía el spool para respetar el orden
+        if not self._replay_spool():
+            self._spool(batch)
+            return
+
+        if self._send_batch(batch):
+            return
+        self._spool(batch)
+
+    def _send_batch(self, batch):
+        """
+        Intenta enviar un lote y actualiza el estado de backoff.
+
+        Returns:
+            bool: True si el colector aceptó el lote
+        """
+        try:
+            self.send(batch)
+        except (OSError, requests.exceptions.RequestException):
+            self._failures += 1
+            backoff = min(self.max_backoff, 2 ** (self._failures - 1))
+            self._retry_at = time.monotonic() + backoff * random.uniform(
+                0.5, 1.0
+            )
+            return False
+
+        self._failures = 0
+        self._retry_at = 0.0
+        self.sent += len(batch)
+        return True
+
+    def send(self, batch):
+        """Envía un lote con el transporte configurado."""
+        if self.transport == 'http':
+            response = requests.post(
+                self.url, json=batch, timeout=self.timeout
+            )
+            response.raise_for_status()
+        elif self.transport == 'syslog_tcp':
+            payload = b''.join(
+                b'%d %s' % (len(message), message)
+                for message in map(self.format_syslog, batch)
+            )
+            with socket.create_connection(
+                (self.host, self.port), timeout=self.timeout
+            ) as sock:
+                sock.sendall(payload)
+        else:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                for item in batch:
+                    sock.sendto(self.format_syslog(item),
+                                (self.host, self.port))
+
+    def format_syslog(self, item):
+        """Formatea un registro como mensaje syslog RFC 5424."""
+        severity = self.SYSLOG_SEVERITY.get(item['levelno'], 6)
+        priority = self.SYSLOG_FACILITY * 8 + severity
+        message = (
+            f"<{priority}>1 {item['timestamp']} {self.hostname} "
+            f"{self.app_name} {item['pid']} - - "
+            f"{json.dumps(item, ensure_ascii=False)}"
+        )
+        return message.encode('utf-8')
+
+    def _spool(self, batch):
+        """Guarda un lote en el spool respetando el tamaño máximo."""
+        if self.spool_path is None:
+            self.dropped += len(batch)
+            return
+
+        lines = ''.join(
+            json.dumps(item, ensure_ascii=False) + '\n' for item in batch
+        ).encode('utf-8')
+        with self._spool_lock:
+            size = (self.spool_path.stat().st_size
+                    if self.spool_path.exists() else 0)
+            if size + len(lines) > self.spool_max_bytes:
+                self.dropped += len(batch)
+                return
+            with open(self.spool_path, 'ab') as spool_file:
+                spool_file.write(lines)
+
+    def _replay_spool(self):
+        """
+        Reenvía los lotes guardados en el spool.
+
+        Returns:
+            bool: True si el spool quedó vacío
+        """
+        if self.spool_path is None or time.monotonic() < self._retry_at:
+            return self.spool_path is None or not self.spool_path.exists()
+
+        with self._spool_lock:
+            if not self.spool_path.exists():
+                return True
+            with open(self.spool_path, encoding='utf-8') as spool_file:
+                items = [json.loads(line) for line in spool_file
+                         if line.strip()]
+
+            sent = 0
+            for start in range(0, len(items), self.batch_size):
+                if not self._send_batch(items[start:start + self.batch_size]):
+                    break
+                sent = start + self.batch_size
+
+            pending = items[sent:]
+            if not pending:
+                os.remove(self.spool_path)
+                return True
+
+            with open(self.spool_path, 'w', encoding='utf-8') as spool_file:
+                for item in pending:
+                    spool_file.write(json.dumps(item, ensure_ascii=False))
+                    spool_file.write('\n')
+            return False
+
+    @classmethod
+    def from_settings(cls, config):
+        """
+        Crea el handler a partir del diccionario LOG_SHIPPING de settings.
+        """
+        return cls(
+            transport=config.get('TRANSPORT', 'syslog_udp'),
+            host=config.get('HOST', '127.0.0.1'),
+            port=config.get('PORT', 514),
+            url=config.get('URL'),
+            batch_size=config.get('BATCH_SIZE', 100),
+            flush_interval=config.get('FLUSH_INTERVAL', 2.0),
+            queue_size=config.get('QUEUE_SIZE', 10000),
+            spool_dir=config.get('SPOOL_DIR'),
+            spool_max_bytes=config.get('SPOOL_MAX_BYTES', 50 * 1024 * 1024),
+            max_backoff=config.get('MAX_BACKOFF', 60.0),
+            timeout=config.get('TIMEOUT', 5.0),
+            app_name=config.get('APP_NAME', 'django_base'),
+        )
@@ -6,13 +6,20 @@ Registra información detallada de las actividades del usuario.
 import logging
 import os
 from django.conf import settings
+from django.core.signals import setting_changed
 from pathlib import Path
+from common.LogShippingHandler import LogShippingHandler
 
 
 class AppLogger:
     """
     Clase para manejar el sistema de logging de la aplicación.
     Registra información del usuario, fecha/hora, URL, archivo y mensaje.
+
+    Configuración (settings.py):
+        APP_LOG_LEVEL: Nivel global (por defecto 'INFO').
+        APP_LOG_LEVELS: Niveles por componente (file_name). Acepta
+            prefijos separados por punto, ej: {'accounts.views': 'DEBUG'}.
     """
 
     def __init__(self):
@@ -21,8 +28,41 @@ class AppLogger:
             'logs',
             'app_log.log'
         )
+        self.configure_levels()
         self._setup_logger()
 
+    def configure_levels(self):
+        """
+        Carga los niveles global y por componente desde settings.
+        """
+        self.level = self._to_level(
+            getattr(settings, 'APP_LOG_LEVEL', 'INFO')
+        )
+        self.component_levels_config = {
+            component: self._to_level(level)
+            for component, level
+            in getattr(settings, 'APP_LOG_LEVELS', {}).items()
+        }
+        # Cache de niveles resueltos por componente
+        self._component_levels = {}
+
+        if hasattr(self, 'logger'):
+            self.logger.setLevel(self._lowest_level())
+
+    @staticmethod
+    def _to_level(level):
+        """Convierte 'DEBUG', 'info' o 10 al valor numérico del nivel."""
+        if isinstance(level, int):
+            return level
+        value = logging.getLevelName(str(level).upper())
+        if not isinstance(value, int):
+            raise ValueError(f"Nivel de log desconocido: {level}")
+        return value
+
+    def _lowest_level(self):
+        """Nivel más bajo configurado, usado como nivel del logger."""
+        return min([self.level, *self.component_levels_config.values()])
+
     def _setup_logger(self):
         """
         Configura el logger con el formato personalizado.
@@ -33,7 +73,7 @@ class AppLogger:
 
         # Configurar el logger
         self.logger = logging.getLogger('app_logger')
-        self.logger.setLevel(logging.INFO)
+        self.logger.setLevel(self._lowest_level())
 
         # Evitar duplicar handlers si ya existen
         if not self.logger.handlers:
@@ -41,7 +81,8 @@ class AppLogger:
             file_handler = logging.FileHandler(
                 self.log_file_path, encoding='utf-8'
             )
-            file_handler.setLevel(logging.INFO)
+            # El filtrado por nivel se hace en AppLogger antes de formatear
+            file_handler.setLevel(logging.NOTSET)
 
             # Formato personalizado
             formatter = logging.Formatter(
@@ -52,6 +93,13 @@ class AppLogger:
 
             self.logger.addHandler(file_handler)
 
+            # Envío a colector central (LOG_SHIPPING en settings)
+            shipping = getattr(settings, 'LOG_SHIPPING', {})
+            if shipping.get('ENABLED'):
+                self.logger.addHandler(
+                    LogShippingHandler.from_settings(shipping)
+                )
+
     def _format_log_message(self, user, url, file_name, message, request=None):
         """
         Formatea el mensaje de log con toda la información requerida.
@@ -66,21 +114,8 @@ class AppLogger:
         Returns:
             str: Mensaje formateado para el log
         """
-        # Obtener información del usuario
-        if hasattr(user, 'email'):
-            user_info = user.email
-        elif isinstance(user, str):
-            user_info = user
-        elif user is None:
-            user_info = "Sistema/Anónimo"
-        else:
-            user_info = str(user)
-
-        # Obtener URL desde request si no se proporciona
-        if not url and request:
-            url = request.get_full_path()
-        elif not url:
-            url = "N/A"
+        user_info = self._get_user_info(user)
+        url = self._get_url(url, request)
 
         # Formatear mensaje
         log_parts = [
@@ -92,6 +127,82 @@ class AppLogger:
 
         return " | ".join(log_parts)
 
+    def _get_user_info(self, user):
+        """Obtiene la representación del usuario para el log."""
+        if hasattr(user, 'email'):
+            return user.email
+        elif isinstance(user, str):
+            return user
+        elif user is None:
+            return "Sistema/Anónimo"
+        return str(user)
+
+    def _get_url(self, url, request):
+        """Obtiene la URL desde request si no se proporciona."""
+        if not url and request:
+            return request.get_full_path()
+        elif not url:
+            return "N/A"
+        return url
+
+    def is_enabled_for(self, level, file_name=None):
+        """
+        Indica si un nivel está habilitado para un componente.
+
+        Args:
+            level: Nivel de logging (logging.INFO, logging.DEBUG, ...)
+            file_name: Componente que genera el log (opcional)
+
+        Returns:
+            bool: True si el mensaje se registraría
+        """
+        threshold = self._component_levels.get(file_name)
+        if threshold is None:
+            threshold = self._resolve_level(file_name)
+        return level >= threshold
+
+    def _resolve_level(self, file_name):
+        """
+        Resuelve y memoriza el nivel de un componente.
+        Busca el nombre exacto y luego sus prefijos ('a.b.c' -> 'a.b' -> 'a');
+        los componentes sin configuración usan el nivel global.
+        """
+        level = self.level
+        component = file_name if isinstance(file_name, str) else None
+        while component:
+            if component in self.component_levels_config:
+                level = self.component_levels_config[component]
+                break
+            component = component.rpartition('.')[0]
+        self._component_levels[file_name] = level
+        return level
+
+    def _log(self, level, user, url, file_name, message, request=None):
+        """
+        Registra un mensaje si el nivel está habilitado.
+        El formateo solo ocurre después de verificar el nivel, por lo que
+        un nivel deshabilitado no accede al usuario ni construye cadenas.
+
+        Args:
+            message: Cadena o función sin argumentos que devuelve la cadena
+        """
+        if not self.is_enabled_for(level, file_name):
+            return
+        if callable(message):
+            message = message()
+        user_info = self._get_user_info(user)
+        url = self._get_url(url, request)
+        formatted_message = self._format_log_message(
+            user_info, url, file_name, message
+        )
+        # Campos estructurados para handlers como LogShippingHandler
+        self.logger.log(level, formatted_message, extra={
+            'app_user': user_info,
+            'app_url': url,
+            'app_file': file_name,
+            'app_message': message,
+        })
+
     def info(self, user, url, file_name, message, request=None):
         """
         Registra un mensaje de información.
@@ -100,55 +211,57 @@ class AppLogger:
             user: Usuario que realiza la acción
             url: URL donde ocurrió el evento
             file_name: Archivo donde se genera el log (ej: 'CustomUserModel')
-            message: Mensaje descriptivo
+            message: Mensaje descriptivo o función que lo construye
             request: Objeto request de Django (opcional)
         """
-        formatted_message = self._format_log_message(
-            user, url, file_name, message, request
-        )
-        self.logger.info(formatted_message)
+        self._log(logging.INFO, user, url, file_name, message, request)
 
     def warning(self, user, url, file_name, message, request=None):
         """
         Registra un mensaje de advertencia.
         """
-        formatted_message = self._format_log_message(
-            user, url, file_name, message, request
-        )
-        self.logger.warning(formatted_message)
+        self._log(logging.WARNING, user, url, file_name, message, request)
 
     def error(self, user, url, file_name, message, request=None):
         """
         Registra un mensaje de error.
         """
-        formatted_message = self._format_log_message(
-            user, url, file_name, message, request
-        )
-        self.logger.error(formatted_message)
+        self._log(logging.ERROR, user, url, file_name, message, request)
 
     def debug(self, user, url, file_name, message, request=None):
         """
         Registra un mensaje de debug.
         """
-        formatted_message = self._format_log_message(
-            user, url, file_name, message, request
-        )
-        self.logger.debug(formatted_message)
+        self._log(logging.DEBUG, user, url, file_name, message, request)
 
     def critical(self, user, url, file_name, message, request=None):
         """
         Registra un mensaje crítico.
         """
-        formatted_message = self._format_log_message(
-            user, url, file_name, message, request
-        )
-        self.logger.critical(formatted_message)
+        self._log(logging.CRITICAL, user, url, file_name, message, request)
 
 
 # Instancia global del logger
 app_logger = AppLogger()
 
 
+def _reload_log_levels(setting, **kwargs):
+    """Recarga los niveles cuando cambian en settings (tests)."""
+    if setting in ('APP_LOG_LEVEL', 'APP_LOG_LEVELS'):
+        app_logger.configure_levels()
+
+
+setting_changed.connect(_reload_log_levels)
+
+
+def is_log_enabled(level, file_name=None):
+    """
+    Indica si un nivel está habilitado para un componente.
+    Útil para evitar trabajo costoso antes de registrar un mensaje.
+    """
+    return app_logger.is_enabled_for(level, file_name)
+
+
 # Funciones de conveniencia para usar en toda la aplicación
 def log_info(user, url, file_name, message, request=None):
     """Función de conveniencia para logging de información."""
@@ -194,7 +307,7 @@ def log_view_access(view_func):
             user=user,
             url=url,
             file_name=view_func.__module__,
-            message=f"Acceso a vista: {view_func.__name__}",
+            message=lambda: f"Acceso a vista: {view_func.__name__}",
             request=request
         )
 
@@ -2,8 +2,13 @@
 Middleware para logging automático de peticiones HTTP.
 """
 
+from django.conf import settings
 from common.LoggerApp import log_info, log_error, log_warning
+from common.QueryRecorder import QueryRecorder, QueryMetrics
+from common.QueryRecorder import QueryBudgetExceeded
+from common.RequestProfiler import RequestProfiler
 import time
+import uuid
 
 
 class LoggingMiddleware:
@@ -13,10 +18,12 @@ class LoggingMiddleware:
 
     def __init__(self, get_response):
         self.get_response = get_response
+        self.profiler = RequestProfiler()
 
     def __call__(self, request):
         # Registrar inicio de petición
         start_time = time.time()
+        request.request_id = uuid.uuid4().hex
 
         user = request.user if hasattr(request, 'user') else None
         url = request.get_full_path()
@@ -27,12 +34,24 @@ class LoggingMiddleware:
             user=user,
             url=url,
             file_name="LoggingMiddleware",
-            message=f"Petición {method} iniciada",
+            message=lambda: f"Petición {method} iniciada",
             request=request
         )
 
+        # Perfilar solo una muestra de las peticiones
+        profile = None
+        if self.profiler.should_profile():
+            profile = self.profiler.start()
+
+        # Registrar las consultas SQL de la petición
+        recorder = QueryRecorder()
+
         try:
-            response = self.get_response(request)
+            try:
+                with recorder.record():
+                    response = self.get_response(request)
+            finally:
+                self.profiler.stop(profile)
 
             # Calcular tiempo de respuesta
             end_time = time.time()
@@ -43,21 +62,30 @@ class LoggingMiddleware:
                 user=user,
                 url=url,
                 file_name="LoggingMiddleware",
-                message=(f"Petición {method} completada - "
-                         f"Status: {response.status_code} - "
-                         f"Tiempo: {response_time}ms"),
+                message=lambda: (f"Petición {method} completada - "
+                                 f"Status: {response.status_code} - "
+                                 f"Tiempo: {response_time}ms - "
+                                 f"Consultas: {recorder.count} "
+                                 f"({recorder.duration_ms}ms)"),
                 request=request
             )
 
-            # Log de warning para respuestas lentas (más de 2 segundos)
-            if response_time > 2000:
+            self._report_queries(request, user, url, response, recorder)
+
+            # Log de warning para respuestas lentas (PROFILER_THRESHOLD_MS)
+            if self.profiler.is_slow(response_time):
                 log_warning(
                     user=user,
                     url=url,
                     file_name="LoggingMiddleware",
-                    message=f"Respuesta lenta detectada: {response_time}ms",
+                    message=(f"Respuesta lenta detectada: {response_time}ms "
+                             f"- Request ID: {request.request_id}"),
                     request=request
                 )
+                if profile is not None:
+                    self._save_profile(
+                        request, user, profile, response, response_time
+                    )
 
             return response
 
@@ -72,6 +100,102 @@ class LoggingMiddleware:
             )
             raise
 
+    def _report_queries(self, request, user, url, response, recorder):
+        """
+        Reporta las consultas de la petición: patrones N+1 al log,
+        cabeceras en modo DEBUG, métricas por vista y presupuestos.
+        """
+        view_name = self._get_view_name(request)
+        QueryMetrics.add(view_name, recorder)
+
+        duplicates = recorder.duplicates()
+        for shape, repeats in duplicates:
+            log_warning(
+                user=user,
+                url=url,
+                file_name="LoggingMiddleware",
+                message=(f"Posible N+1 en {view_name}: {repeats} consultas "
+                         f"repetidas - {shape[:300]}"),
+                request=request
+            )
+
+        if settings.DEBUG:
+            response['X-DB-Query-Count'] = str(recorder.count)
+            response['X-DB-Query-Time'] = f"{recorder.duration_ms}ms"
+            response['X-DB-Duplicate-Queries'] = str(len(duplicates))
+
+        budget = self._get_query_budget(request, view_name)
+        if budget is not None and recorder.count > budget:
+            message = (f"Presupuesto de consultas excedido en {view_name}: "
+                       f"{recorder.count} de {budget}")
+            log_warning(
+                user=user,
+                url=url,
+                file_name="LoggingMiddleware",
+                message=message,
+                request=request
+            )
+            # Solo en desarrollo: en producción se registra y no se corta
+            # la respuesta
+            if settings.DEBUG and \
+                    getattr(settings, 'QUERY_BUDGET_STRICT', False):
+                raise QueryBudgetExceeded(message)
+
+    def _get_view_name(self, request):
+        """Obtiene el nombre de la ruta resuelta o la ruta de la petición."""
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return request.path
+        return match.view_name or match._func_path
+
+    def _get_query_budget(self, request, view_name):
+        """
+        Obtiene el presupuesto de consultas de la vista.
+        Prioriza QUERY_BUDGETS de settings sobre el atributo
+        query_budget de la clase de la vista.
+        """
+        budgets = getattr(settings, 'QUERY_BUDGETS', {})
+        if view_name in budgets:
+            return budgets[view_name]
+
+        match = getattr(request, 'resolver_match', None)
+        view_class = getattr(getattr(match, 'func', None), 'view_class', None)
+        return getattr(view_class, 'query_budget', None)
+
+    def _save_profile(self, request, user, profile, response,
+                      response_time):
+        """
+        Guarda el perfil de una petición lenta y registra los frames
+        más costosos.
+        """
+        try:
+            top_frames = self.profiler.save(
+                profile,
+                request_id=request.request_id,
+                method=request.method,
+                url=request.get_full_path(),
+                status_code=response.status_code,
+                response_time=response_time
+            )
+        except OSError as e:
+            log_error(
+                user=user,
+                url=request.get_full_path(),
+                file_name="LoggingMiddleware",
+                message=f"No se pudo guardar el perfil: {str(e)}",
+                request=request
+            )
+            return
+
+        log_warning(
+            user=user,
+            url=request.get_full_path(),
+            file_name="LoggingMiddleware",
+            message=(f"Perfil {request.request_id} guardado - "
+                     f"Frames principales: {' ; '.join(top_frames)}"),
+            request=request
+        )
+
     def process_exception(self, request, exception):
         """
         Procesa excepciones no capturadas.
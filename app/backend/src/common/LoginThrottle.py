@@ -0,0 +1,137 @@
+"""
+Limitador de intentos de login con ventana deslizante en la caché
+compartida. Rechaza los intentos excedidos antes de calcular el hash de la
+contraseña y de validar licencias contra el servicio externo.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+from common.LoggerApp import log_warning
+
+
+class LoginThrottle:
+    """
+    Clase que limita los intentos de login por IP y por email.
+
+    Usa una ventana deslizante aproximada con dos contadores de ventana
+    fija: intentos = anterior * (1 - transcurrido / ventana) + actual.
+    Cada intento cuesta un incr en la caché, sin consultas a la base de
+    datos.
+
+    Con una caché local del proceso (LocMemCache) cada worker cuenta por
+    separado y el límite real es LIMIT por el número de workers; el check
+    common.W005 lo advierte.
+
+    Configuración (LOGIN_THROTTLE en settings.py):
+        ENABLED: Activa el limitador
+        CACHE_ALIAS: Alias de CACHES compartido entre workers
+        IP: {'LIMIT': intentos, 'WINDOW': segundos}
+        EMAIL: {'LIMIT': intentos, 'WINDOW': segundos}
+    """
+
+    KEY_PREFIX = 'login_throttle'
+    DEFAULT_CONFIG = {
+        'ENABLED': True,
+        'CACHE_ALIAS': 'default',
+        'IP': {'LIMIT': 20, 'WINDOW': 60},
+        'EMAIL': {'LIMIT': 5, 'WINDOW': 300},
+    }
+
+    @classmethod
+    def get_config(cls):
+        config = dict(cls.DEFAULT_CONFIG)
+        config.update(getattr(settings, 'LOGIN_THROTTLE', {}))
+        return config
+
+    def __init__(self, request, email=None):
+        config = self.get_config()
+        self.config = config
+        self.request = request
+        self.cache = caches[config['CACHE_ALIAS']]
+        self.identities = {'IP': request.META.get('REMOTE_ADDR') or 'unknown'}
+        if email:
+            # El email se guarda como hash para no dejar datos en la caché
+            self.identities['EMAIL'] = hashlib.sha256(
+                email.strip().lower().encode()
+            ).hexdigest()[:32]
+        self.email = email
+
+    @property
+    def enabled(self):
+        return self.config['ENABLED']
+
+    def _keys(self, scope, now):
+        window = self.config[scope]['WINDOW']
+        index = int(now // window)
+        base = f'{self.KEY_PREFIX}:{scope}:{self.identities[scope]}'
+        return f'{base}:{index}', f'{base}:{index - 1}', window, index
+
+    def _attempts(self, scope, now):
+        """Intentos estimados en la ventana deslizante."""
+        current_key, previous_key, window, index = self._keys(scope, now)
+        counts = self.cache.get_many([current_key, previous_key])
+        elapsed = (now - index * window) / window
+        return (counts.get(previous_key, 0) * (1 - elapsed) +
+                counts.get(current_key, 0))
+
+    def _increment(self, scope, now):
+        current_key, _, window, _ = self._keys(scope, now)
+        # Dos ventanas de vida para que cuente como ventana anterior
+        if not self.cache.add(current_key, 1, timeout=window * 2):
+            try:
+                self.cache.incr(current_key)
+            except ValueError:
+                self.cache.set(current_key, 1, timeout=window * 2)
+
+    def hit(self):
+        """
+        Registra un intento si está permitido.
+
+        Returns:
+            int: Segundos de espera si el intento se rechaza, 0 si se permite
+        """
+        if not self.enabled:
+            return 0
+
+        now = time.time()
+        for scope in self.identities:
+            limit = self.config[scope]['LIMIT']
+            if self._attempts(scope, now) >= limit:
+                self._log_block(scope)
+                return self._retry_after(scope, now)
+
+        for scope in self.identities:
+            self._increment(scope, now)
+        return 0
+
+    def reset_email(self):
+        """Reinicia el contador del email tras un login exitoso."""
+        if not self.enabled or 'EMAIL' not in self.identities:
+            return
+        current_key, previous_key, _, _ = self._keys('EMAIL', time.time())
+        self.cache.delete_many([current_key, previous_key])
+
+    def _retry_after(self, scope, now):
+        window = self.config[scope]['WINDOW']
+        return max(1, int(window - now % window))
+
+    def _log_block(self, scope):
+        """Registra el bloqueo una vez por ventana e identidad."""
+        window = self.config[scope]['WINDOW']
+        key = f'{self.KEY_PREFIX}:logged:{scope}:{self.identities[scope]}'
+        if not self.cache.add(key, 1, timeout=window):
+            return
+        log_warning(
+            user=None,
+            url=self.request.path,
+            file_name='LoginThrottle',
+            message=lambda: (
+                f"Login bloqueado por exceso de intentos ({scope}) - "
+                f"IP: {self.identities['IP']} - Email: {self.email or 'N/A'}"
+            ),
+            request=self.request
+        )
@@ -0,0 +1,54 @@
+"""
+Servicio de archivos de MEDIA con cabeceras de caché.
+Los archivos nombrados por su contenido (fotos normalizadas y sus
+versiones) no cambian nunca y se sirven con caché de un año.
+"""
+
+import re
+
+from django.conf import settings
+from django.urls import re_path
+from django.utils.cache import patch_cache_control
+from django.views.static import serve
+
+# <hash de 16 caracteres>.jpg o <hash>_<tamaño>.webp/.jpg
+IMMUTABLE_NAME = re.compile(r'(^|/)[0-9a-f]{16}(_\d+)?\.(jpg|webp)$')
+
+
+def serve_media(request, path, document_root=None):
+    """
+    Sirve un archivo de MEDIA agregando Cache-Control.
+
+    Returns:
+        Respuesta de django.views.static.serve con caché pública
+    """
+    response = serve(request, path, document_root=document_root)
+    if response.status_code == 200:
+        if IMMUTABLE_NAME.search(path):
+            patch_cache_control(
+                response, public=True, max_age=31536000, immutable=True
+            )
+        else:
+            patch_cache_control(
+                response, public=True,
+                max_age=getattr(settings, 'MEDIA_CACHE_MAX_AGE', 3600)
+            )
+    return response
+
+
+def media_urlpatterns():
+    """
+    URLs para servir MEDIA desde Django (reemplaza a static()).
+    Fuera de DEBUG solo se agregan si SERVE_MEDIA es True; en producción
+    el servidor web debe enviar las mismas cabeceras.
+    """
+    if not (settings.DEBUG or getattr(settings, 'SERVE_MEDIA', False)):
+        return []
+    prefix = settings.MEDIA_URL.lstrip('/')
+    return [
+        re_path(
+            rf'^{re.escape(prefix)}(?P<path>.*)$',
+            serve_media,
+            {'document_root': settings.MEDIA_ROOT},
+        ),
+    ]
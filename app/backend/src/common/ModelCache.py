@@ -0,0 +1,173 @@
+"""
+Caché de lectura (read-through) por ID para los modelos que heredan de
+BaseModel. Es opcional por modelo (cache_by_id = True) y se invalida por
+registro, por lo que escribir una licencia no descarta las demás. Solo se
+usa con una caché compartida entre workers (common.SharedCache).
+Mantiene además, con cache_version = True, una versión de los datos del
+modelo para las cachés de agregados.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.db import router, transaction
+
+from common.SharedCache import SharedCache
+
+
+class ModelCache:
+    """
+    Clase para la caché de registros por ID.
+
+    Claves:
+        basemodel:<modelo>:<esquema>:<pk>
+            Tupla con los valores de los campos concretos del registro.
+            Se elimina al escribir el registro. El esquema cambia si
+            cambian los campos del modelo.
+        basemodel:<modelo>:version
+            Versión de los datos del modelo (cache_version = True); se
+            incrementa en cada escritura aunque el modelo no use la caché
+            por ID. La usan las cachés de agregados
+            (common.LicenseDashboard).
+
+    Con una caché local del proceso (LocMemCache) get() consulta siempre
+    la base de datos: la invalidación de un worker no llegaría a los demás.
+
+    Settings:
+        BASEMODEL_CACHE_ALIAS: Alias de CACHES (compartida entre workers)
+        BASEMODEL_CACHE_TTL: Segundos de vida de cada registro
+    """
+
+    KEY_PREFIX = 'basemodel'
+
+    @staticmethod
+    def get_alias():
+        return getattr(settings, 'BASEMODEL_CACHE_ALIAS', 'default')
+
+    @classmethod
+    def get_cache(cls):
+        return caches[cls.get_alias()]
+
+    @staticmethod
+    def get_timeout():
+        return getattr(settings, 'BASEMODEL_CACHE_TTL', 300)
+
+    @staticmethod
+    def is_enabled(model):
+        return getattr(model, 'cache_by_id', False)
+
+    @staticmethod
+    def is_versioned(model):
+        return getattr(model, 'cache_version', False)
+
+    @classmethod
+    def is_shared(cls):
+        return SharedCache.is_shared(cls.get_alias())
+
+    @classmethod
+    def version_key(cls, model):
+        return f'{cls.KEY_PREFIX}:{model._meta.label_lower}:version'
+
+    @staticmethod
+    def field_names(model):
+        return [field.attname for field in model._meta.concrete_fields]
+
+    @classmethod
+    def object_key(cls, model, pk):
+        schema = hashlib.md5(
+            ','.join(cls.field_names(model)).encode()
+        ).hexdigest()[:8]
+        return f'{cls.KEY_PREFIX}:{model._meta.label_lower}:{schema}:{pk}'
+
+    @classmethod
+    def get_version(cls, model):
+        """
+        Obtiene la versión actual de los datos del modelo.
+        Si la clave no existe se inicia con la hora en nanosegundos para
+        no reutilizar versiones anteriores tras un desalojo de la caché.
+        """
+        cache = cls.get_cache()
+        key = cls.version_key(model)
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, time.time_ns(), timeout=None)
+            version = cache.get(key)
+        return version
+
+    @classmethod
+    def bump_version(cls, model):
+        """Marca que cambiaron los datos del modelo."""
+        cache = cls.get_cache()
+        key = cls.version_key(model)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+    @classmethod
+    def invalidate(cls, model, pks):
+        """
+        Invalida los registros escritos (cache_by_id) e incrementa la
+        versión del modelo (cache_version).
+
+        Se invalida de inmediato, para que la propia transacción no lea
+        valores anteriores, y de nuevo al confirmar la transacción, para
+        descartar lo que otros procesos leyeron antes del COMMIT.
+
+        Args:
+            model: Modelo escrito
+            pks: IDs de los registros escritos (None si no se leyeron
+                 porque el modelo no usa la caché por ID)
+        """
+        versioned = cls.is_versioned(model)
+        if not cls.is_enabled(model) and not versioned:
+            return
+        keys = [cls.object_key(model, pk) for pk in pks or ()] \
+            if cls.is_enabled(model) else []
+
+        def clear():
+            if keys:
+                cls.get_cache().delete_many(keys)
+            if versioned:
+                cls.bump_version(model)
+
+        clear()
+        transaction.on_commit(clear, using=router.db_for_write(model))
+
+    @classmethod
+    def get(cls, model, pk):
+        """
+        Obtiene un registro activo y no eliminado por ID.
+
+        Returns:
+            Instancia del modelo o None si no existe
+        """
+        try:
+            pk = model._meta.pk.to_python(pk)
+        except ValidationError:
+            return None
+
+        shared = cls.is_shared()
+        cache = cls.get_cache()
+        key = cls.object_key(model, pk)
+        names = cls.field_names(model)
+
+        values = cache.get(key) if shared else None
+        if values is not None:
+            return model.from_db(router.db_for_read(model), names, values)
+
+        try:
+            instance = model.objects.alive().get(pk=pk)
+        except ObjectDoesNotExist:
+            return None
+
+        if shared:
+            cache.set(
+                key,
+                tuple(getattr(instance, name) for name in names),
+                cls.get_timeout()
+            )
+        return instance
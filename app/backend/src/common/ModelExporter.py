@@ -0,0 +1,189 @@
+"""
+Exportación en streaming de QuerySets a CSV, JSONL y XLSX.
+Lee los registros por bloques con .iterator() y escribe fila por fila,
+por lo que la memoria usada no depende de la cantidad de registros.
+"""
+
+import csv
+import tempfile
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from openpyxl import Workbook
+
+
+class Echo:
+    """Objeto tipo archivo que devuelve lo escrito (para csv.writer)."""
+
+    def write(self, value):
+        return value
+
+
+class ModelExporter:
+    """
+    Clase para exportar un QuerySet en streaming.
+
+    Formatos:
+        csv: Texto separado por comas con encabezado
+        jsonl: Un objeto JSON por línea
+        xlsx: Libro de Excel en modo write-only de openpyxl
+
+    Estados (modelos que heredan de BaseModel):
+        alive, deleted, inactive o all
+
+    Uso:
+    exporter = ModelExporter(License.objects.all(), 'csv', state='alive')
+    for chunk in exporter.stream():
+        ...
+    """
+
+    FORMATS = {
+        'csv': 'text/csv; charset=utf-8',
+        'jsonl': 'application/x-ndjson; charset=utf-8',
+        'xlsx': 'application/vnd.openxmlformats-officedocument.'
+                'spreadsheetml.sheet',
+    }
+    STATES = ('all', 'alive', 'deleted', 'inactive')
+
+    def __init__(self, queryset, export_format='csv', fields=None,
+                 state='all', chunk_size=None):
+        """
+        Args:
+            queryset: QuerySet a exportar
+            export_format: csv, jsonl o xlsx
+            fields: Nombres de los campos, por defecto todos los concretos
+            state: Filtro de soft delete (alive, deleted, inactive, all)
+            chunk_size: Registros por bloque, por defecto EXPORT_CHUNK_SIZE
+
+        Raises:
+            ValueError: Si el formato, el estado o algún campo no es válido
+        """
+        if export_format not in self.FORMATS:
+            raise ValueError(f'Formato no soportado: {export_format}')
+        if state not in self.STATES:
+            raise ValueError(f'Estado no soportado: {state}')
+
+        self.model = queryset.model
+        self.export_format = export_format
+        self.fields = self.get_fields(fields)
+        self.chunk_size = chunk_size or getattr(
+            settings, 'EXPORT_CHUNK_SIZE', 2000
+        )
+        self.queryset = self.filter_state(queryset, state)
+
+    @property
+    def content_type(self):
+        return self.FORMATS[self.export_format]
+
+    def get_filename(self):
+        stamp = timezone.now().strftime('%Y%m%d_%H%M%S')
+        return f'{self.model._meta.model_name}_{stamp}.{self.export_format}'
+
+    def get_fields(self, fields):
+        """Valida los campos solicitados y devuelve sus attname."""
+        opts = self.model._meta
+        if not fields:
+            return [field.attname for field in opts.concrete_fields]
+
+        names = []
+        for name in fields:
+            try:
+                field = opts.get_field(name)
+            except FieldDoesNotExist:
+                raise ValueError(f'Campo no encontrado: {name}')
+            if not field.concrete:
+                raise ValueError(f'Campo no exportable: {name}')
+            names.append(field.attname)
+        return names
+
+    def filter_state(self, queryset, state):
+        """Aplica el filtro de soft delete de BaseModel."""
+        if state == 'all':
+            return queryset
+        if not hasattr(queryset, state):
+            raise ValueError(
+                f'El modelo {self.model._meta.label} no admite el estado '
+                f'{state}'
+            )
+        return getattr(queryset, state)()
+
+    def rows(self):
+        """Tuplas de valores leídas por bloques, sin instanciar modelos."""
+        return self.queryset.values_list(*self.fields).iterator(
+            chunk_size=self.chunk_size
+        )
+
+    def stream(self):
+        """
+        Genera el contenido en fragmentos de bytes (CSV / JSONL).
+        Para XLSX usar write() porque el libro es un archivo zip.
+        """
+        if self.export_format == 'csv':
+            writer = csv.writer(Echo())
+            yield writer.writerow(self.fields).encode('utf-8')
+            for row in self.rows():
+                yield writer.writerow(row).encode('utf-8')
+        elif self.export_format == 'jsonl':
+            encoder = DjangoJSONEncoder(ensure_ascii=False)
+            for row in self.rows():
+                line = encoder.encode(dict(zip(self.fields, row)))
+                yield (line + '\n').encode('utf-8')
+        else:
+            raise ValueError('XLSX no se genera por fragmentos, use write()')
+
+    def write(self, fileobj):
+        """
+        Escribe la exportación completa en un archivo binario.
+
+        Returns:
+            int: Cantidad de registros exportados
+        """
+        if self.export_format == 'xlsx':
+            return self._write_xlsx(fileobj)
+
+        count = -1 if self.export_format == 'csv' else 0
+        for chunk in self.stream():
+            fileobj.write(chunk)
+            count += 1
+        return count
+
+    def to_temporary_file(self):
+        """
+        Escribe la exportación en un archivo temporal en disco.
+
+        Returns:
+            Archivo temporal posicionado al inicio
+        """
+        temp_file = tempfile.TemporaryFile()
+        self.write(temp_file)
+        temp_file.seek(0)
+        return temp_file
+
+    def _write_xlsx(self, fileobj):
+        """Escribe el libro en modo write-only, fila por fila."""
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(self.model._meta.model_name[:31])
+        sheet.append(self.fields)
+
+        count = 0
+        for row in self.rows():
+            sheet.append([self._xlsx_value(value) for value in row])
+            count += 1
+        workbook.save(fileobj)
+        return count
+
+    @staticmethod
+    def _xlsx_value(value):
+        """Excel no admite fechas con zona horaria ni tipos arbitrarios."""
+        if isinstance(value, datetime) and timezone.is_aware(value):
+            return timezone.make_naive(value)
+        if value is None or isinstance(
+            value, (str, int, float, Decimal, date)
+        ):
+            return value
+        return str(value)
@@ -0,0 +1,39 @@
+"""
+Índice funcional para búsquedas por prefijo sin distinguir mayúsculas
+(campo__istartswith), como la búsqueda de common.LargeTableAdminMixin.
+"""
+
+from django.contrib.postgres.indexes import OpClass
+from django.db import models
+from django.db.models.functions import Upper
+
+
+class PrefixIndex(models.Index):
+    """
+    Índice sobre UPPER(campo), la expresión que genera __istartswith.
+
+    En PostgreSQL la expresión usa text_pattern_ops: con una collation
+    distinta de C un índice btree normal no sirve para LIKE 'x%'. En el
+    resto de motores es un índice funcional normal.
+
+    Uso:
+    class Meta:
+        indexes = [PrefixIndex('license_key', name='license_key_prefix_idx')]
+    """
+
+    OPCLASS = 'text_pattern_ops'
+
+    def __init__(self, field, *, name):
+        # deconstruct() devuelve la expresión Upper(campo)
+        expression = Upper(field) if isinstance(field, str) else field
+        super().__init__(expression, name=name)
+
+    def create_sql(self, model, schema_editor, using='', **kwargs):
+        if schema_editor.connection.vendor != 'postgresql':
+            return super().create_sql(model, schema_editor, using, **kwargs)
+        index = models.Index(
+            *[OpClass(expression, name=self.OPCLASS)
+              for expression in self.expressions],
+            name=self.name
+        )
+        return index.create_sql(model, schema_editor, using, **kwargs)
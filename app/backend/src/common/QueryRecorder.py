@@ -0,0 +1,172 @@
+"""
+Registro de consultas SQL por petición y detección de patrones N+1.
+Se instala sobre las conexiones con connection.execute_wrapper().
+"""
+
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.db import connections
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Se lanza cuando un bloque ejecuta más consultas que las permitidas."""
+
+
+class QueryRecorder:
+    """
+    Clase que cuenta consultas y tiempo de base de datos.
+
+    Agrupa las consultas por "forma" (SQL sin literales) para detectar
+    consultas idénticas repetidas, típicas de un patrón N+1.
+
+    Configuración (settings.py):
+        QUERY_NPLUSONE_THRESHOLD: Repeticiones de una misma forma a partir
+            de las cuales se reporta un N+1 (por defecto 5).
+    """
+
+    _STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+    _NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+    _IN_LIST = re.compile(r'\bIN\s*\((?:\s*(?:%s|\?|\d+)\s*,?)+\)',
+                          re.IGNORECASE)
+    _SPACES = re.compile(r'\s+')
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+        self.threshold = getattr(settings, 'QUERY_NPLUSONE_THRESHOLD', 5)
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.shapes[self.normalize(sql)] += 1
+
+    @classmethod
+    def normalize(cls, sql):
+        """
+        Obtiene la forma de una consulta eliminando literales y listas IN.
+
+        Args:
+            sql: Sentencia SQL
+
+        Returns:
+            str: Forma normalizada de la consulta
+        """
+        shape = cls._STRING_LITERAL.sub('?', sql)
+        shape = cls._NUMBER_LITERAL.sub('?', shape)
+        shape = cls._IN_LIST.sub('IN (...)', shape)
+        return cls._SPACES.sub(' ', shape).strip()
+
+    @property
+    def duration_ms(self):
+        """Tiempo total de base de datos en ms."""
+        return round(self.duration * 1000, 2)
+
+    def duplicates(self):
+        """
+        Obtiene las formas de consulta que superan el umbral de N+1.
+
+        Returns:
+            list: Tuplas (forma, repeticiones) ordenadas por repeticiones
+        """
+        return [
+            (shape, repeats)
+            for shape, repeats in self.shapes.most_common()
+            if repeats >= self.threshold
+        ]
+
+    @contextmanager
+    def record(self, using=None):
+        """
+        Registra las consultas ejecutadas dentro del bloque.
+
+        Args:
+            using: Alias de conexión o None para todas las conexiones
+        """
+        aliases = [using] if using else list(connections)
+        with ExitStack() as stack:
+            for alias in aliases:
+                stack.enter_context(
+                    connections[alias].execute_wrapper(self)
+                )
+            yield self
+
+
+class QueryMetrics:
+    """
+    Acumulado de consultas por vista en el proceso actual.
+    Es la superficie de métricas que consultan los paneles y comandos.
+    """
+
+    _lock = threading.Lock()
+    _views = {}
+
+    @classmethod
+    def add(cls, view_name, recorder):
+        """Acumula las métricas de una petición para una vista."""
+        with cls._lock:
+            entry = cls._views.setdefault(view_name, {
+                'requests': 0,
+                'queries': 0,
+                'duration_ms': 0.0,
+                'max_queries': 0,
+                'nplusone': 0,
+            })
+            entry['requests'] += 1
+            entry['queries'] += recorder.count
+            entry['duration_ms'] += recorder.duration_ms
+            entry['max_queries'] = max(entry['max_queries'], recorder.count)
+            if recorder.duplicates():
+                entry['nplusone'] += 1
+
+    @classmethod
+    def snapshot(cls):
+        """Devuelve una copia de las métricas acumuladas."""
+        with cls._lock:
+            return {name: dict(entry) for name, entry in cls._views.items()}
+
+    @classmethod
+    def reset(cls):
+        """Reinicia las métricas acumuladas."""
+        with cls._lock:
+            cls._views.clear()
+
+
+@contextmanager
+def assert_max_queries(max_queries, allow_duplicates=True, using=None):
+    """
+    Verifica que un bloque no supere un presupuesto de consultas.
+
+    Uso en tests:
+    with assert_max_queries(5):
+        client.get(url)
+
+    Args:
+        max_queries: Número máximo de consultas permitidas
+        allow_duplicates: Si es False también falla ante patrones N+1
+        using: Alias de conexión o None para todas las conexiones
+    """
+    recorder = QueryRecorder()
+    with recorder.record(using=using):
+        yield recorder
+
+    if recorder.count > max_queries:
+        raise QueryBudgetExceeded(
+            f"Se ejecutaron {recorder.count} consultas, "
+            f"presupuesto: {max_queries}"
+        )
+    duplicates = recorder.duplicates()
+    if not allow_duplicates and duplicates:
+        shape, repeats = duplicates[0]
+        raise QueryBudgetExceeded(
+            f"Patrón N+1 detectado ({repeats} repeticiones): {shape}"
+        )
@@ -0,0 +1,202 @@
+"""
+Perfilador de peticiones lentas.
+Ejecuta cProfile sobre una muestra de las peticiones y guarda un perfil
+compacto cuando la respuesta supera el umbral configurado.
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import random
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+
+class RequestProfiler:
+    """
+    Clase para perfilar peticiones HTTP muestreadas.
+
+    Configuración (settings.py):
+        PROFILER_ENABLED: Activa el modo de perfilado (por defecto False).
+        PROFILER_SAMPLE_RATE: Fracción de peticiones perfiladas (0.0 - 1.0).
+        PROFILER_THRESHOLD_MS: Umbral en ms para guardar el perfil.
+        PROFILER_DIR: Carpeta donde se guardan los perfiles.
+        PROFILER_TOP_FRAMES: Cantidad de frames a registrar en el log.
+        PROFILER_MAX_FILES: Máximo de perfiles conservados en disco.
+    """
+
+    PROFILE_EXTENSION = '.prof'
+    META_EXTENSION = '.json'
+
+    def __init__(self):
+        self.enabled = getattr(settings, 'PROFILER_ENABLED', False)
+        self.sample_rate = getattr(settings, 'PROFILER_SAMPLE_RATE', 0.1)
+        self.threshold_ms = getattr(settings, 'PROFILER_THRESHOLD_MS', 2000)
+        self.top_frames = getattr(settings, 'PROFILER_TOP_FRAMES', 10)
+        self.max_files = getattr(settings, 'PROFILER_MAX_FILES', 200)
+        self.profile_dir = Path(getattr(
+            settings,
+            'PROFILER_DIR',
+            os.path.join(settings.BASE_DIR, 'logs', 'profiles')
+        ))
+
+    def should_profile(self):
+        """
+        Decide si la petición actual debe perfilarse.
+
+        Returns:
+            bool: True si la petición entra en la muestra
+        """
+        if not self.enabled or self.sample_rate <= 0:
+            return False
+        return random.random() < self.sample_rate
+
+    def start(self):
+        """
+        Inicia un perfil para la petición actual.
+
+        Returns:
+            cProfile.Profile o None si no se pudo activar el perfilador
+        """
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Otro perfilador ya está activo en este hilo
+            return None
+        return profile
+
+    def stop(self, profile):
+        """Detiene el perfil activo."""
+        if profile is not None:
+            profile.disable()
+
+    def is_slow(self, response_time):
+        """Indica si el tiempo de respuesta (ms) supera el umbral."""
+        return response_time > self.threshold_ms
+
+    def save(self, profile, request_id, method, url, status_code,
+             response_time):
+        """
+        Guarda el perfil en disco junto a un archivo de metadatos.
+
+        Args:
+            profile: cProfile.Profile detenido
+            request_id: Identificador único de la petición
+            method: Método HTTP
+            url: URL de la petición
+            status_code: Código de estado de la respuesta
+            response_time: Tiempo de respuesta en ms
+
+        Returns:
+            list: Frames más costosos en formato legible
+        """
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        base_path = self.profile_dir / request_id
+
+        stats = pstats.Stats(profile)
+        stats.dump_stats(str(base_path) + self.PROFILE_EXTENSION)
+
+        top = self.top_frames_from_stats(stats, self.top_frames)
+        meta = {
+            'request_id': request_id,
+            'method': method,
+            'url': url,
+            'status': status_code,
+            'response_time': response_time,
+            'created_at': time.time(),
+            'top_frames': top,
+        }
+        with open(str(base_path) + self.META_EXTENSION, 'w',
+                  encoding='utf-8') as meta_file:
+            json.dump(meta, meta_file, ensure_ascii=False)
+
+        self._enforce_max_files()
+        return top
+
+    @staticmethod
+    def top_frames_from_stats(stats, limit):
+        """
+        Obtiene los frames con mayor tiempo acumulado.
+
+        Args:
+            stats: pstats.Stats
+            limit: Cantidad de frames a devolver
+
+        Returns:
+            list: Cadenas con formato 'archivo:línea(función) - ms'
+        """
+        entries = []
+        for func, (_, ncalls, _, cumtime, _) in stats.stats.items():
+            file_name, line, func_name = func
+            entries.append((cumtime, ncalls, file_name, line, func_name))
+
+        entries.sort(reverse=True)
+        return [
+            f"{os.path.basename(file_name)}:{line}({func_name}) "
+            f"- {round(cumtime * 1000, 2)}ms / {ncalls} llamadas"
+            for cumtime, ncalls, file_name, line, func_name
+            in entries[:limit]
+        ]
+
+    def list_profiles(self):
+        """
+        Lista los perfiles almacenados, del más reciente al más antiguo.
+
+        Returns:
+            list: Diccionarios con los metadatos de cada perfil
+        """
+        if not self.profile_dir.exists():
+            return []
+
+        profiles = []
+        for meta_path in self.profile_dir.glob('*' + self.META_EXTENSION):
+            try:
+                with open(meta_path, encoding='utf-8') as meta_file:
+                    profiles.append(json.load(meta_file))
+            except (OSError, ValueError):
+                continue
+
+        profiles.sort(key=lambda item: item.get('created_at', 0),
+                      reverse=True)
+        return profiles
+
+    def summarize(self, request_id, limit=20, sort_by='cumulative'):
+        """
+        Genera un resumen textual de un perfil almacenado.
+
+        Args:
+            request_id: Identificador de la petición
+            limit: Cantidad de funciones a mostrar
+            sort_by: Criterio de ordenamiento de pstats
+
+        Returns:
+            str o None si el perfil no existe
+        """
+        profile_path = self.profile_dir / (request_id + self.PROFILE_EXTENSION)
+        if not profile_path.exists():
+            return None
+
+        output = io.StringIO()
+        stats = pstats.Stats(str(profile_path), stream=output)
+        stats.strip_dirs().sort_stats(sort_by).print_stats(limit)
+        return output.getvalue()
+
+    def _enforce_max_files(self):
+        """Elimina los perfiles más antiguos cuando se supera el máximo."""
+        profiles = sorted(
+            self.profile_dir.glob('*' + self.PROFILE_EXTENSION),
+            key=lambda path: path.stat().st_mtime
+        )
+        excess = len(profiles) - self.max_files
+        for profile_path in profiles[:max(excess, 0)]:
+            meta_path = profile_path.with_suffix(self.META_EXTENSION)
+            for path in (profile_path, meta_path):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
@@ -0,0 +1,340 @@
+"""
+Índice de búsqueda de texto para licencias y usuarios.
+Usa FTS5 en SQLite y tsvector + pg_trgm en PostgreSQL, en una tabla por
+modelo que se mantiene sincronizada con señales y hooks de operaciones
+masivas. La búsqueda no recorre la tabla con LIKE '%x%'.
+"""
+
+import re
+
+from django.apps import apps
+from django.conf import settings
+from django.db import DatabaseError, connections, router, transaction
+
+from common.LoggerApp import log_error
+
+
+class SearchIndex:
+    """
+    Clase para mantener y consultar el índice de búsqueda.
+
+    Cada modelo indexado tiene una tabla <db_table>_search con el ID del
+    registro y el texto de sus campos (DOCUMENTS). Si cambia un modelo
+    del que dependen otros documentos (DEPENDENTS) también se reindexan.
+
+    Configuración (SEARCH_INDEX en settings.py):
+        ADMIN_LIMIT: Máximo de IDs que la búsqueda del admin filtra
+        TYPEAHEAD_LIMIT: Resultados del endpoint de autocompletado
+        CHUNK_SIZE: Registros por bloque al reconstruir
+
+    Uso:
+    ids = SearchIndex.search(License, 'kosmo flo')
+    SearchIndex.update(License, [license.pk])
+    """
+
+    DOCUMENTS = {
+        'accounts.license': (
+            'license_key', 'enterprise', 'notes',
+            'user__email', 'user__first_name', 'user__last_name',
+        ),
+        'accounts.customusermodel': ('email', 'first_name', 'last_name'),
+    }
+    # Modelo -> [(modelo dependiente, campo que lo relaciona)]
+    DEPENDENTS = {
+        'accounts.customusermodel': [('accounts.license', 'user_id')],
+    }
+    DEFAULT_CONFIG = {
+        'ADMIN_LIMIT': 1000,
+        'TYPEAHEAD_LIMIT': 10,
+        'CHUNK_SIZE': 1000,
+    }
+    TOKEN = re.compile(r'\w+')
+
+    @classmethod
+    def get_config(cls):
+        config = dict(cls.DEFAULT_CONFIG)
+        config.update(getattr(settings, 'SEARCH_INDEX', {}))
+        return config
+
+    @classmethod
+    def is_indexed(cls, model):
+        return model._meta.label_lower in cls.DOCUMENTS
+
+    @classmethod
+    def indexed_fields(cls, model):
+        """Campos propios del modelo que forman parte de algún documento."""
+        label = model._meta.label_lower
+        fields = {
+            path.split('__')[0] for path in cls.DOCUMENTS.get(label, ())
+        }
+        for dependent, _ in cls.DEPENDENTS.get(label, ()):
+            for path in cls.DOCUMENTS[dependent]:
+                parts = path.split('__')
+                if len(parts) > 1:
+                    fields.add(parts[1])
+        return fields
+
+    @classmethod
+    def affects_index(cls, model, field_names):
+        """
+        Indica si escribir estos campos cambia algún documento.
+        field_names None significa todos los campos.
+        """
+        if not cls.is_indexed(model) and \
+                model._meta.label_lower not in cls.DEPENDENTS:
+            return False
+        if field_names is None:
+            return True
+        return bool(cls.indexed_fields(model) & set(field_names))
+
+    @staticmethod
+    def table_name(model):
+        return f'{model._meta.db_table}_search'
+
+    @staticmethod
+    def _connection(model):
+        return connections[router.db_for_write(model)]
+
+    @classmethod
+    def vendor(cls, model):
+        """Motor soportado (sqlite / postgresql) o None."""
+        vendor = cls._connection(model).vendor
+        return vendor if vendor in ('sqlite', 'postgresql') else None
+
+    @classmethod
+    def tokens(cls, term):
+        return cls.TOKEN.findall(term.lower())[:8]
+
+    # Tablas -----------------------------------------------------------------
+
+    @classmethod
+    def create_tables(cls, using='default'):
+        """Crea las tablas del índice si no existen (post_migrate)."""
+        connection = connections[using]
+        for label in cls.DOCUMENTS:
+            model = apps.get_model(label)
+            table = connection.ops.quote_name(cls.table_name(model))
+            with connection.cursor() as cursor:
+                if connection.vendor == 'sqlite':
+                    cursor.execute(
+                        f'CREATE VIRTUAL TABLE IF NOT EXISTS {table} '
+                        "USING fts5(body, tokenize='unicode61 "
+                        "remove_diacritics 2', prefix='2 3 4')"
+                    )
+                elif connection.vendor == 'postgresql':
+                    cls._create_postgresql_table(cursor, connection, model)
+
+    @classmethod
+    def _create_postgresql_table(cls, cursor, connection, model):
+        name = cls.table_name(model)
+        table = connection.ops.quote_name(name)
+        cursor.execute(
+            f'CREATE TABLE IF NOT EXISTS {table} ('
+            'object_id bigint PRIMARY KEY, body text NOT NULL, '
+            "document tsvector GENERATED ALWAYS AS "
+            "(to_tsvector('simple', body)) STORED)"
+        )
+        cursor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name}_document_idx '
+            f'ON {table} USING gin (document)'
+        )
+        try:
+            with transaction.atomic(using=connection.alias):
+                cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+                cursor.execute(
+                    f'CREATE INDEX IF NOT EXISTS {name}_trgm_idx '
+                    f'ON {table} USING gin (body gin_trgm_ops)'
+                )
+        except DatabaseError:
+            # Sin permisos para la extensión se usa solo el tsvector
+            pass
+
+    # Escritura --------------------------------------------------------------
+
+    @classmethod
+    def documents(cls, model, pks=None):
+        """Genera (pk, texto) de los registros, por bloques."""
+        fields = cls.DOCUMENTS[model._meta.label_lower]
+        queryset = model._base_manager.order_by('pk')
+        if pks is not None:
+            queryset = queryset.filter(pk__in=pks)
+        for row in queryset.values_list('pk', *fields).iterator(
+            chunk_size=cls.get_config()['CHUNK_SIZE']
+        ):
+            yield row[0], ' '.join(str(value) for value in row[1:] if value)
+
+    @classmethod
+    def update(cls, model, pks):
+        """
+        Reindexa los registros indicados y los documentos dependientes.
+        Un error del índice se registra y no interrumpe la escritura.
+        """
+        pks = list(pks)
+        if not pks or cls.vendor(model) is None:
+            return
+        label = model._meta.label_lower
+        try:
+            with transaction.atomic(using=router.db_for_write(model)):
+                if label in cls.DOCUMENTS:
+                    cls._write(model, pks, cls.documents(model, pks))
+                for dependent_label, field in cls.DEPENDENTS.get(label, ()):
+                    dependent = apps.get_model(dependent_label)
+                    dependent_pks = list(
+                        dependent._base_manager.filter(
+                            **{f'{field}__in': pks}
+                        ).values_list('pk', flat=True)
+                    )
+                    if dependent_pks:
+                        cls._write(
+                            dependent, dependent_pks,
+                            cls.documents(dependent, dependent_pks)
+                        )
+        except DatabaseError as error:
+            cls._log_error(model, error)
+
+    @classmethod
+    def delete(cls, model, pks):
+        """Quita los registros del índice."""
+        pks = list(pks)
+        if not pks or not cls.is_indexed(model) or cls.vendor(model) is None:
+            return
+        try:
+            with transaction.atomic(using=router.db_for_write(model)):
+                cls._write(model, pks, ())
+        except DatabaseError as error:
+            cls._log_error(model, error)
+
+    @classmethod
+    def _write(cls, model, pks, documents):
+        """Reemplaza los documentos de pks por documents."""
+        connection = cls._connection(model)
+        table = connection.ops.quote_name(cls.table_name(model))
+        key = 'rowid' if connection.vendor == 'sqlite' else 'object_id'
+        with connection.cursor() as cursor:
+            for start in range(0, len(pks), 500):
+                chunk = pks[start:start + 500]
+                placeholders = ', '.join(['%s'] * len(chunk))
+                cursor.execute(
+                    f'DELETE FROM {table} WHERE {key} IN ({placeholders})',
+                    chunk
+                )
+            rows = list(documents)
+            if rows:
+                cursor.executemany(
+                    f'INSERT INTO {table} ({key}, body) VALUES (%s, %s)',
+                    rows
+                )
+
+    @classmethod
+    def rebuild(cls, model, progress=None):
+        """
+        Reconstruye el índice completo de un modelo.
+
+        Returns:
+            int: Documentos indexados
+        """
+        progress = progress or (lambda message: None)
+        connection = cls._connection(model)
+        cls.create_tables(connection.alias)
+        table = connection.ops.quote_name(cls.table_name(model))
+        key = 'rowid' if connection.vendor == 'sqlite' else 'object_id'
+        chunk_size = cls.get_config()['CHUNK_SIZE']
+
+        total = 0
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM {table}')
+                chunk = []
+                for document in cls.documents(model):
+                    chunk.append(document)
+                    if len(chunk) >= chunk_size:
+                        total += cls._insert(cursor, table, key, chunk)
+                        progress(f'{total} documentos indexados')
+                        chunk = []
+                total += cls._insert(cursor, table, key, chunk)
+            if connection.vendor == 'sqlite':
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"INSERT INTO {table}({table}) VALUES ('optimize')"
+                    )
+        return total
+
+    @staticmethod
+    def _insert(cursor, table, key, rows):
+        if rows:
+            cursor.executemany(
+                f'INSERT INTO {table} ({key}, body) VALUES (%s, %s)', rows
+            )
+        return len(rows)
+
+    # Consulta ---------------------------------------------------------------
+
+    @classmethod
+    def search(cls, model, term, limit=None):
+        """
+        Busca registros cuyo documento contenga todas las palabras del
+        término como prefijo, ordenados por relevancia.
+
+        Returns:
+            list de IDs, o None si el índice no está disponible
+        """
+        if not cls.is_indexed(model) or cls.vendor(model) is None:
+            return None
+        tokens = cls.tokens(term)
+        if not tokens:
+            return []
+        limit = limit or cls.get_config()['ADMIN_LIMIT']
+        connection = cls._connection(model)
+        table = connection.ops.quote_name(cls.table_name(model))
+
+        try:
+            with transaction.atomic(using=connection.alias), \
+                    connection.cursor() as cursor:
+                if connection.vendor == 'sqlite':
+                    query = ' '.join(f'"{token}"*' for token in tokens)
+                    cursor.execute(
+                        f'SELECT rowid FROM {table} WHERE {table} MATCH %s '
+                        'ORDER BY rank LIMIT %s',
+                        [query, limit]
+                    )
+                    return [row[0] for row in cursor.fetchall()]
+                return cls._search_postgresql(cursor, table, tokens, limit)
+        except DatabaseError as error:
+            cls._log_error(model, error)
+            return None
+
+    @staticmethod
+    def _search_postgresql(cursor, table, tokens, limit):
+        """tsvector por prefijo; si no hay resultados, similitud pg_trgm."""
+        query = ' & '.join(f'{token}:*' for token in tokens)
+        cursor.execute(
+            f"SELECT object_id FROM {table} "
+            f"WHERE document @@ to_tsquery('simple', %s) "
+            f"ORDER BY ts_rank(document, to_tsquery('simple', %s)) DESC "
+            f"LIMIT %s",
+            [query, query, limit]
+        )
+        ids = [row[0] for row in cursor.fetchall()]
+        term = ' '.join(tokens)
+        if ids or len(term) < 3:
+            return ids
+        try:
+            with transaction.atomic(using=cursor.db.alias):
+                cursor.execute(
+                    f'SELECT object_id FROM {table} WHERE body %% %s '
+                    f'ORDER BY similarity(body, %s) DESC LIMIT %s',
+                    [term, term, limit]
+                )
+                return [row[0] for row in cursor.fetchall()]
+        except DatabaseError:
+            # pg_trgm no instalado
+            return ids
+
+    @staticmethod
+    def _log_error(model, error):
+        log_error(
+            user=None,
+            url='N/A',
+            file_name='SearchIndex',
+            message=f'Error en el índice de {model._meta.label}: {error}'
+        )
@@ -0,0 +1,42 @@
+"""
+Mixin para ModelAdmin que resuelve la búsqueda con common.SearchIndex
+en lugar de LIKE '%x%' sobre search_fields.
+"""
+
+from django.contrib import messages
+from django.db.models import Q
+
+from common.SearchIndex import SearchIndex
+
+
+class SearchIndexAdminMixin:
+    """
+    Busca el término en el índice de texto del modelo y filtra el listado
+    por los IDs encontrados (como máximo ADMIN_LIMIT, por relevancia).
+    Si hay más resultados se avisa en el listado de que están recortados.
+    Un término numérico también busca por ID. Si el índice no está
+    disponible se usa la búsqueda de la clase siguiente.
+    """
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        limit = SearchIndex.get_config()['ADMIN_LIMIT']
+        # Un ID de más indica que el resultado está recortado
+        ids = SearchIndex.search(self.model, term, limit + 1) \
+            if term else None
+        if ids is None:
+            return super().get_search_results(request, queryset, search_term)
+
+        if len(ids) > limit:
+            ids = ids[:limit]
+            self.message_user(
+                request,
+                f'La búsqueda "{term}" tiene más de {limit} resultados; se '
+                f'muestran los {limit} más relevantes. Use un término más '
+                'específico o los filtros.',
+                messages.WARNING
+            )
+        condition = Q(pk__in=ids)
+        if term.isdigit() and len(term) < 19:
+            condition |= Q(pk=int(term))
+        return queryset.filter(condition), False
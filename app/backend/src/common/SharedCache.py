@@ -0,0 +1,96 @@
+"""
+Comprobaciones de los alias de CACHES que deben compartirse entre los
+workers. LocMemCache guarda una copia por proceso, por lo que una
+invalidación en un worker no llega a los demás.
+"""
+
+from django.conf import settings
+from django.core import checks
+
+
+class SharedCache:
+    """
+    Clase para saber si un alias de CACHES es compartido entre procesos.
+
+    Uso:
+    if SharedCache.is_shared('default'):
+        ...
+    """
+
+    LOCAL_BACKENDS = (
+        'django.core.cache.backends.locmem.LocMemCache',
+        'django.core.cache.backends.dummy.DummyCache',
+    )
+
+    @classmethod
+    def is_shared(cls, alias):
+        """True si el alias existe y no es una caché local del proceso."""
+        config = getattr(settings, 'CACHES', {}).get(alias)
+        if config is None:
+            return False
+        return config.get('BACKEND') not in cls.LOCAL_BACKENDS
+
+    @classmethod
+    def consumers(cls):
+        """
+        Funcionalidades activas que requieren una caché compartida.
+
+        Returns:
+            list de (alias, setting, descripción, consecuencia, id del
+            check)
+        """
+        from django.apps import apps
+        from common.LoginThrottle import LoginThrottle
+
+        consumers = []
+        if any(getattr(model, 'cache_by_id', False)
+               for model in apps.get_models()):
+            consumers.append((
+                getattr(settings, 'BASEMODEL_CACHE_ALIAS', 'default'),
+                'BASEMODEL_CACHE_ALIAS',
+                'La caché de BaseModel.get_by_id',
+                'No se usa y se consulta la base de datos.',
+                'common.W003',
+            ))
+        if getattr(settings, 'AUTH_USER_CACHE_TTL', 0):
+            consumers.append((
+                getattr(settings, 'AUTH_USER_CACHE_ALIAS', 'default'),
+                'AUTH_USER_CACHE_ALIAS',
+                'La caché de usuarios de EmailBackEndAuth.get_user',
+                'No se usa y se consulta la base de datos.',
+                'common.W004',
+            ))
+        throttle = LoginThrottle.get_config()
+        if throttle['ENABLED']:
+            consumers.append((
+                throttle['CACHE_ALIAS'],
+                "LOGIN_THROTTLE['CACHE_ALIAS']",
+                'El límite de intentos de login (LoginThrottle)',
+                'Cada worker cuenta por separado y el límite real es LIMIT '
+                'por el número de workers.',
+                'common.W005',
+            ))
+        return consumers
+
+    @classmethod
+    def check_caches(cls, app_configs=None, **kwargs):
+        """System check: avisa si un alias requerido no es compartido."""
+        errors = []
+        for alias, setting, feature, effect, check_id in cls.consumers():
+            if cls.is_shared(alias):
+                continue
+            errors.append(checks.Warning(
+                f"{feature} usa el alias '{alias}', que no es una caché "
+                f'compartida entre workers. {effect}',
+                hint=(
+                    f'Configure {setting} con un alias de CACHES en Redis, '
+                    'Memcached o base de datos.'
+                ),
+                id=check_id,
+            ))
+        return errors
+
+
+def check_shared_caches(app_configs=None, **kwargs):
+    """System check registrado en accounts.apps (SharedCache)."""
+    return SharedCache.check_caches()
@@ -1,2 +1,15 @@
-from .EmailBackEndAuth  import EmailBackEndAuth
-from .BaseModel import BaseModel
\ No newline at end of file
+"""
+Las clases del paquete se importan al usarlas: EmailBackEndAuth importa
+ModelBackend, que necesita el modelo de usuario registrado, y el modelo
+de usuario usa common.PrefixIndex.
+"""
+
+from importlib import import_module
+
+__all__ = ['EmailBackEndAuth', 'BaseModel']
+
+
+def __getattr__(name):
+    if name in __all__:
+        return getattr(import_module(f'{__name__}.{name}'), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -49,6 +49,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'crum.CurrentRequestUserMiddleware',  # Usuario actual para BaseModel
     'common.LicenseValidationMiddleware.LicenseValidationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
@@ -91,6 +92,19 @@ DATABASES = {
 }
 
 
+# Hashers de contraseña (common.CalibratedHashers)
+# Las iteraciones se calibran con: python manage.py calibrate_hashers
+# None usa el valor por defecto de Django. Al cambiarlas, los hashes se
+# actualizan de forma transparente en el siguiente login correcto.
+# No se lista PBKDF2PasswordHasher: usa el mismo algoritmo (pbkdf2_sha256)
+# e identify_hasher lo elegiría con las iteraciones por defecto de Django.
+PASSWORD_HASHERS = [
+    'common.CalibratedHashers.CalibratedPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+PASSWORD_PBKDF2_ITERATIONS = None
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -144,3 +158,154 @@ AUTHENTICATION_BACKENDS = [
 LOGIN_URL = '/login/'
 LOGIN_REDIRECT_URL = '/home/'
 LOGOUT_REDIRECT_URL = '/'
+
+# Perfilado de peticiones lentas (common.RequestProfiler)
+# Se perfila con cProfile una muestra de las peticiones y se guarda el perfil
+# en PROFILER_DIR cuando la respuesta supera PROFILER_THRESHOLD_MS.
+# Listar perfiles: python manage.py list_profiles
+PROFILER_ENABLED = False
+PROFILER_SAMPLE_RATE = 0.1
+PROFILER_THRESHOLD_MS = 2000
+PROFILER_DIR = BASE_DIR / 'logs' / 'profiles'
+PROFILER_TOP_FRAMES = 10
+PROFILER_MAX_FILES = 200
+
+# Registro de consultas SQL por petición (common.QueryRecorder)
+# QUERY_NPLUSONE_THRESHOLD: repeticiones de una misma consulta para reportar N+1
+# QUERY_BUDGETS: presupuesto de consultas por nombre de ruta, ej:
+#     {'accounts:profile': 10}
+# QUERY_BUDGET_STRICT: lanza QueryBudgetExceeded al superar el presupuesto;
+#     solo tiene efecto con DEBUG = True (desarrollo y pruebas), nunca en
+#     producción, donde el exceso solo se registra en el log
+QUERY_NPLUSONE_THRESHOLD = 5
+QUERY_BUDGETS = {}
+QUERY_BUDGET_STRICT = False
+
+# Niveles del logger de la aplicación (common.LoggerApp)
+# APP_LOG_LEVELS permite niveles por componente (file_name) o prefijo, ej:
+#     {'LoggingMiddleware': 'WARNING', 'accounts.views': 'DEBUG'}
+# Los niveles deshabilitados no formatean el mensaje ni acceden al usuario.
+APP_LOG_LEVEL = 'INFO'
+APP_LOG_LEVELS = {}
+
+# Envío de logs a un colector central (common.LogShippingHandler)
+# TRANSPORT: 'syslog_udp', 'syslog_tcp' o 'http' (usa URL)
+# Si el colector no responde los lotes se guardan en SPOOL_DIR hasta
+# SPOOL_MAX_BYTES y se reintentan con backoff exponencial hasta MAX_BACKOFF.
+LOG_SHIPPING = {
+    'ENABLED': False,
+    'TRANSPORT': 'syslog_udp',
+    'HOST': '127.0.0.1',
+    'PORT': 514,
+    'URL': None,
+    'BATCH_SIZE': 100,
+    'FLUSH_INTERVAL': 2.0,
+    'QUEUE_SIZE': 10000,
+    'SPOOL_DIR': BASE_DIR / 'logs' / 'spool',
+    'SPOOL_MAX_BYTES': 50 * 1024 * 1024,
+    'MAX_BACKOFF': 60.0,
+    'TIMEOUT': 5.0,
+}
+
+# Operaciones masivas del QuerySet de BaseModel (common.BaseManager)
+# soft_delete(), recover(), disable() y enable() procesan por bloques
+BASEMODEL_BULK_CHUNK_SIZE = 1000
+
+# Retención del historial de django-simple-history (common.HistoryPruner)
+# Claves: MAX_AGE_DAYS, MAX_VERSIONS, KEEP_FIRST, KEEP_LAST
+# Por modelo con su etiqueta, ej: 'accounts.License': {'MAX_VERSIONS': 20}
+# Depurar: python manage.py prune_history
+HISTORY_RETENTION = {
+    'default': {
+        'MAX_AGE_DAYS': 365,
+        'MAX_VERSIONS': 50,
+        'KEEP_FIRST': True,
+        'KEEP_LAST': True,
+    },
+}
+HISTORY_PRUNE_CHUNK_SIZE = 1000
+
+# Caché de BaseModel.get_by_id para los modelos con cache_by_id = True
+# (common.ModelCache). El alias debe apuntar a una caché compartida entre
+# workers (Redis / Memcached); con LocMemCache no se usa (check common.W003).
+BASEMODEL_CACHE_ALIAS = 'default'
+BASEMODEL_CACHE_TTL = 300
+
+# Exportación en streaming (common.ModelExporter)
+# Registros leídos por bloque con QuerySet.iterator()
+EXPORT_CHUNK_SIZE = 2000
+
+# Importación masiva de usuarios y licencias (common.AccountImporter)
+# python manage.py import_accounts usuarios.xlsx --workers 4
+IMPORT_BATCH_SIZE = 1000
+
+# Caché del usuario autenticado en EmailBackEndAuth.get_user
+# 0 la desactiva (por defecto); se invalida al guardar el usuario
+# (accounts.signals) y en update(). Solo se usa si el alias es una caché
+# compartida entre workers (Redis / Memcached), ver check common.W004.
+AUTH_USER_CACHE_ALIAS = 'default'
+AUTH_USER_CACHE_TTL = 0
+
+# Límite de intentos de login por IP y por email (common.LoginThrottle)
+# Ventana deslizante; WINDOW en segundos. CACHE_ALIAS debe ser compartido
+# entre workers (Redis / Memcached), ver check common.W005.
+LOGIN_THROTTLE = {
+    'ENABLED': True,
+    'CACHE_ALIAS': 'default',
+    'IP': {'LIMIT': 20, 'WINDOW': 60},
+    'EMAIL': {'LIMIT': 5, 'WINDOW': 300},
+}
+
+# Fotos de perfil (common.ImageRenditions y common.MediaServe)
+# Versiones cuadradas en WebP y JPEG generadas en segundo plano
+PICTURE_RENDITION_SIZES = (64, 128, 256)
+PICTURE_MAX_SIZE = 1024
+PICTURE_QUALITY = 85
+PICTURE_RENDITION_WORKERS = 2
+# Segundos que se recuerda en la caché que las versiones existen o faltan;
+# la disponibilidad se comprueba en el storage. Las fotos anteriores se
+# completan con python manage.py generate_renditions
+PICTURE_RENDITION_READY_TTL = 300
+PICTURE_RENDITION_MISSING_TTL = 60
+# Caché de archivos de MEDIA que no están nombrados por su contenido
+MEDIA_CACHE_MAX_AGE = 3600
+SERVE_MEDIA = False
+
+# Validación masiva de licencias (common.BulkLicenseValidator)
+# WORKERS: peticiones simultáneas en total; PER_HOST: por servidor
+# ADMIN_LIMIT: máximo de licencias de la acción del admin (el resto, con
+# python manage.py validate_licenses)
+LICENSE_VALIDATION = {
+    'WORKERS': 16,
+    'PER_HOST': 4,
+    'TIMEOUT': 15,
+    'BATCH_SIZE': 200,
+    'ADMIN_LIMIT': 200,
+}
+
+# Listados del admin para tablas grandes (common.LargeTableAdminMixin)
+# Sin filtros se usa la estimación del motor desde ESTIMATE_THRESHOLD filas;
+# con filtros se cuentan como máximo COUNT_LIMIT filas
+LARGE_TABLE_ADMIN = {
+    'ESTIMATE_THRESHOLD': 50000,
+    'COUNT_LIMIT': 10000,
+}
+
+# Índice de búsqueda de texto (common.SearchIndex)
+# FTS5 en SQLite, tsvector + pg_trgm en PostgreSQL; se reconstruye con
+# python manage.py rebuild_search_index
+SEARCH_INDEX = {
+    'ADMIN_LIMIT': 1000,
+    'TYPEAHEAD_LIMIT': 10,
+    'CHUNK_SIZE': 1000,
+}
+
+# Panel de licencias del admin (common.LicenseDashboard)
+# PRECOMPUTED: la página solo lee el resumen de
+# python manage.py precompute_license_dashboard (tablas muy grandes)
+LICENSE_DASHBOARD = {
+    'CACHE_ALIAS': 'default',
+    'TTL': 300,
+    'EXPIRY_DAYS': (7, 30, 90),
+    'PRECOMPUTED': False,
+}
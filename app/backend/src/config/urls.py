@@ -16,14 +16,13 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from django.conf import settings
-from django.conf.urls.static import static
 
 from accounts.views.HomeTempView import HomeTempView
+from common.MediaServe import media_urlpatterns
 
 urlpatterns = [
     path('', HomeTempView.as_view(), name='home'),
     path('', include('accounts.urls')),
     path('grappelli/', include('grappelli.urls')),
     path('admin/', admin.site.urls),
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+] + media_urlpatterns()
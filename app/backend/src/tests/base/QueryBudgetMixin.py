@@ -0,0 +1,22 @@
+import pytest
+from common.QueryRecorder import assert_max_queries
+
+
+@pytest.mark.django_db
+class QueryBudgetMixin():
+    """
+    Prueba opcional de presupuesto de consultas para las clases que
+    heredan de BaseTestView; requiere definir query_budget.
+
+    Uso:
+    class TestHomeTempView(QueryBudgetMixin, BaseTestView):
+        query_budget = 6
+    """
+
+    query_budget = None
+
+    def test_query_budget(self, client_logged, url):
+        assert self.query_budget is not None, 'Defina query_budget'
+        with assert_max_queries(self.query_budget):
+            response = client_logged.get(url)
+        assert response.status_code == 200
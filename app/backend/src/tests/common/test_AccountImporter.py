@@ -0,0 +1,121 @@
+import csv
+import io
+
+import pytest
+from django.core.management import call_command
+from openpyxl import Workbook
+
+from accounts.models import CustomUserModel, License
+from common.AccountImporter import AccountImporter
+
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        csv.writer(file).writerows(rows)
+    return path
+
+
+HEADER = ['email', 'password', 'first_name', 'profile_type',
+          'license_key', 'enterprise', 'expires_on', 'license_active']
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAccountImporter:
+
+    @pytest.fixture
+    def csv_file(self, tmp_path):
+        return write_csv(tmp_path / 'usuarios.csv', [
+            HEADER,
+            ['uno@example.com', 'clave-uno', 'Uno', 'MANAGER',
+             'KEY-1', 'ACME', '2030-01-01 00:00:00', '1'],
+            ['dos@example.com', '', 'Dos', 'REPORTS', '', '', '', ''],
+            ['mal-email', 'x', 'Malo', 'REPORTS', '', '', '', ''],
+            ['tres@example.com', 'x', 'Tres', 'NO_EXISTE', '', '', '', ''],
+            ['uno@example.com', '', '', 'MANAGER',
+             'KEY-2', 'ACME', 'no-es-fecha', '1'],
+            ['cuatro@example.com', 'x', '', 'REPORTS',
+             'KEY-1', 'ACME', '', '1'],
+            [],
+        ])
+
+    def test_imports_and_reports_row_errors(self, csv_file):
+        result = AccountImporter(csv_file, batch_size=2, workers=0).run()
+
+        assert result.rows == 6
+        assert [row for row, _ in result.errors] == [4, 5, 6]
+        assert 'email' in result.errors[0][1]
+        assert 'profile_type' in result.errors[1][1]
+        assert 'expires_on' in result.errors[2][1]
+        assert result.users_created == 3
+        assert result.licenses_created == 1
+        assert result.licenses_updated == 1
+
+        uno = CustomUserModel.objects.get(email='uno@example.com')
+        assert uno.check_password('clave-uno')
+        assert not CustomUserModel.objects.get(
+            email='dos@example.com'
+        ).has_usable_password()
+
+        # KEY-1 pasa al usuario de la última fila
+        license = License.objects.get(license_key='KEY-1')
+        assert license.user.email == 'cuatro@example.com'
+        assert license.is_active
+        assert license.history.count() == 2
+        assert list(
+            license.history.values_list('history_type', flat=True)
+        ) == ['~', '+']
+
+    def test_upsert_keeps_password_and_absent_columns(self, tmp_path):
+        user = CustomUserModel.objects.create_user(
+            email='existe@example.com', password='original',
+            last_name='Apellido'
+        )
+        path = write_csv(tmp_path / 'upsert.csv', [
+            ['email', 'first_name'],
+            ['existe@example.com', 'Nuevo'],
+        ])
+        result = AccountImporter(path, workers=0).run()
+
+        user.refresh_from_db()
+        assert result.users_updated == 1
+        assert user.first_name == 'Nuevo'
+        assert user.last_name == 'Apellido'
+        assert user.check_password('original')
+
+    def test_xlsx_with_process_pool(self, tmp_path):
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(['email', 'password', 'license_key'])
+        for number in range(6):
+            sheet.append([f'pool{number}@example.com', f'clave{number}',
+                          f'POOL-{number}'])
+        path = tmp_path / 'usuarios.xlsx'
+        workbook.save(path)
+
+        result = AccountImporter(path, batch_size=4, workers=2).run()
+
+        assert result.errors == []
+        assert result.users_created == 6
+        assert result.licenses_created == 6
+        assert CustomUserModel.objects.get(
+            email='pool5@example.com'
+        ).check_password('clave5')
+        assert License.history.filter(
+            license_key__startswith='POOL-'
+        ).count() == 6
+
+    def test_dry_run_and_command(self, csv_file, tmp_path):
+        errors_path = tmp_path / 'errores.csv'
+        out = io.StringIO()
+        call_command('import_accounts', str(csv_file), '--dry-run',
+                     '--errors', str(errors_path), stdout=out)
+        assert CustomUserModel.objects.count() == 0
+        assert 'Fila 4' in out.getvalue()
+        assert len(errors_path.read_text().splitlines()) == 4
+        assert 'Errores: 3' in out.getvalue()
+
+        out = io.StringIO()
+        call_command('import_accounts', str(csv_file), '--workers', '0',
+                     stdout=out)
+        assert CustomUserModel.objects.count() == 3
+        assert 'Errores: 3' in out.getvalue()
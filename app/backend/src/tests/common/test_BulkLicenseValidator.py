@@ -0,0 +1,219 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+
+import pytest
+from django.contrib.admin.sites import site
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.management import call_command
+from django.test import RequestFactory
+
+from accounts.models import CustomUserModel, License
+from common.BulkLicenseValidator import BulkLicenseValidator
+
+
+class _LicenseService(BaseHTTPRequestHandler):
+    """Servicio de validación: las claves OK-* son válidas."""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.arrivals.append(server.server_port)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        time.sleep(server.delay)
+        with server.lock:
+            server.active -= 1
+
+        key = self.path.rsplit('=', 1)[-1]
+        status, body = (200, b'1') if key.startswith('OK') else (404, b'0')
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def services():
+    servers = []
+    # Orden de llegada de las peticiones a todos los servidores
+    arrivals = []
+    lock = threading.Lock()
+    for _ in range(2):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _LicenseService)
+        server.lock = lock
+        server.arrivals = arrivals
+        server.active = server.max_active = 0
+        server.delay = 0.1
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+    yield servers
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def user():
+    return CustomUserModel.objects.create_user(
+        email='validacion@example.com', password='pwd'
+    )
+
+
+def create_licenses(user, services, count=20):
+    licenses = []
+    for index in range(count):
+        server = services[index % len(services)]
+        prefix = 'OK' if index % 4 else 'NO'
+        licenses.append(License(
+            user=user, license_key=f'{prefix}-{index}', is_active=True,
+            url_server=f'http://127.0.0.1:{server.server_port}/valid?key='
+        ))
+    return License.objects.bulk_create(licenses)
+
+
+@pytest.mark.django_db
+class TestBulkLicenseValidator:
+
+    def test_validates_concurrently_with_host_limit(self, user, services):
+        licenses = create_licenses(user, services)
+        messages = []
+
+        start = time.monotonic()
+        summary = BulkLicenseValidator(
+            License.objects.all(), workers=8, per_host=2,
+            progress=messages.append
+        ).run()
+        elapsed = time.monotonic() - start
+
+        assert summary['total'] == 20
+        assert summary['valid'] == 15
+        assert summary['invalid'] == 5
+        assert [server.max_active for server in services] == [2, 2]
+        # En serie serían 20 * 0.1 s; con 2 servidores x 2 son ~0.5 s
+        assert elapsed < 20 * 0.1 * 0.75
+        assert messages[-1].startswith('20/20 validadas')
+
+        saved = {obj.license_key: obj for obj in License.objects.all()}
+        assert len(saved) == len(licenses)
+        assert saved['OK-1'].last_validation_ok is True
+        assert saved['NO-0'].last_validation_ok is False
+        assert saved['NO-0'].last_validation_message == \
+            'No encontrada en el servicio externo'
+        assert all(obj.last_validated_at for obj in saved.values())
+        # El resultado no genera versiones en el historial
+        assert License.history.count() == 0
+
+    def test_hosts_in_order_share_the_pool(self, user, services):
+        first, second = services
+        licenses = []
+        # Ordenadas por servidor: primero todas las del primero
+        for server in (first, second):
+            for index in range(6):
+                licenses.append(License(
+                    user=user, license_key=f'OK-{server.server_port}-{index}',
+                    url_server=f'http://127.0.0.1:{server.server_port}'
+                               '/valid?key='
+                ))
+        License.objects.bulk_create(licenses)
+
+        summary = BulkLicenseValidator(
+            License.objects.order_by('pk'), workers=4, per_host=2
+        ).run()
+
+        assert summary['valid'] == 12
+        assert [server.max_active for server in services] == [2, 2]
+        # Los hilos no esperan al primer servidor: el segundo empieza ya
+        assert sorted(first.arrivals[:4]) == sorted(
+            [first.server_port] * 2 + [second.server_port] * 2
+        )
+
+    def test_connection_errors_are_invalid(self, user):
+        License.objects.create(
+            user=user, license_key='OK-SIN-SERVIDOR', is_active=True,
+            url_server='http://127.0.0.1:9/valid?key='
+        )
+        License.objects.create(
+            user=user, license_key='OK-SIN-URL', is_active=True
+        )
+
+        summary = BulkLicenseValidator(License.objects.all(), timeout=1).run()
+
+        assert summary['invalid'] == 2
+        messages = set(License.objects.values_list(
+            'last_validation_message', flat=True
+        ))
+        assert 'Sin URL de servidor o clave' in messages
+        assert any(message.startswith('Error de conexión')
+                   for message in messages)
+
+    def test_admin_action(self, user, services):
+        create_licenses(user, services, count=4)
+        admin_user = CustomUserModel.objects.create_superuser(
+            email='admin-validacion@example.com', password='pwd'
+        )
+        request = RequestFactory().post('/admin/accounts/license/')
+        request.user = admin_user
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        model_admin = site._registry[License]
+
+        model_admin.validate_licenses(
+            request, model_admin.get_queryset(request)
+        )
+
+        assert [str(message) for message in request._messages][0].startswith(
+            '4 licencia(s) validada(s)'
+        )
+        assert License.objects.filter(last_validation_ok=True).count() == 3
+
+    def test_admin_action_limit(self, user, services, settings):
+        create_licenses(user, services, count=4)
+        settings.LICENSE_VALIDATION = {'ADMIN_LIMIT': 3}
+        admin_user = CustomUserModel.objects.create_superuser(
+            email='admin-limite@example.com', password='pwd'
+        )
+        request = RequestFactory().post('/admin/accounts/license/')
+        request.user = admin_user
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        model_admin = site._registry[License]
+
+        model_admin.validate_licenses(
+            request, model_admin.get_queryset(request)
+        )
+
+        message = [str(message) for message in request._messages][0]
+        assert 'como máximo 3 licencias' in message
+        assert 'validate_licenses' in message
+        assert not License.objects.filter(
+            last_validated_at__isnull=False
+        ).exists()
+
+    def test_command_filters_by_user(self, user, services):
+        create_licenses(user, services, count=4)
+        other = CustomUserModel.objects.create_user(
+            email='otro@example.com', password='pwd'
+        )
+        port = services[0].server_port
+        License.objects.create(
+            user=other, license_key='OK-OTRO', is_active=True,
+            url_server=f'http://127.0.0.1:{port}/valid?key='
+        )
+        out = StringIO()
+
+        call_command(
+            'validate_licenses', '--user', 'VALIDACION@example.com',
+            stdout=out
+        )
+
+        output = out.getvalue()
+        assert '4 licencia(s) validada(s)' in output
+        assert '✗ NO-0' in output
+        assert License.objects.get(
+            license_key='OK-OTRO'
+        ).last_validated_at is None
@@ -0,0 +1,80 @@
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.contrib.auth.hashers import (
+    get_hasher, identify_hasher, make_password
+)
+from django.core.management import call_command
+
+from accounts.models import CustomUserModel
+from common.CalibratedHashers import CalibratedPBKDF2PasswordHasher
+from common.EmailBackEndAuth import EmailBackEndAuth
+
+
+class TestCalibratedHashers:
+
+    def test_preferred_hasher(self):
+        assert isinstance(get_hasher(), CalibratedPBKDF2PasswordHasher)
+
+    def test_iterations_from_settings(self, settings):
+        hasher = CalibratedPBKDF2PasswordHasher()
+        settings.PASSWORD_PBKDF2_ITERATIONS = None
+        default = hasher.iterations
+        encoded = hasher.encode('clave', hasher.salt())
+        assert not hasher.must_update(encoded)
+
+        settings.PASSWORD_PBKDF2_ITERATIONS = 1000
+        assert hasher.iterations == 1000
+        assert hasher.must_update(encoded)
+        assert hasher.verify('clave', encoded)
+        assert encoded.startswith(f'pbkdf2_sha256${default}$')
+
+    def test_calibrated_hash_is_current(self, settings):
+        settings.PASSWORD_PBKDF2_ITERATIONS = 1200000
+        encoded = make_password('x')
+        hasher = identify_hasher(encoded)
+        assert isinstance(hasher, CalibratedPBKDF2PasswordHasher)
+        assert not hasher.must_update(encoded)
+
+    def test_command_recommends_iterations(self):
+        out = StringIO()
+        with mock.patch(
+            'accounts.management.commands.calibrate_hashers.log_info'
+        ) as info:
+            call_command(
+                'calibrate_hashers', '--samples', '1',
+                '--bench-iterations', '1000', '--target-ms', '50',
+                stdout=out
+            )
+        output = out.getvalue()
+        assert 'CalibratedPBKDF2PasswordHasher (preferido)' in output
+        assert 'Recomendado para 50 ms' in output
+        assert info.called
+
+
+@pytest.mark.django_db
+class TestTransparentRehash:
+
+    def test_login_rehashes_with_new_iterations(self, settings):
+        settings.PASSWORD_PBKDF2_ITERATIONS = 1000
+        user = CustomUserModel.objects.create_user(
+            email='rehash@example.com', password='clave'
+        )
+        assert user.password.startswith('pbkdf2_sha256$1000$')
+
+        settings.PASSWORD_PBKDF2_ITERATIONS = 2000
+        with mock.patch('common.EmailBackEndAuth.log_info') as info:
+            authenticated = EmailBackEndAuth().authenticate(
+                None, username='rehash@example.com', password='clave'
+            )
+        assert authenticated == user
+        user.refresh_from_db()
+        assert user.password.startswith('pbkdf2_sha256$2000$')
+        assert info.call_count == 1
+
+        with mock.patch('common.EmailBackEndAuth.log_info') as info:
+            EmailBackEndAuth().authenticate(
+                None, username='rehash@example.com', password='clave'
+            )
+        info.assert_not_called()
@@ -0,0 +1,128 @@
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from accounts.models import CustomUserModel
+from common.EmailBackEndAuth import EmailBackEndAuth
+from common.QueryRecorder import QueryRecorder
+from common.SharedCache import SharedCache
+
+
+@pytest.mark.django_db
+class TestEmailBackEndAuth:
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self, settings, tmp_path):
+        # Caché en archivos: compartida entre procesos como Redis
+        settings.CACHES = {
+            'default': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            },
+            'shared': {
+                'BACKEND':
+                    'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': str(tmp_path / 'cache'),
+            },
+        }
+        settings.AUTH_USER_CACHE_ALIAS = 'shared'
+        settings.AUTH_USER_CACHE_TTL = 60
+        EmailBackEndAuth.get_cache().clear()
+        yield
+        EmailBackEndAuth.get_cache().clear()
+
+    @pytest.fixture
+    def user(self):
+        return CustomUserModel.objects.create_user(
+            email='backend@example.com', password='clave-1',
+            first_name='Nombre'
+        )
+
+    def _get_user(self, user_id):
+        recorder = QueryRecorder()
+        with recorder.record():
+            loaded = EmailBackEndAuth().get_user(user_id)
+        return loaded, recorder.count
+
+    def test_authenticate(self, user):
+        backend = EmailBackEndAuth()
+        assert backend.authenticate(
+            None, username='backend@example.com', password='clave-1'
+        ) == user
+        assert backend.authenticate(
+            None, username='backend@example.com', password='otra'
+        ) is None
+        assert backend.authenticate(
+            None, username='nadie@example.com', password='clave-1'
+        ) is None
+
+    def test_get_user_cached(self, user):
+        first, first_queries = self._get_user(user.pk)
+        cached, cached_queries = self._get_user(user.pk)
+        assert first_queries == 1
+        assert cached_queries == 0
+        assert cached == user
+        assert cached.first_name == 'Nombre'
+        assert cached.get_session_auth_hash() == user.get_session_auth_hash()
+
+    def test_compact_fields(self, user):
+        cached, _ = self._get_user(user.pk)
+        cached, _ = self._get_user(user.pk)
+        assert 'notes' in cached.get_deferred_fields()
+        assert 'token' in cached.get_deferred_fields()
+
+    def test_disabled(self, settings, user):
+        settings.AUTH_USER_CACHE_TTL = 0
+        self._get_user(user.pk)
+        _, queries = self._get_user(user.pk)
+        assert queries == 1
+
+    def test_local_cache_is_not_used(self, settings, user):
+        settings.AUTH_USER_CACHE_ALIAS = 'default'
+        self._get_user(user.pk)
+        _, queries = self._get_user(user.pk)
+        assert queries == 1
+        assert 'common.W004' in [
+            error.id for error in SharedCache.check_caches()
+        ]
+
+        settings.AUTH_USER_CACHE_TTL = 0
+        assert 'common.W004' not in [
+            error.id for error in SharedCache.check_caches()
+        ]
+
+    def test_invalidated_on_queryset_update(
+            self, user, django_capture_on_commit_callbacks):
+        self._get_user(user.pk)
+        with django_capture_on_commit_callbacks(execute=True):
+            CustomUserModel.objects.filter(pk=user.pk).update(is_active=False)
+        cached, queries = self._get_user(user.pk)
+        assert queries == 1
+        assert cached.is_active is False
+
+    def test_invalidated_on_save(self, user,
+                                 django_capture_on_commit_callbacks):
+        self._get_user(user.pk)
+        with django_capture_on_commit_callbacks(execute=True):
+            user.set_password('clave-2')
+            user.first_name = 'Cambiado'
+            user.save()
+        cached, queries = self._get_user(user.pk)
+        assert queries == 1
+        assert cached.first_name == 'Cambiado'
+        assert cached.check_password('clave-2')
+
+    def test_missing_user(self):
+        assert EmailBackEndAuth().get_user(999) is None
+        assert EmailBackEndAuth().get_user('no-es-id') is None
+
+    def test_password_change_logs_out_other_sessions(self, user):
+        client = Client()
+        client.force_login(user)
+        profile = reverse('accounts:profile')
+        assert client.get(profile).status_code == 200
+
+        user.set_password('clave-2')
+        user.save()
+
+        response = client.get(profile)
+        assert response.status_code == 302
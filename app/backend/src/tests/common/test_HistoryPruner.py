@@ -0,0 +1,122 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from accounts.models import CustomUserModel, License
+from common.HistoryPruner import HistoryPruner
+
+
+def retention(**policy):
+    return {'default': dict(
+        {'MAX_AGE_DAYS': None, 'MAX_VERSIONS': None,
+         'KEEP_FIRST': True, 'KEEP_LAST': True},
+        **policy
+    )}
+
+
+@pytest.mark.django_db
+class TestHistoryPruner:
+
+    @pytest.fixture
+    def license(self):
+        user = CustomUserModel.objects.create_user(
+            email='history@example.com', password='pwd'
+        )
+        license = License.objects.create(user=user, license_key='KEY-0')
+        for number in range(1, 6):
+            license.license_key = f'KEY-{number}'
+            license.save()
+        return license
+
+    def _history_ids(self, license):
+        return list(
+            license.history.order_by('history_id').values_list(
+                'history_id', flat=True
+            )
+        )
+
+    def _age_versions(self, license, count, days=400):
+        old_date = timezone.now() - timedelta(days=days)
+        ids = self._history_ids(license)[:count]
+        License.history.filter(history_id__in=ids).update(
+            history_date=old_date
+        )
+        return ids
+
+    def test_policy_per_model(self, settings):
+        settings.HISTORY_RETENTION = {
+            'default': {'MAX_VERSIONS': 10},
+            'accounts.License': {'MAX_VERSIONS': 3, 'KEEP_FIRST': False},
+        }
+        policy = HistoryPruner.get_policy(License)
+        assert policy['MAX_VERSIONS'] == 3
+        assert policy['KEEP_FIRST'] is False
+        assert policy['KEEP_LAST'] is True
+        assert HistoryPruner.get_policy(CustomUserModel)['MAX_VERSIONS'] == 10
+
+    def test_prune_by_age_keeps_first_and_last(self, settings, license):
+        settings.HISTORY_RETENTION = retention(MAX_AGE_DAYS=30)
+        ids = self._history_ids(license)
+        # Todas las versiones son antiguas
+        self._age_versions(license, len(ids))
+
+        result = HistoryPruner(License, chunk_size=2).prune()
+
+        assert result['deleted'] == 4
+        assert result['rows_before'] == 6
+        assert self._history_ids(license) == [ids[0], ids[-1]]
+
+    def test_prune_by_age_keeps_recent(self, settings, license):
+        settings.HISTORY_RETENTION = retention(
+            MAX_AGE_DAYS=30, KEEP_FIRST=False
+        )
+        ids = self._history_ids(license)
+        self._age_versions(license, 3)
+
+        HistoryPruner(License).prune()
+
+        assert self._history_ids(license) == ids[3:]
+
+    def test_prune_by_versions(self, settings, license):
+        settings.HISTORY_RETENTION = retention(MAX_VERSIONS=2)
+        ids = self._history_ids(license)
+
+        result = HistoryPruner(License, chunk_size=1).prune()
+
+        assert result['deleted'] == 3
+        assert self._history_ids(license) == [ids[0]] + ids[-2:]
+
+    def test_prune_by_versions_without_first(self, settings, license):
+        settings.HISTORY_RETENTION = retention(
+            MAX_VERSIONS=2, KEEP_FIRST=False
+        )
+        ids = self._history_ids(license)
+
+        HistoryPruner(License).prune()
+
+        assert self._history_ids(license) == ids[-2:]
+
+    def test_dry_run_deletes_nothing(self, settings, license):
+        settings.HISTORY_RETENTION = retention(MAX_VERSIONS=2)
+        messages = []
+
+        result = HistoryPruner(
+            License, dry_run=True, progress=messages.append
+        ).prune()
+
+        assert result['deleted'] == 3
+        assert len(self._history_ids(license)) == 6
+        assert messages
+
+    def test_command(self, settings, license):
+        settings.HISTORY_RETENTION = retention(MAX_VERSIONS=2)
+        out = StringIO()
+
+        call_command('prune_history', '--model', 'accounts.License',
+                     '--chunk-size', '2', stdout=out)
+
+        assert len(self._history_ids(license)) == 3
+        assert 'accounts.License: Eliminadas 3 de 6' in out.getvalue()
@@ -0,0 +1,226 @@
+from io import BytesIO, StringIO
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.template import Context, Template
+from django.test import RequestFactory
+from PIL import Image
+
+from accounts.forms.CustomUserForm import CustomUserForm
+from accounts.models import CustomUserModel
+from common.ImageRenditions import ImageRenditions
+from common.MediaServe import serve_media
+
+
+@pytest.fixture
+def media_settings(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    settings.PICTURE_RENDITION_SIZES = (64, 128)
+    settings.PICTURE_MAX_SIZE = 200
+    cache.clear()
+    yield settings
+    cache.clear()
+
+
+def jpeg_upload(size=(300, 150), orientation=None, name='foto.jpg'):
+    image = Image.new('RGB', size, (200, 30, 30))
+    exif = Image.Exif()
+    exif[0x010F] = 'Camara de prueba'
+    if orientation:
+        exif[0x0112] = orientation
+    output = BytesIO()
+    image.save(output, 'JPEG', exif=exif)
+    return SimpleUploadedFile(name, output.getvalue(), 'image/jpeg')
+
+
+class TestImageRenditions:
+
+    def test_normalize_applies_orientation_and_strips_exif(
+            self, media_settings):
+        # Orientación 6: la imagen debe rotarse 90 grados
+        result = ImageRenditions.normalize(jpeg_upload(orientation=6))
+
+        with Image.open(result) as image:
+            assert image.format == 'JPEG'
+            assert image.size == (100, 200)
+            assert not image.getexif()
+        assert len(result.name) == len('0123456789abcdef.jpg')
+
+        # El mismo contenido produce el mismo nombre
+        again = ImageRenditions.normalize(jpeg_upload(orientation=6))
+        assert again.name == result.name
+
+    def test_generate_creates_renditions(self, media_settings):
+        name = default_storage.save(
+            'accounts/pictures/abcdef0123456789.jpg',
+            ImageRenditions.normalize(jpeg_upload())
+        )
+
+        ImageRenditions.generate(name)
+
+        for size in (64, 128):
+            for image_format in ('webp', 'jpeg'):
+                target = ImageRenditions.rendition_name(
+                    name, size, image_format
+                )
+                assert target.startswith('accounts/pictures/renditions/')
+                with default_storage.open(target) as file:
+                    with Image.open(file) as image:
+                        assert image.size == (size, size)
+
+    @pytest.mark.django_db
+    def test_avatar_tag_falls_back_until_ready(self, media_settings):
+        name = default_storage.save(
+            'accounts/pictures/abcdef0123456789.jpg',
+            ImageRenditions.normalize(jpeg_upload())
+        )
+        user = CustomUserModel(email='foto@example.com', picture=name)
+        template = Template('{% load avatar %}{% avatar user 100 "r" %}')
+
+        html = template.render(Context({'user': user}))
+        assert '<picture>' not in html
+        assert f'src="/media/{name}"' in html
+
+        ImageRenditions.generate(name)
+        html = template.render(Context({'user': user}))
+        assert '<picture>' in html
+        assert 'abcdef0123456789_128.webp' in html
+        assert 'abcdef0123456789_128.jpg' in html
+
+    def test_ready_is_read_from_storage(self, media_settings):
+        name = default_storage.save(
+            'accounts/pictures/abcdef0123456789.jpg',
+            ImageRenditions.normalize(jpeg_upload())
+        )
+        picture = CustomUserModel(picture=name).picture
+        assert not ImageRenditions.is_ready(picture)
+
+        # Versiones generadas por otro worker: la caché local no lo sabe
+        ImageRenditions.generate(name)
+        cache.clear()
+        assert ImageRenditions.is_ready(picture)
+        assert ImageRenditions.url(picture, 100).endswith(
+            'renditions/abcdef0123456789_128.jpg'
+        )
+
+        # El resultado positivo queda en la caché sin volver al storage
+        with mock.patch(
+                'django.core.files.storage.FileSystemStorage.exists'
+        ) as exists:
+            assert ImageRenditions.is_ready(picture)
+        exists.assert_not_called()
+
+        # Sin el recuerdo en la caché se vuelve a comprobar el storage
+        cache.clear()
+        default_storage.delete(
+            ImageRenditions.rendition_name(name, 64, 'webp')
+        )
+        assert not ImageRenditions.is_ready(picture)
+
+    @pytest.mark.django_db
+    def test_missing_renditions_are_remembered(self, media_settings):
+        name = default_storage.save(
+            'accounts/pictures/abcdef0123456789.jpg',
+            ImageRenditions.normalize(jpeg_upload())
+        )
+        user = CustomUserModel(email='foto@example.com', picture=name)
+        template = Template('{% load avatar %}{% avatar user 100 "r" %}')
+        exists = 'django.core.files.storage.FileSystemStorage.exists'
+
+        with mock.patch(exists, return_value=False) as missing:
+            template.render(Context({'user': user}))
+            template.render(Context({'user': user}))
+        assert missing.call_count == 1
+
+        # Con versiones: una sola comprobación por etiqueta
+        ImageRenditions.generate(name)
+        ImageRenditions.forget(name)
+        with mock.patch(exists, return_value=True) as present:
+            html = template.render(Context({'user': user}))
+        assert '<picture>' in html
+        assert present.call_count == len(
+            media_settings.PICTURE_RENDITION_SIZES
+        ) * len(ImageRenditions.FORMATS)
+
+    @pytest.mark.django_db
+    def test_generate_renditions_command(self, media_settings):
+        names = [
+            default_storage.save(
+                f'accounts/pictures/{digest}.jpg',
+                ImageRenditions.normalize(jpeg_upload())
+            )
+            for digest in ('aaaa000000000000', 'bbbb000000000000')
+        ]
+        for index, name in enumerate(names):
+            CustomUserModel.objects.create_user(
+                email=f'foto{index}@example.com', password='pwd',
+                picture=name
+            )
+        CustomUserModel.objects.create_user(
+            email='sinfoto@example.com', password='pwd'
+        )
+        ImageRenditions.generate(names[0])
+        # Otro worker recordó que faltaban
+        cache.set(ImageRenditions._ready_key(names[1]), False)
+
+        out = StringIO()
+        call_command('generate_renditions', stdout=out)
+
+        assert '1 foto(s) procesada(s), 1 ya tenían versiones, 0 con ' \
+            'error' in out.getvalue()
+        for name in names:
+            assert default_storage.exists(
+                ImageRenditions.rendition_name(name, 128, 'webp')
+            )
+
+    def test_serve_media_cache_control(self, media_settings):
+        default_storage.save('a/abcdef0123456789_64.webp', SimpleUploadedFile(
+            'x.webp', b'data'
+        ))
+        default_storage.save('a/documento.pdf', SimpleUploadedFile(
+            'x.pdf', b'data'
+        ))
+        request = RequestFactory().get('/media/')
+
+        response = serve_media(
+            request, 'a/abcdef0123456789_64.webp',
+            document_root=media_settings.MEDIA_ROOT
+        )
+        assert 'immutable' in response['Cache-Control']
+        assert 'max-age=31536000' in response['Cache-Control']
+
+        response = serve_media(
+            request, 'a/documento.pdf',
+            document_root=media_settings.MEDIA_ROOT
+        )
+        assert 'immutable' not in response['Cache-Control']
+        assert 'max-age=3600' in response['Cache-Control']
+
+    @pytest.mark.django_db
+    def test_form_normalizes_and_schedules_renditions(
+            self, media_settings, django_capture_on_commit_callbacks):
+        user = CustomUserModel.objects.create_user(
+            email='perfil@example.com', password='Secreta123!'
+        )
+        form = CustomUserForm(
+            data={'first_name': 'Ana', 'last_name': 'Paz',
+                  'email': user.email, 'notes': ''},
+            files={'picture': jpeg_upload(name='foto.png')},
+            instance=user
+        )
+        assert form.is_valid(), form.errors
+
+        with mock.patch.object(ImageRenditions, '_get_executor') as executor:
+            with django_capture_on_commit_callbacks(execute=True):
+                form.save()
+
+        user.refresh_from_db()
+        assert user.picture.name.startswith('accounts/pictures/')
+        assert user.picture.name.endswith('.jpg')
+        executor.return_value.submit.assert_called_once_with(
+            ImageRenditions._generate_safe, user.picture.name
+        )
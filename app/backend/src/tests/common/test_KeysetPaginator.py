@@ -0,0 +1,113 @@
+from datetime import timedelta
+
+import pytest
+from django.http import Http404
+from django.test import RequestFactory
+from django.utils import timezone
+from django.views.generic import ListView
+
+from accounts.models import CustomUserModel, License
+from common.KeysetPaginator import (
+    InvalidCursor, KeysetPaginationMixin, KeysetPaginator
+)
+from common.QueryRecorder import QueryRecorder
+
+
+@pytest.mark.django_db
+class TestKeysetPaginator:
+
+    @pytest.fixture
+    def licenses(self):
+        user = CustomUserModel.objects.create_user(
+            email='keyset@example.com', password='pwd'
+        )
+        License.objects.bulk_create([
+            License(user=user, license_key=f'KEY-{number:02d}')
+            for number in range(7)
+        ])
+        # Dos registros con la misma fecha para probar el desempate por pk
+        same_date = timezone.now() - timedelta(days=1)
+        License.objects.filter(
+            license_key__in=['KEY-02', 'KEY-03']
+        ).update(created_at=same_date)
+        return list(License.objects.order_by('-created_at', '-pk'))
+
+    def test_walks_forward_without_gaps(self, licenses):
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            page = License.objects.keyset_page(cursor, per_page=3)
+            seen.extend(page.object_list)
+            pages += 1
+            if not page.has_next():
+                break
+            cursor = page.next_cursor
+        assert seen == licenses
+        assert pages == 3
+
+    def test_walks_backward(self, licenses):
+        first = License.objects.keyset_page(per_page=3)
+        assert not first.has_previous()
+        second = License.objects.keyset_page(first.next_cursor, per_page=3)
+        assert second.has_previous()
+
+        back = License.objects.keyset_page(
+            second.previous_cursor, per_page=3
+        )
+        assert back.object_list == first.object_list
+        assert back.has_next()
+        assert not back.has_previous()
+
+    def test_custom_ordering(self, licenses):
+        paginator = KeysetPaginator(
+            License.objects.all(), per_page=4, ordering=('license_key', 'pk')
+        )
+        first = paginator.page()
+        second = paginator.page(first.next_cursor)
+        keys = [item.license_key for item in first] + \
+            [item.license_key for item in second]
+        assert keys == sorted(item.license_key for item in licenses)
+
+    def test_single_query_per_page(self, licenses):
+        cursor = License.objects.keyset_page(per_page=3).next_cursor
+        recorder = QueryRecorder()
+        with recorder.record():
+            License.objects.alive().keyset_page(cursor, per_page=3)
+        assert recorder.count == 1
+        assert 'OFFSET' not in next(iter(recorder.shapes)).upper()
+
+    def test_invalid_cursor(self, licenses):
+        for cursor in ('no-es-un-cursor', 'e30', 'eyJ2IjpbMSwyXSwiYiI6MH0'):
+            with pytest.raises(InvalidCursor):
+                License.objects.keyset_page(cursor)
+
+    def test_keyset_index_declared(self):
+        assert any(
+            list(index.fields) == ['-created_at', '-id']
+            for index in License._meta.indexes
+        )
+
+    def test_list_view_mixin(self, licenses):
+        class LicenseListView(KeysetPaginationMixin, ListView):
+            model = License
+            paginate_by = 5
+
+        request = RequestFactory().get('/')
+        view = LicenseListView()
+        view.setup(request)
+        view.object_list = view.get_queryset()
+        context = view.get_context_data()
+        assert context['is_paginated']
+        assert list(context['object_list']) == licenses[:5]
+
+        request = RequestFactory().get(
+            '/', {'cursor': context['page_obj'].next_cursor}
+        )
+        view.setup(request)
+        context = view.get_context_data()
+        assert list(context['object_list']) == licenses[5:]
+
+        view.setup(RequestFactory().get('/', {'cursor': 'malo'}))
+        with pytest.raises(Http404):
+            view.get_context_data()
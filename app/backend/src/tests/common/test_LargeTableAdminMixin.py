@@ -0,0 +1,183 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.db.migrations.state import ModelState
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.admin import HistoricalLicenseAdmin, LicenseAdmin
+from accounts.models import CustomUserModel, License
+from common.LargeTableAdminMixin import EstimatedCountPaginator
+from common.SearchIndex import SearchIndex
+
+
+@pytest.fixture
+def admin_client(client):
+    admin_user = CustomUserModel.objects.create_superuser(
+        email='admin-tabla@example.com', password='pwd'
+    )
+    client.force_login(admin_user)
+    # La primera petición incluye la validación periódica de licencias
+    client.get(reverse('admin:index'))
+    return client
+
+
+@pytest.fixture
+def licenses(monkeypatch):
+    monkeypatch.setattr(LicenseAdmin, 'list_per_page', 10)
+    monkeypatch.setattr(HistoricalLicenseAdmin, 'list_per_page', 10)
+    user = CustomUserModel.objects.create_user(
+        email='Tabla.Grande@example.com', password='pwd'
+    )
+    now = timezone.now()
+    objs = []
+    for index in range(25):
+        obj = License.objects.create(
+            user=user, license_key=f'LIC-{index:03d}', is_active=True
+        )
+        objs.append(obj)
+    # Fechas distintas para un orden determinista
+    for index, obj in enumerate(objs):
+        License.objects.filter(pk=obj.pk).update(
+            created_at=now - timedelta(minutes=index)
+        )
+    return objs
+
+
+def result_keys(response):
+    return [obj.license_key for obj in response.context['cl'].result_list]
+
+
+@pytest.mark.django_db
+class TestLargeTableAdminMixin:
+
+    url = staticmethod(lambda: reverse('admin:accounts_license_changelist'))
+
+    def test_keyset_pages_without_offset(self, admin_client, licenses):
+        with CaptureQueriesContext(connection) as queries:
+            first = admin_client.get(self.url())
+        cl = first.context['cl']
+        assert result_keys(first) == [f'LIC-{i:03d}' for i in range(10)]
+        assert cl.keyset_page.has_next()
+        assert not any('OFFSET' in query['sql'] for query in queries)
+
+        second = admin_client.get(self.url() + cl.next_url)
+        assert result_keys(second) == [f'LIC-{i:03d}' for i in range(10, 20)]
+
+        back = admin_client.get(
+            self.url() + second.context['cl'].previous_url
+        )
+        assert result_keys(back) == result_keys(first)
+        assert 'Siguiente' in first.content.decode()
+
+    def test_filter_links_reset_cursor(self, admin_client, licenses):
+        first = admin_client.get(self.url())
+        second = admin_client.get(
+            self.url() + first.context['cl'].next_url
+        )
+        query_string = second.context['cl'].get_query_string(
+            {'is_active__exact': 1}
+        )
+        assert 'cursor' not in query_string
+
+    def test_invalid_cursor_redirects(self, admin_client, licenses):
+        response = admin_client.get(self.url(), {'cursor': 'no-es-valido'})
+        assert response.status_code == 302
+        assert 'e=1' in response['Location']
+
+    def test_column_sort_uses_page_numbers(self, admin_client, licenses):
+        response = admin_client.get(self.url(), {'o': '2'})
+        cl = response.context['cl']
+        assert cl.keyset_page is None
+        assert len(cl.result_list) == 10
+
+    def test_estimated_count_without_count_query(
+            self, admin_client, licenses, settings):
+        if connection.vendor != 'sqlite':
+            pytest.skip('Estadísticas específicas de SQLite')
+        settings.LARGE_TABLE_ADMIN = {'ESTIMATE_THRESHOLD': 1,
+                                      'COUNT_LIMIT': 5}
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = admin_client.get(self.url())
+        cl = response.context['cl']
+        assert cl.paginator.is_estimated
+        assert cl.result_count >= 1
+        assert not any(
+            'COUNT(*)' in query['sql'] and
+            'FROM "accounts_license"' in query['sql']
+            for query in queries
+        )
+
+        # Con filtros el conteo se corta en COUNT_LIMIT
+        response = admin_client.get(self.url(), {'is_active__exact': 1})
+        assert response.context['cl'].result_count == 5
+        assert response.context['cl'].paginator.is_estimated
+        assert '~5 resultados' in response.content.decode()
+
+    def test_bounded_count_is_exact_below_limit(self, licenses, settings):
+        settings.LARGE_TABLE_ADMIN = {'ESTIMATE_THRESHOLD': 10 ** 9,
+                                      'COUNT_LIMIT': 100}
+        paginator = EstimatedCountPaginator(
+            License.objects.filter(is_active=True).order_by('pk'), 10
+        )
+        assert paginator.count == 25
+        assert not paginator.is_estimated
+
+    def test_search_by_prefix(self, admin_client, licenses, monkeypatch):
+        # Sin índice de texto se busca por prefijo (LargeTableAdminMixin)
+        monkeypatch.setattr(SearchIndex, 'search', lambda *args: None)
+        with CaptureQueriesContext(connection) as queries:
+            response = admin_client.get(self.url(), {'q': 'lic-01'})
+        assert sorted(result_keys(response)) == [
+            f'LIC-{i:03d}' for i in range(10, 20)
+        ]
+        searches = [
+            query['sql'] for query in queries
+            if 'FROM "accounts_license"' in query['sql'] and
+            ' LIKE ' in query['sql']
+        ]
+        # Solo LIKE 'x%', nunca '%x%'
+        assert searches
+        assert not any("'%lic-01" in sql for sql in searches)
+
+        response = admin_client.get(self.url(), {'q': 'TABLA.GRANDE@'})
+        assert len(response.context['cl'].result_list) == 10
+
+        response = admin_client.get(self.url(), {'q': str(licenses[3].pk)})
+        assert result_keys(response) == ['LIC-003']
+
+    def test_prefix_indexes_exist(self):
+        indexes = {
+            License: 'license_key_prefix_idx',
+            License.history.model: 'histlicense_key_prefix_idx',
+            CustomUserModel: 'customuser_email_prefix_idx',
+        }
+        with connection.cursor() as cursor:
+            for model, name in indexes.items():
+                # Declarados en la Meta: makemigrations los incluye
+                state = ModelState.from_model(model)
+                assert name in [index.name for index in state.options[
+                    'indexes'
+                ]]
+                constraints = connection.introspection.get_constraints(
+                    cursor, model._meta.db_table
+                )
+                assert constraints[name]['index']
+
+    def test_history_changelist(self, admin_client, licenses):
+        url = reverse('admin:accounts_historicallicense_changelist')
+        response = admin_client.get(url)
+        cl = response.context['cl']
+        assert response.status_code == 200
+        assert len(cl.result_list) == 10
+        assert cl.keyset_page.has_next()
+
+        response = admin_client.get(url, {'q': 'lic-024'})
+        assert [
+            obj.license_key for obj in response.context['cl'].result_list
+        ] == ['LIC-024']
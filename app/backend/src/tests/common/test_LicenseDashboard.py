@@ -0,0 +1,147 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import CustomUserModel, License
+from common.LicenseDashboard import LicenseDashboard
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    LicenseDashboard.get_cache().clear()
+    yield
+    LicenseDashboard.get_cache().clear()
+
+
+@pytest.fixture
+def licenses():
+    user = CustomUserModel.objects.create_user(
+        email='panel@example.com', password='pwd'
+    )
+    now = timezone.now()
+
+    def create(key, enterprise, days=None, **kwargs):
+        return License.objects.create(
+            user=user, license_key=key, enterprise=enterprise,
+            is_active=kwargs.pop('is_active', True),
+            expires_on=now + timedelta(days=days) if days is not None
+            else None,
+            **kwargs
+        )
+
+    return [
+        create('K-SEMANA', 'KOSMOFLOWERS', days=3),
+        create('K-MES', 'KOSMOFLOWERS', days=20),
+        create('K-SIN', 'KOSMOFLOWERS'),
+        create('K-EXP', 'KOSMOFLOWERS', days=-2),
+        create('A-SEMANA', 'AGROSOL', days=5),
+        create('A-ANIO', 'AGROSOL', days=200),
+        create('A-INACTIVA', 'AGROSOL', days=4, is_active=False),
+    ]
+
+
+def queries_on_license(queries):
+    return [
+        query for query in queries
+        if 'FROM "accounts_license"' in query['sql']
+    ]
+
+
+@pytest.mark.django_db
+class TestLicenseDashboard:
+
+    def test_compute_groups_in_one_query(self, licenses):
+        with CaptureQueriesContext(connection) as queries:
+            summary = LicenseDashboard.compute()
+        assert len(queries_on_license(queries)) == 1
+        assert 'GROUP BY' in queries_on_license(queries)[0]['sql']
+
+        assert summary['total'] == 7
+        assert summary['by_status'] == {
+            'activa': 5, 'inactiva': 1, 'expirada': 1, 'eliminada': 0
+        }
+        assert summary['by_expiry'] == {
+            '7': 2, '30': 1, '90': 0, 'posterior': 1, 'sin_vencimiento': 1
+        }
+        kosmo, agro = summary['enterprises']
+        assert kosmo['enterprise'] == 'KOSMOFLOWERS'
+        assert kosmo['total'] == 4
+        assert kosmo['by_expiry']['7'] == 1
+        assert agro['by_expiry'] == {
+            '7': 1, '30': 0, '90': 0, 'posterior': 1, 'sin_vencimiento': 0
+        }
+
+    def test_cached_until_a_license_changes(self, licenses):
+        LicenseDashboard.get()
+        with CaptureQueriesContext(connection) as queries:
+            summary = LicenseDashboard.get()
+        assert queries_on_license(queries) == []
+        assert summary['by_status']['eliminada'] == 0
+
+        licenses[0].delete()
+        summary = LicenseDashboard.get()
+        assert summary['by_status']['eliminada'] == 1
+        assert not summary['stale']
+
+        License.objects.filter(pk=licenses[1].pk).update(is_active=False)
+        assert LicenseDashboard.get()['by_status']['inactiva'] == 2
+
+    def test_cascade_delete_refreshes(self, licenses):
+        assert LicenseDashboard.get()['total'] == 7
+        licenses[0].user.delete()
+        assert License.objects.count() == 0
+        assert LicenseDashboard.get()['total'] == 0
+
+    def test_refreshes_without_cache_by_id(self, licenses, monkeypatch):
+        monkeypatch.setattr(License, 'cache_by_id', False)
+        LicenseDashboard.get()
+        License.objects.filter(pk=licenses[1].pk).update(is_active=False)
+        assert LicenseDashboard.get()['by_status']['inactiva'] == 2
+        licenses[2].delete()
+        assert LicenseDashboard.get()['by_status']['eliminada'] == 1
+
+    def test_precomputed_mode_reads_snapshot(self, licenses, settings):
+        settings.LICENSE_DASHBOARD = {'PRECOMPUTED': True}
+        out = StringIO()
+        call_command('precompute_license_dashboard', stdout=out)
+        assert '7 licencias de 2 empresa(s)' in out.getvalue()
+
+        licenses[0].delete()
+        with CaptureQueriesContext(connection) as queries:
+            summary = LicenseDashboard.get()
+        assert queries_on_license(queries) == []
+        assert summary['stale']
+        assert summary['by_status']['eliminada'] == 0
+
+        call_command('precompute_license_dashboard', stdout=StringIO())
+        summary = LicenseDashboard.get()
+        assert not summary['stale']
+        assert summary['by_status']['eliminada'] == 1
+
+    def test_admin_view(self, client, licenses):
+        url = reverse('admin:accounts_license_dashboard')
+        user = CustomUserModel.objects.create_user(
+            email='staff-panel@example.com', password='pwd', is_staff=True
+        )
+        client.force_login(user)
+        assert client.get(url).status_code == 403
+
+        admin_user = CustomUserModel.objects.create_superuser(
+            email='admin-panel@example.com', password='pwd'
+        )
+        client.force_login(admin_user)
+        response = client.get(url)
+        content = response.content.decode()
+        assert response.status_code == 200
+        assert 'Próximos 7 días' in content
+        assert 'KOSMOFLOWERS' in content
+        assert '?estado=activa' in content
+
+        changelist = client.get(reverse('admin:accounts_license_changelist'))
+        assert url in changelist.content.decode()
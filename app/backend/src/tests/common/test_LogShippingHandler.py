@@ -0,0 +1,164 @@
+import json
+import logging
+import socket
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from common.LogShippingHandler import LogShippingHandler
+
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return condition()
+
+
+class _UDPCollector(socketserver.BaseRequestHandler):
+    def handle(self):
+        self.server.messages.append(self.request[0].decode('utf-8'))
+
+
+class _TCPCollector(socketserver.StreamRequestHandler):
+    def handle(self):
+        data = self.rfile.read()
+        while data:
+            length, _, rest = data.partition(b' ')
+            size = int(length)
+            self.server.messages.append(rest[:size].decode('utf-8'))
+            data = rest[size:]
+
+
+class _HTTPCollector(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.batches.append(json.loads(body))
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def logger():
+    test_logger = logging.getLogger('test_log_shipping')
+    test_logger.setLevel(logging.INFO)
+    test_logger.propagate = False
+    yield test_logger
+    for handler in list(test_logger.handlers):
+        test_logger.removeHandler(handler)
+        handler.close()
+
+
+def _serve(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+class TestLogShippingHandler:
+
+    def test_syslog_udp(self, logger):
+        server = _serve(socketserver.UDPServer(('127.0.0.1', 0),
+                                               _UDPCollector))
+        server.messages = []
+        handler = LogShippingHandler(
+            transport='syslog_udp', host='127.0.0.1',
+            port=server.server_address[1], flush_interval=0.05
+        )
+        logger.addHandler(handler)
+        logger.warning('udp %s', 'hola', extra={'app_user': 'u@x.com'})
+        handler.flush()
+        try:
+            assert _wait_for(lambda: server.messages)
+            message = server.messages[0]
+            assert message.startswith('<132>1 ')
+            payload = json.loads(message[message.index('{'):])
+            assert payload['message'] == 'udp hola'
+            assert payload['user'] == 'u@x.com'
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_http_batches(self, logger):
+        server = _serve(ThreadingHTTPServer(('127.0.0.1', 0),
+                                            _HTTPCollector))
+        server.batches = []
+        handler = LogShippingHandler(
+            transport='http',
+            url=f'http://127.0.0.1:{server.server_address[1]}/logs',
+            batch_size=10, flush_interval=0.2
+        )
+        logger.addHandler(handler)
+        for i in range(25):
+            logger.info('http %s', i)
+        handler.flush()
+        try:
+            assert handler.sent == 25
+            assert [len(batch) for batch in server.batches] == [10, 10, 5]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_spool_and_replay(self, logger, tmp_path):
+        port = _free_port()
+        handler = LogShippingHandler(
+            transport='syslog_tcp', host='127.0.0.1', port=port,
+            flush_interval=0.05, spool_dir=tmp_path, timeout=1.0
+        )
+        logger.addHandler(handler)
+        for i in range(5):
+            logger.info('spool %s', i)
+        handler.flush()
+        spool = tmp_path / LogShippingHandler.SPOOL_FILE
+        assert spool.exists()
+        assert len(spool.read_text().splitlines()) == 5
+        assert handler.sent == 0
+
+        # Un solo hilo atiende las conexiones en el orden en que llegan
+        server = _serve(socketserver.TCPServer(('127.0.0.1', port),
+                                               _TCPCollector))
+        server.messages = []
+        try:
+            # Simula el fin del backoff y un nuevo registro
+            handler._retry_at = 0.0
+            logger.info('spool final')
+            handler.flush()
+            assert _wait_for(lambda: len(server.messages) == 6)
+            messages = [json.loads(m[m.index('{'):])['message']
+                        for m in server.messages]
+            # Primero el spool en orden y después el registro nuevo
+            assert messages == [f'spool {i}' for i in range(5)] + [
+                'spool final'
+            ]
+            assert not spool.exists()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_bounded_queue_and_spool(self, logger, tmp_path):
+        handler = LogShippingHandler(
+            transport='syslog_tcp', host='127.0.0.1', port=_free_port(),
+            queue_size=1, flush_interval=5.0, spool_dir=tmp_path,
+            spool_max_bytes=10
+        )
+        logger.addHandler(handler)
+        for i in range(50):
+            logger.info('full %s', i)
+        # La cola de tamaño 1 descarta registros en lugar de bloquear
+        assert handler.dropped > 0
+
+    def test_invalid_transport(self):
+        with pytest.raises(ValueError):
+            LogShippingHandler(transport='kafka')
@@ -1,13 +1,18 @@
 import uuid
 import re
+import time
 import logging
+from unittest import mock
 from pathlib import Path
 
 import pytest
 from django.conf import settings
 from django.test import RequestFactory
 
+from accounts.models import CustomUserModel
+from accounts.views.HomeTempView import HomeTempView
 from common.LoggerApp import (
+    app_logger, is_log_enabled,
     log_info, log_warning, log_error,
     log_debug, log_critical, log_view_access
 )
@@ -83,3 +88,114 @@ class TestLoggerApp:
             with pytest.raises(RuntimeError):
                 boom_view(request)
         assert re.search(r"Error en vista boom_view: Boom!", caplog.text)
+
+    def test_component_levels(self, settings):
+        settings.APP_LOG_LEVELS = {
+            'QuietFile': 'ERROR',
+            'accounts.views': 'DEBUG',
+        }
+        assert not is_log_enabled(logging.WARNING, 'QuietFile')
+        assert is_log_enabled(logging.ERROR, 'QuietFile')
+        assert is_log_enabled(logging.DEBUG, 'accounts.views.HomeTempView')
+        assert not is_log_enabled(logging.DEBUG, 'OtherFile')
+        assert is_log_enabled(logging.INFO, 'OtherFile')
+
+    def test_disabled_level_skips_formatting(self, settings):
+        settings.APP_LOG_LEVELS = {'QuietFile': 'WARNING'}
+
+        class ExplodingUser:
+            @property
+            def email(self):
+                raise AssertionError('No debe accederse al usuario')
+
+        user = ExplodingUser()
+        log_info(
+            user=user, url='/q', file_name='QuietFile',
+            message=lambda: f"Acceso por: {user.email}"
+        )
+
+    def test_lazy_message_is_rendered(self):
+        unique = f"TEST_LAZY_{uuid.uuid4()}"
+        log_info(user='u', url='/l', file_name='LazyFile',
+                 message=lambda: unique)
+        assert any(unique in line for line in self._read_log())
+
+    def test_disabled_view_log_is_not_built(self, settings):
+        """Con el nivel deshabilitado la vista no construye el mensaje."""
+        user = CustomUserModel.objects.create_user(
+            email='vista@example.com', password='x'
+        )
+        request = RequestFactory().get('/')
+        request.user = user
+        view = HomeTempView()
+        view.setup(request)
+        message = mock.Mock(return_value='Acceso')
+
+        settings.APP_LOG_LEVELS = {'HomeTempView': 'WARNING'}
+        with mock.patch.object(
+                app_logger, '_format_log_message') as format_message:
+            view.get_context_data()
+            log_info(user=user, url='/', file_name='HomeTempView',
+                     message=message, request=request)
+        format_message.assert_not_called()
+        message.assert_not_called()
+
+        settings.APP_LOG_LEVELS = {'HomeTempView': 'INFO'}
+        log_info(user=user, url='/', file_name='HomeTempView',
+                 message=message, request=request)
+        message.assert_called_once_with()
+
+    @pytest.mark.slow
+    def test_benchmark_disabled_logging(self, settings, record_property):
+        """
+        Compara el costo del log deshabilitado en la vista principal.
+        Fuera de la ejecución por defecto: pytest -m slow
+        """
+        user = CustomUserModel.objects.create_user(
+            email='bench@example.com', password='x'
+        )
+        request = RequestFactory().get('/')
+        request.user = user
+        view = HomeTempView()
+        view.setup(request)
+        iterations = 20000
+
+        def eager():
+            # Comportamiento anterior: mensaje y formato siempre construidos
+            message = (
+                f"Acceso a página principal por: {view.request.user.email}"
+            )
+            app_logger._format_log_message(
+                view.request.user, view.request.path, 'HomeTempView',
+                message, view.request
+            )
+
+        def lazy():
+            log_info(
+                user=view.request.user,
+                url=view.request.path,
+                file_name='HomeTempView',
+                message=lambda: (
+                    f"Acceso a página principal por: "
+                    f"{view.request.user.email}"
+                ),
+                request=view.request
+            )
+
+        settings.APP_LOG_LEVELS = {'HomeTempView': 'WARNING'}
+        timings = {}
+        for name, func in (('eager', eager), ('lazy', lazy)):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                func()
+            timings[name] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(500):
+            view.get_context_data()
+        timings['view_disabled'] = time.perf_counter() - start
+
+        # Tiempos en el reporte (--junitxml) en lugar de la consola
+        for name, seconds in timings.items():
+            record_property(f'{name}_ms', round(seconds * 1000, 1))
+        assert timings['lazy'] < timings['eager']
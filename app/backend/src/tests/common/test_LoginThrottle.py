@@ -0,0 +1,174 @@
+import time
+from unittest import mock
+
+import pytest
+from django.contrib.auth.hashers import check_password
+from django.core.cache import caches
+from django.test import Client, RequestFactory
+from django.urls import reverse
+
+from accounts.models import CustomUserModel
+from accounts.views.LoginTempView import LoginTempView
+from common.LoginThrottle import LoginThrottle
+from common.SharedCache import SharedCache
+
+
+@pytest.fixture
+def throttle_settings(settings):
+    settings.LOGIN_THROTTLE = {
+        'ENABLED': True,
+        'CACHE_ALIAS': 'default',
+        'IP': {'LIMIT': 10, 'WINDOW': 60},
+        'EMAIL': {'LIMIT': 3, 'WINDOW': 60},
+    }
+    caches['default'].clear()
+    yield settings
+    caches['default'].clear()
+
+
+@pytest.fixture
+def frozen_clock():
+    """Reloj fijo para que la ventana no cambie durante la prueba."""
+    with mock.patch('common.LoginThrottle.time.time', return_value=6000.0):
+        yield
+
+
+def login_request(ip='10.0.0.1'):
+    return RequestFactory().post('/accounts/login/', REMOTE_ADDR=ip)
+
+
+class TestLoginThrottle:
+
+    def test_limits_by_email(self, throttle_settings, frozen_clock):
+        results = [
+            LoginThrottle(login_request(), 'Victima@example.com').hit()
+            for _ in range(4)
+        ]
+        assert results[:3] == [0, 0, 0]
+        assert results[3] > 0
+        # Otro email desde la misma IP sigue permitido
+        assert LoginThrottle(login_request(), 'otro@example.com').hit() == 0
+
+    def test_limits_by_ip(self, throttle_settings, frozen_clock):
+        results = [
+            LoginThrottle(login_request(), f'u{number}@example.com').hit()
+            for number in range(11)
+        ]
+        assert results[:10] == [0] * 10
+        assert results[10] > 0
+        assert LoginThrottle(
+            login_request('10.0.0.2'), 'nuevo@example.com'
+        ).hit() == 0
+
+    def test_sliding_window(self, throttle_settings):
+        start = 6000.0
+        with mock.patch('common.LoginThrottle.time.time', return_value=start):
+            for _ in range(3):
+                LoginThrottle(login_request(), 'a@example.com').hit()
+        # A mitad de la ventana siguiente aún pesa la mitad anterior (1.5)
+        with mock.patch('common.LoginThrottle.time.time',
+                        return_value=start + 90):
+            assert LoginThrottle(login_request(), 'a@example.com').hit() == 0
+            assert LoginThrottle(login_request(), 'a@example.com').hit() == 0
+            assert LoginThrottle(login_request(), 'a@example.com').hit() > 0
+        with mock.patch('common.LoginThrottle.time.time',
+                        return_value=start + 120):
+            assert LoginThrottle(login_request(), 'a@example.com').hit() == 0
+
+    def test_reset_and_disabled(self, throttle_settings, frozen_clock):
+        for _ in range(3):
+            LoginThrottle(login_request(), 'b@example.com').hit()
+        LoginThrottle(login_request(), 'b@example.com').reset_email()
+        assert LoginThrottle(login_request(), 'b@example.com').hit() == 0
+
+        throttle_settings.LOGIN_THROTTLE['ENABLED'] = False
+        for _ in range(20):
+            assert LoginThrottle(login_request(), 'b@example.com').hit() == 0
+
+    def test_block_logged_once(self, throttle_settings, frozen_clock):
+        with mock.patch('common.LoginThrottle.log_warning') as warning:
+            for _ in range(6):
+                LoginThrottle(login_request(), 'c@example.com').hit()
+        assert warning.call_count == 1
+
+    def test_warns_without_shared_cache(self, throttle_settings, tmp_path):
+        assert 'common.W005' in [
+            error.id for error in SharedCache.check_caches()
+        ]
+        throttle_settings.CACHES = {
+            'default': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            },
+            'shared': {
+                'BACKEND':
+                    'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': str(tmp_path / 'cache'),
+            },
+        }
+        throttle_settings.LOGIN_THROTTLE['CACHE_ALIAS'] = 'shared'
+        assert 'common.W005' not in [
+            error.id for error in SharedCache.check_caches()
+        ]
+
+
+@pytest.mark.django_db
+class TestLoginTempViewThrottle:
+
+    @pytest.fixture
+    def user(self):
+        return CustomUserModel.objects.create_user(
+            email='throttle@example.com', password='correcta'
+        )
+
+    def test_rejects_before_authenticate(self, throttle_settings, user,
+                                         frozen_clock):
+        client = Client()
+        url = reverse('accounts:login')
+        data = {'username': user.email, 'password': 'incorrecta'}
+        for _ in range(3):
+            assert client.post(url, data).status_code == 200
+
+        with mock.patch(
+            'common.EmailBackEndAuth.EmailBackEndAuth.authenticate'
+        ) as authenticate:
+            response = client.post(url, data)
+        assert response.status_code == 429
+        assert int(response['Retry-After']) > 0
+        authenticate.assert_not_called()
+
+    def test_success_resets_email_counter(self, throttle_settings, user,
+                                          frozen_clock):
+        client = Client()
+        url = reverse('accounts:login')
+        client.post(url, {'username': user.email, 'password': 'mal'})
+        client.post(url, {'username': user.email, 'password': 'mal'})
+        with mock.patch.object(
+            LoginTempView, 'validate_user_licenses', return_value=True
+        ):
+            response = client.post(
+                url, {'username': user.email, 'password': 'correcta'}
+            )
+        assert response.status_code == 302
+        client.logout()
+        throttle = LoginThrottle(
+            RequestFactory().post(url, REMOTE_ADDR='127.0.0.1'), user.email
+        )
+        assert throttle._attempts('EMAIL', time.time()) == 0
+
+    def test_blocked_attempts_skip_password_hashing(
+            self, throttle_settings, user, frozen_clock):
+        """Bajo ataque solo los intentos permitidos calculan el hash."""
+        client = Client()
+        url = reverse('accounts:login')
+        data = {'username': user.email, 'password': 'incorrecta'}
+
+        with mock.patch(
+            'django.contrib.auth.base_user.check_password',
+            wraps=check_password
+        ) as hashed:
+            statuses = [client.post(url, data).status_code
+                        for _ in range(30)]
+
+        assert statuses[:3] == [200] * 3
+        assert set(statuses[3:]) == {429}
+        assert hashed.call_count == 3
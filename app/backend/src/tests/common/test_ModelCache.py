@@ -0,0 +1,163 @@
+import pytest
+
+from accounts.models import CustomUserModel, License
+from accounts.views.LoginTempView import LoginTempView
+from common.ModelCache import ModelCache
+from common.QueryRecorder import QueryRecorder
+from common.SharedCache import SharedCache
+
+
+@pytest.mark.django_db
+class TestModelCache:
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self, settings, tmp_path):
+        # Caché en archivos: compartida entre procesos como Redis
+        settings.CACHES = {
+            'default': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            },
+            'shared': {
+                'BACKEND':
+                    'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': str(tmp_path / 'cache'),
+            },
+        }
+        settings.BASEMODEL_CACHE_ALIAS = 'shared'
+        ModelCache.get_cache().clear()
+        yield
+        ModelCache.get_cache().clear()
+
+    @pytest.fixture
+    def license(self):
+        user = CustomUserModel.objects.create_user(
+            email='cache@example.com', password='pwd'
+        )
+        return License.objects.create(
+            user=user, license_key='CACHE-KEY', is_active=True
+        )
+
+    def _count_queries(self, func):
+        recorder = QueryRecorder()
+        with recorder.record():
+            result = func()
+        return result, recorder.count
+
+    def test_second_lookup_hits_cache(self, license):
+        first, first_queries = self._count_queries(
+            lambda: License.get_by_id(license.pk)
+        )
+        second, second_queries = self._count_queries(
+            lambda: License.get_by_id(license.pk)
+        )
+        assert first_queries == 1
+        assert second_queries == 0
+        assert second == license
+        assert second.license_key == 'CACHE-KEY'
+        assert second.get_dirty_fields() == []
+
+    def test_compact_representation(self, license):
+        License.get_by_id(license.pk)
+        key = ModelCache.object_key(License, license.pk)
+        values = ModelCache.get_cache().get(key)
+        assert isinstance(values, tuple)
+        assert len(values) == len(License._meta.concrete_fields)
+
+    def test_save_invalidates(self, license,
+                              django_capture_on_commit_callbacks):
+        License.get_by_id(license.pk)
+        with django_capture_on_commit_callbacks(execute=True):
+            license.enterprise = 'OTRA'
+            license.save()
+        assert License.get_by_id(license.pk).enterprise == 'OTRA'
+
+    def test_soft_delete_invalidates(self, license):
+        License.get_by_id(license.pk)
+        license.delete()
+        assert License.get_by_id(license.pk) is False
+
+    def test_bulk_update_invalidates(self, license):
+        License.get_by_id(license.pk)
+        License.objects.filter(pk=license.pk).soft_delete()
+        assert License.get_by_id(license.pk) is False
+        License.objects.filter(pk=license.pk).recover()
+        License.objects.filter(pk=license.pk).update(enterprise='BULK')
+        assert License.get_by_id(license.pk).enterprise == 'BULK'
+
+    def test_write_invalidates_only_that_license(self, license):
+        other = License.objects.create(
+            user=license.user, license_key='CACHE-OTRA', is_active=True
+        )
+        License.get_by_id(license.pk)
+        License.get_by_id(other.pk)
+        version = ModelCache.get_version(License)
+
+        other.enterprise = 'OTRA'
+        other.save()
+        _, queries = self._count_queries(lambda: License.get_by_id(license.pk))
+        assert queries == 0
+        assert License.get_by_id(other.pk).enterprise == 'OTRA'
+        # La versión del modelo cambia para las cachés de agregados
+        assert ModelCache.get_version(License) != version
+
+        License.objects.bulk_update([other], ['last_validation_message'])
+        _, queries = self._count_queries(lambda: License.get_by_id(license.pk))
+        assert queries == 0
+
+    def test_local_cache_is_not_used(self, license, settings):
+        settings.BASEMODEL_CACHE_ALIAS = 'default'
+        License.get_by_id(license.pk)
+        _, queries = self._count_queries(lambda: License.get_by_id(license.pk))
+        assert queries == 1
+        assert 'common.W003' in [
+            error.id for error in SharedCache.check_caches()
+        ]
+
+        settings.BASEMODEL_CACHE_ALIAS = 'shared'
+        assert 'common.W003' not in [
+            error.id for error in SharedCache.check_caches()
+        ]
+
+    def test_license_check_reads_through_cache(self, license, mocker, rf):
+        view = LoginTempView()
+        view.request = rf.get('/')
+        validate = mocker.patch.object(
+            view, 'validate_license_with_external_service',
+            return_value=True
+        )
+        assert view.validate_user_licenses(license.user)
+        _, queries = self._count_queries(
+            lambda: view.validate_user_licenses(license.user)
+        )
+        # Solo la consulta de IDs; la licencia sale de la caché
+        assert queries == 1
+        assert validate.call_args[0][0] == license
+
+        license.deactivate()
+        assert not view.validate_user_licenses(license.user)
+
+    def test_cascade_delete_invalidates(self, license):
+        License.get_by_id(license.pk)
+        version = ModelCache.get_version(License)
+        # El usuario no es un BaseModel: el borrado en cascada no pasa
+        # por BaseModel ni BaseQuerySet
+        license.user.delete()
+        assert ModelCache.get_cache().get(
+            ModelCache.object_key(License, license.pk)
+        ) is None
+        assert ModelCache.get_version(License) != version
+
+    def test_version_survives_eviction(self, license):
+        version = ModelCache.get_version(License)
+        ModelCache.bump_version(License)
+        assert ModelCache.get_version(License) == version + 1
+        ModelCache.get_cache().delete(ModelCache.version_key(License))
+        assert ModelCache.get_version(License) not in (version, version + 1)
+
+    def test_missing_and_invalid_ids(self, license):
+        assert License.get_by_id(license.pk + 100) is False
+        assert License.get_by_id('no-es-id') is False
+
+    def test_opt_in(self):
+        assert License.cache_by_id is True
+        assert CustomUserModel.__dict__.get('cache_by_id') is None
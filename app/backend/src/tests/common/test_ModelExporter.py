@@ -0,0 +1,151 @@
+import csv
+import io
+import json
+
+import pytest
+from django.contrib.auth.models import Permission
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+from openpyxl import load_workbook
+
+from accounts.models import CustomUserModel, License
+from common.ModelExporter import ModelExporter
+from common.QueryRecorder import QueryRecorder
+
+
+@pytest.mark.django_db
+class TestModelExporter:
+
+    @pytest.fixture
+    def licenses(self):
+        user = CustomUserModel.objects.create_user(
+            email='export@example.com', password='pwd'
+        )
+        License.objects.bulk_create([
+            License(user=user, license_key=f'EXP-{number}', is_active=True)
+            for number in range(5)
+        ])
+        License.objects.filter(license_key='EXP-4').soft_delete()
+        return License.objects.order_by('pk')
+
+    def _read_csv(self, content):
+        return list(csv.reader(io.StringIO(content)))
+
+    def test_csv_with_fields_and_state(self, licenses):
+        exporter = ModelExporter(
+            licenses, 'csv', fields=['id', 'license_key', 'user'],
+            state='alive'
+        )
+        content = b''.join(exporter.stream()).decode('utf-8')
+        rows = self._read_csv(content)
+        assert rows[0] == ['id', 'license_key', 'user_id']
+        assert [row[1] for row in rows[1:]] == [
+            'EXP-0', 'EXP-1', 'EXP-2', 'EXP-3'
+        ]
+
+    def test_jsonl(self, licenses):
+        exporter = ModelExporter(licenses, 'jsonl', state='deleted')
+        lines = b''.join(exporter.stream()).decode('utf-8').splitlines()
+        assert len(lines) == 1
+        item = json.loads(lines[0])
+        assert item['license_key'] == 'EXP-4'
+        assert item['is_deleted'] is True
+        assert 'created_at' in item
+
+    def test_xlsx_write_only(self, licenses):
+        output = io.BytesIO()
+        count = ModelExporter(
+            licenses, 'xlsx', fields=['license_key', 'created_at']
+        ).write(output)
+        assert count == 5
+        output.seek(0)
+        sheet = load_workbook(output, read_only=True).active
+        rows = list(sheet.values)
+        assert rows[0] == ('license_key', 'created_at')
+        assert len(rows) == 6
+
+    def test_reads_in_chunks(self, licenses):
+        exporter = ModelExporter(licenses, 'csv', chunk_size=2)
+        recorder = QueryRecorder()
+        with recorder.record():
+            stream = exporter.stream()
+            next(stream)
+            assert recorder.count == 0
+            list(stream)
+        # Un solo cursor, sin instanciar modelos
+        assert recorder.count == 1
+
+    def test_invalid_arguments(self, licenses):
+        with pytest.raises(ValueError):
+            ModelExporter(licenses, 'pdf')
+        with pytest.raises(ValueError):
+            ModelExporter(licenses, fields=['no_existe'])
+        with pytest.raises(ValueError):
+            ModelExporter(CustomUserModel.objects.all(), state='alive')
+
+    def test_command_stdout_and_file(self, licenses, tmp_path):
+        out = io.StringIO()
+        call_command(
+            'export_model', 'accounts.License', '--fields',
+            'license_key', '--state', 'alive', stdout=out,
+            stderr=io.StringIO()
+        )
+        assert len(self._read_csv(out.getvalue())) == 5
+
+        output = tmp_path / 'licencias.xlsx'
+        out = io.StringIO()
+        call_command(
+            'export_model', 'accounts.License', '--format', 'xlsx',
+            '--output', str(output), stdout=out
+        )
+        assert '5 registros' in out.getvalue()
+        assert output.stat().st_size > 0
+
+        with pytest.raises(CommandError):
+            call_command('export_model', 'accounts.License',
+                         '--format', 'xlsx')
+        with pytest.raises(CommandError):
+            call_command('export_model', 'accounts.NoExiste')
+
+    def test_admin_action_streams(self, licenses, client):
+        admin = CustomUserModel.objects.create_superuser(
+            email='admin-export@example.com', password='pwd'
+        )
+        client.force_login(admin)
+        url = reverse('admin:accounts_license_changelist')
+        response = client.post(url, {
+            'action': 'export_csv',
+            '_selected_action': [item.pk for item in licenses],
+        })
+        assert response.status_code == 200
+        assert response.streaming
+        content = b''.join(response.streaming_content).decode('utf-8')
+        assert len(self._read_csv(content)) == 6
+
+        response = client.post(url, {
+            'action': 'export_xlsx',
+            '_selected_action': [item.pk for item in licenses],
+        })
+        assert response.status_code == 200
+        assert 'attachment' in response['Content-Disposition']
+
+    def test_admin_action_requires_export_permission(self, licenses, client):
+        viewer = CustomUserModel.objects.create_user(
+            email='viewer-export@example.com', password='pwd', is_staff=True
+        )
+        viewer.user_permissions.add(Permission.objects.get(
+            codename='view_license', content_type__app_label='accounts'
+        ))
+        client.force_login(viewer)
+        url = reverse('admin:accounts_license_changelist')
+
+        response = client.get(url)
+        assert response.status_code == 200
+        assert 'export_csv' not in response.content.decode()
+
+        response = client.post(url, {
+            'action': 'export_csv',
+            '_selected_action': [item.pk for item in licenses],
+        })
+        assert not response.streaming
+        assert 'Content-Disposition' not in response
@@ -0,0 +1,101 @@
+import pytest
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+
+from accounts.models import CustomUserModel
+from common.QueryRecorder import (
+    QueryRecorder, QueryMetrics, QueryBudgetExceeded, assert_max_queries
+)
+
+
+@pytest.mark.django_db
+class TestQueryRecorder:
+
+    data = {
+        'first_name': 'Query',
+        'last_name': 'Recorder',
+        'email': 'query0@example.com',
+        'notes': ''
+    }
+
+    @pytest.fixture
+    def users(self):
+        return [
+            CustomUserModel.objects.create_user(
+                email=f'query{i}@example.com', password='x'
+            )
+            for i in range(6)
+        ]
+
+    def test_normalize_removes_literals(self):
+        first = QueryRecorder.normalize(
+            "SELECT * FROM t WHERE id = 1 AND name = 'a'"
+        )
+        second = QueryRecorder.normalize(
+            "SELECT *   FROM t WHERE id = 25 AND name = 'b''c'"
+        )
+        assert first == second
+        assert QueryRecorder.normalize(
+            'SELECT * FROM t WHERE id IN (%s, %s, %s)'
+        ) == 'SELECT * FROM t WHERE id IN (...)'
+
+    def test_counts_queries_and_detects_duplicates(self, users):
+        recorder = QueryRecorder()
+        with recorder.record():
+            for user in users:
+                CustomUserModel.objects.get(pk=user.pk)
+        assert recorder.count == len(users)
+        assert recorder.duration >= 0
+        duplicates = recorder.duplicates()
+        assert len(duplicates) == 1
+        assert duplicates[0][1] == len(users)
+
+    def test_record_single_connection(self, users):
+        recorder = QueryRecorder()
+        with recorder.record(using=connection.alias):
+            list(CustomUserModel.objects.all())
+        assert recorder.count == 1
+
+    def test_assert_max_queries(self, users):
+        with assert_max_queries(1):
+            list(CustomUserModel.objects.all())
+
+        with pytest.raises(QueryBudgetExceeded):
+            with assert_max_queries(2):
+                for user in users:
+                    CustomUserModel.objects.get(pk=user.pk)
+
+        with pytest.raises(QueryBudgetExceeded):
+            with assert_max_queries(10, allow_duplicates=False):
+                for user in users:
+                    CustomUserModel.objects.get(pk=user.pk)
+
+    def test_middleware_headers_and_metrics(self, settings, users):
+        settings.DEBUG = True
+        QueryMetrics.reset()
+        client = Client()
+        client.force_login(users[0])
+        response = client.post(reverse('accounts:profile_edit'), self.data)
+        assert int(response['X-DB-Query-Count']) >= 1
+        assert response['X-DB-Duplicate-Queries'] == '0'
+        metrics = QueryMetrics.snapshot()
+        assert metrics['accounts:profile_edit']['requests'] == 1
+
+    def test_middleware_strict_budget(self, settings, users):
+        settings.QUERY_BUDGETS = {'accounts:profile_edit': 0}
+        settings.QUERY_BUDGET_STRICT = True
+        settings.DEBUG = True
+        client = Client()
+        client.force_login(users[0])
+        with pytest.raises(QueryBudgetExceeded):
+            client.post(reverse('accounts:profile_edit'), self.data)
+
+    def test_strict_budget_ignored_without_debug(self, settings, users):
+        settings.QUERY_BUDGETS = {'accounts:profile_edit': 0}
+        settings.QUERY_BUDGET_STRICT = True
+        settings.DEBUG = False
+        client = Client()
+        client.force_login(users[0])
+        response = client.post(reverse('accounts:profile_edit'), self.data)
+        assert response.status_code < 500
@@ -0,0 +1,65 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.test import Client
+
+from accounts.models import CustomUserModel
+from common.RequestProfiler import RequestProfiler
+
+
+@pytest.mark.django_db
+class TestRequestProfiler:
+
+    @pytest.fixture
+    def profiler_settings(self, settings, tmp_path):
+        settings.PROFILER_ENABLED = True
+        settings.PROFILER_SAMPLE_RATE = 1.0
+        settings.PROFILER_THRESHOLD_MS = -1
+        settings.PROFILER_DIR = tmp_path
+        return settings
+
+    @pytest.fixture
+    def client_logged(self):
+        user = CustomUserModel.objects.create_user(
+            email='profiler@example.com', password='pass12345'
+        )
+        client = Client()
+        client.force_login(user)
+        return client
+
+    def test_disabled_by_default_sampling(self, settings):
+        settings.PROFILER_ENABLED = False
+        assert RequestProfiler().should_profile() is False
+
+    def test_slow_request_saves_profile(self, profiler_settings,
+                                        client_logged):
+        response = client_logged.get(reverse('home'))
+        assert response.status_code == 200
+
+        profiles = RequestProfiler().list_profiles()
+        assert len(profiles) == 1
+        meta = profiles[0]
+        assert meta['url'] == reverse('home')
+        assert meta['top_frames']
+        assert (profiler_settings.PROFILER_DIR /
+                (meta['request_id'] + '.prof')).exists()
+
+    def test_max_files_is_enforced(self, profiler_settings, client_logged):
+        profiler_settings.PROFILER_MAX_FILES = 2
+        for _ in range(4):
+            client_logged.get(reverse('home'))
+        assert len(RequestProfiler().list_profiles()) == 2
+
+    def test_list_profiles_command(self, profiler_settings, client_logged):
+        client_logged.get(reverse('home'))
+        request_id = RequestProfiler().list_profiles()[0]['request_id']
+
+        out = StringIO()
+        call_command('list_profiles', stdout=out)
+        assert request_id in out.getvalue()
+
+        out = StringIO()
+        call_command('list_profiles', show=request_id, stdout=out)
+        assert 'function calls' in out.getvalue()
@@ -0,0 +1,199 @@
+import csv
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import CustomUserModel, License
+from common.AccountImporter import AccountImporter
+from common.SearchIndex import SearchIndex
+
+
+@pytest.fixture
+def user():
+    return CustomUserModel.objects.create_user(
+        email='ana.perez@example.com', password='pwd',
+        first_name='Ana', last_name='Pérez'
+    )
+
+
+@pytest.fixture
+def licenses(user):
+    return [
+        License.objects.create(
+            user=user, license_key='KF-2024-0001', enterprise='KOSMOFLOWERS',
+            notes='Servidor principal de Quito'
+        ),
+        License.objects.create(
+            user=user, license_key='AG-2024-0002', enterprise='AGROSOL',
+            notes='Finca norte'
+        ),
+    ]
+
+
+def search_keys(term):
+    ids = SearchIndex.search(License, term)
+    return sorted(License.objects.filter(pk__in=ids).values_list(
+        'license_key', flat=True
+    ))
+
+
+@pytest.mark.django_db
+class TestSearchIndex:
+
+    def test_search_by_prefix_across_fields(self, licenses):
+        assert search_keys('kosmo') == ['KF-2024-0001']
+        assert search_keys('quito princ') == ['KF-2024-0001']
+        assert search_keys('agro') == ['AG-2024-0002']
+        # Datos del usuario y sin distinguir acentos
+        assert search_keys('perez') == ['AG-2024-0002', 'KF-2024-0001']
+        assert search_keys('ana.perez@example') == [
+            'AG-2024-0002', 'KF-2024-0001'
+        ]
+        assert search_keys('inexistente') == []
+        assert SearchIndex.search(License, '  ') == []
+
+    def test_search_reads_only_the_index(self, licenses):
+        with CaptureQueriesContext(connection) as queries:
+            SearchIndex.search(License, 'kosmo')
+        sql = ' '.join(query['sql'] for query in queries)
+        assert 'accounts_license_search' in sql
+        assert 'FROM "accounts_license" ' not in sql
+        assert ' LIKE ' not in sql
+
+    def test_kept_in_sync_on_save_update_and_delete(self, user, licenses):
+        first, second = licenses
+        first.enterprise = 'ROSAS DEL VALLE'
+        first.save()
+        assert search_keys('rosas') == ['KF-2024-0001']
+        assert search_keys('kosmo') == []
+
+        License.objects.filter(pk=second.pk).update(notes='Bodega sur')
+        assert search_keys('bodega') == ['AG-2024-0002']
+
+        # Cambiar el usuario reindexa sus licencias
+        user.last_name = 'Gómez'
+        user.save()
+        assert search_keys('gomez') == ['AG-2024-0002', 'KF-2024-0001']
+
+        # El soft delete conserva el documento (el admin lista eliminadas)
+        second.delete()
+        assert search_keys('bodega') == ['AG-2024-0002']
+        License.objects.filter(pk=second.pk).delete()
+        assert search_keys('bodega') == []
+
+    def test_user_queryset_update_reindexes(self, user, licenses):
+        CustomUserModel.objects.filter(pk=user.pk).update(
+            email='nuevo.correo@example.com'
+        )
+        assert SearchIndex.search(CustomUserModel, 'nuevo') == [user.pk]
+        assert search_keys('nuevo.correo') == [
+            'AG-2024-0002', 'KF-2024-0001'
+        ]
+
+        with mock.patch.object(SearchIndex, 'update') as update:
+            CustomUserModel.objects.filter(pk=user.pk).update(
+                last_login=None
+            )
+        update.assert_not_called()
+
+    def test_login_does_not_reindex(self, user):
+        with mock.patch.object(SearchIndex, 'update') as update:
+            user.save(update_fields=['last_login'])
+            License.objects.filter(user=user).update(is_active=True)
+        update.assert_not_called()
+
+    def test_import_indexes_rows(self, tmp_path):
+        path = tmp_path / 'cuentas.csv'
+        with open(path, 'w', newline='') as file:
+            csv.writer(file).writerows([
+                ['email', 'first_name', 'license_key', 'enterprise'],
+                ['nuevo@example.com', 'Importado', 'IMP-1', 'FLORES SA'],
+            ])
+        AccountImporter(path, workers=0).run()
+
+        assert search_keys('flores') == ['IMP-1']
+        assert search_keys('importado') == ['IMP-1']
+        user_ids = SearchIndex.search(CustomUserModel, 'importado')
+        assert list(CustomUserModel.objects.filter(
+            pk__in=user_ids
+        ).values_list('email', flat=True)) == ['nuevo@example.com']
+
+    def test_rebuild_command(self, licenses):
+        table = SearchIndex.table_name(License)
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM "{table}"')
+        assert search_keys('kosmo') == []
+
+        out = StringIO()
+        call_command('rebuild_search_index', '--model', 'accounts.License',
+                     stdout=out)
+        assert 'accounts.License: 2 documentos indexados' in out.getvalue()
+        assert search_keys('kosmo') == ['KF-2024-0001']
+
+    def test_admin_search_uses_index(self, client, licenses):
+        admin_user = CustomUserModel.objects.create_superuser(
+            email='admin-busqueda@example.com', password='pwd'
+        )
+        client.force_login(admin_user)
+
+        response = client.get(
+            reverse('admin:accounts_license_changelist'), {'q': 'finca'}
+        )
+        assert [
+            obj.license_key for obj in response.context['cl'].result_list
+        ] == ['AG-2024-0002']
+
+        response = client.get(
+            reverse('admin:accounts_customusermodel_changelist'),
+            {'q': 'ana pe'}
+        )
+        assert [
+            obj.email for obj in response.context['cl'].result_list
+        ] == ['ana.perez@example.com']
+
+    def test_admin_search_warns_when_capped(
+            self, client, licenses, settings):
+        settings.SEARCH_INDEX = {'ADMIN_LIMIT': 1}
+        admin_user = CustomUserModel.objects.create_superuser(
+            email='admin-limite@example.com', password='pwd'
+        )
+        client.force_login(admin_user)
+        url = reverse('admin:accounts_license_changelist')
+
+        response = client.get(url, {'q': 'perez'})
+        assert len(response.context['cl'].result_list) == 1
+        assert 'más de 1 resultados' in response.content.decode()
+
+        response = client.get(url, {'q': 'finca'})
+        assert 'más de 1 resultados' not in response.content.decode()
+
+    def test_typeahead(self, client, user, licenses):
+        url = reverse('accounts:search_typeahead')
+        client.force_login(user)
+        assert client.get(url, {'q': 'kosmo'}).status_code == 403
+
+        admin_user = CustomUserModel.objects.create_superuser(
+            email='admin-typeahead@example.com', password='pwd'
+        )
+        client.force_login(admin_user)
+        data = client.get(url, {'q': 'kosmo'}).json()
+        assert data['results'] == [{
+            'id': licenses[0].pk,
+            'label': 'KF-2024-0001 - ana.perez@example.com',
+            'url': reverse(
+                'admin:accounts_license_change', args=[licenses[0].pk]
+            ),
+        }]
+
+        data = client.get(url, {'q': 'ana', 'type': 'user'}).json()
+        assert [item['email'] for item in data['results']] == [
+            'ana.perez@example.com'
+        ]
+        assert client.get(url, {'q': 'k'}).json() == {'results': []}
+        assert client.get(url, {'q': 'ana', 'type': 'otro'}).status_code \
+            == 400
@@ -0,0 +1,203 @@
+import pytest
+from crum import impersonate, set_current_request
+from django.test import RequestFactory
+
+from accounts.models import CustomUserModel, License
+from common.QueryRecorder import QueryRecorder
+
+
+@pytest.mark.django_db
+class TestBaseModel:
+
+    @pytest.fixture
+    def user(self):
+        return CustomUserModel.objects.create_user(
+            email='basemodel@example.com', password='pwd'
+        )
+
+    @pytest.fixture
+    def licenses(self, user):
+        alive = License.objects.create(
+            user=user, license_key='ALIVE', is_active=True
+        )
+        inactive = License.objects.create(
+            user=user, license_key='INACTIVE', is_active=False
+        )
+        deleted = License.objects.create(
+            user=user, license_key='DELETED', is_active=True,
+            is_deleted=True
+        )
+        return alive, inactive, deleted
+
+    def test_queryset_filters_are_chainable(self, user, licenses):
+        alive, inactive, deleted = licenses
+        assert list(License.objects.alive()) == [alive]
+        assert list(License.objects.deleted()) == [deleted]
+        assert list(License.objects.inactive()) == [inactive]
+        assert list(
+            License.objects.filter(user=user).alive().filter(
+                license_key__startswith='AL'
+            )
+        ) == [alive]
+
+    def test_alive_manager_for_related_lookups(self, user, licenses):
+        alive, _, _ = licenses
+        assert user.licenses.count() == 3
+        assert list(user.licenses(manager='alive_objects').all()) == [alive]
+        assert list(License.alive_objects.select_related('user')) == [alive]
+
+    def test_classmethods_use_alive_filter(self, licenses):
+        alive, inactive, deleted = licenses
+        assert License.get_by_id(alive.pk) == alive
+        assert License.get_by_id(deleted.pk) is False
+        assert list(License.get_all()) == [alive]
+        assert list(License.get_by_field('license_key', 'INACTIVE')) == []
+        assert list(License.get_deleted()) == [deleted]
+        assert list(License.get_not_active()) == [inactive]
+
+    def test_alive_index_declared(self):
+        assert any(
+            list(index.fields) == ['is_active', 'is_deleted']
+            for index in License._meta.indexes
+        )
+        assert not [e for e in License.check() if e.id == 'common.W001']
+
+    def test_bulk_soft_delete_creates_history(self, user):
+        License.objects.bulk_create([
+            License(user=user, license_key=f'BULK-{i}', is_active=True)
+            for i in range(25)
+        ])
+        queryset = License.objects.filter(license_key__startswith='BULK-')
+
+        recorder = QueryRecorder()
+        with impersonate(user), recorder.record():
+            updated = queryset.soft_delete(chunk_size=10)
+
+        # Un UPDATE y un INSERT de historial por bloque de 10
+        statements = [sql.split()[0] for sql in recorder.shapes.elements()]
+        assert statements.count('UPDATE') == 3
+        assert statements.count('INSERT') == 3
+        assert updated == 25
+        assert License.objects.deleted().count() == 25
+        assert set(
+            License.objects.values_list('id_user_updated', flat=True)
+        ) == {user.pk}
+        history = License.history.filter(history_type='~')
+        assert history.count() == 25
+        assert all(row.is_deleted for row in history)
+        assert {row.history_user_id for row in history} == {user.pk}
+
+    def test_bulk_state_transitions(self, licenses):
+        alive, inactive, deleted = licenses
+        assert License.objects.all().disable() == 2
+        assert License.objects.inactive().count() == 3
+        assert License.objects.all().enable() == 3
+        assert License.objects.all().recover() == 1
+        assert License.objects.alive().count() == 3
+        # Los registros sin cambios no generan historial
+        assert License.objects.all().enable() == 0
+
+    def test_bulk_methods_not_on_manager(self):
+        assert not hasattr(License.objects, 'soft_delete')
+        assert not hasattr(License.objects, 'disable')
+
+    def test_with_audit_users_single_query(self, user):
+        other = CustomUserModel.objects.create_user(
+            email='updater@example.com', password='pwd'
+        )
+        License.objects.bulk_create([
+            License(user=user, license_key=f'AUDIT-{i}',
+                    id_user_created=user.pk, id_user_updated=other.pk)
+            for i in range(10)
+        ])
+
+        recorder = QueryRecorder()
+        with recorder.record():
+            licenses = list(License.objects.with_audit_users())
+            creators = {lic.get_create_user() for lic in licenses}
+            updaters = {lic.get_update_user() for lic in licenses}
+        # Una consulta de licencias y una de usuarios
+        assert recorder.count == 2
+        assert creators == {user}
+        assert updaters == {other}
+
+    def test_audit_users_identity_map_per_request(self, user):
+        license_obj = License.objects.create(
+            user=user, license_key='IDENTITY', id_user_created=user.pk,
+            id_user_updated=user.pk
+        )
+        set_current_request(RequestFactory().get('/'))
+        try:
+            recorder = QueryRecorder()
+            with recorder.record():
+                assert license_obj.get_create_user() == user
+                assert license_obj.get_update_user() == user
+                assert License.objects.with_audit_users().get(
+                    pk=license_obj.pk
+                ).get_create_user() == user
+            # Usuario consultado una sola vez + consulta de la licencia
+            assert recorder.count == 2
+        finally:
+            set_current_request(None)
+
+    def test_audit_user_anonymous(self, user):
+        license_obj = License.objects.create(user=user, license_key='ANON')
+        assert license_obj.id_user_created == 0
+        assert license_obj.get_create_user() is None
+
+    def test_save_without_changes_skips_update(self, user):
+        license_obj = License.objects.create(user=user, license_key='DIRTY')
+        license_obj = License.objects.get(pk=license_obj.pk)
+        history_count = license_obj.history.count()
+
+        recorder = QueryRecorder()
+        with recorder.record():
+            license_obj.save()
+            # License se crea inactiva por defecto
+            license_obj.disable()
+        assert recorder.count == 0
+        assert license_obj.history.count() == history_count
+
+    def test_save_writes_only_dirty_fields(self, user):
+        license_obj = License.objects.create(user=user, license_key='PART')
+        license_obj = License.objects.get(pk=license_obj.pk)
+        assert license_obj.get_dirty_fields() == []
+
+        license_obj.notes = 'nota'
+        assert license_obj.get_dirty_fields() == ['notes']
+
+        recorder = QueryRecorder()
+        with recorder.record():
+            license_obj.save()
+        update = next(
+            sql for sql in recorder.shapes if sql.startswith('UPDATE')
+        )
+        assert '"notes"' in update
+        assert '"updated_at"' in update
+        assert '"license_key"' not in update
+        assert license_obj.get_dirty_fields() == []
+        assert license_obj.history.first().notes == 'nota'
+
+    def test_transitions_write_state_and_audit_fields(self, user):
+        license_obj = License.objects.create(
+            user=user, license_key='STATE', is_active=True
+        )
+        recorder = QueryRecorder()
+        with impersonate(user), recorder.record():
+            license_obj.disable()
+        update = next(
+            sql for sql in recorder.shapes if sql.startswith('UPDATE')
+        )
+        assert '"is_active"' in update
+        assert '"id_user_updated"' in update
+        assert '"notes"' not in update
+        license_obj.refresh_from_db()
+        assert license_obj.is_active is False
+        assert license_obj.id_user_updated == user.pk
+
+    def test_partial_update_fields_keep_other_changes_dirty(self, user):
+        license_obj = License.objects.create(user=user, license_key='KEEP')
+        license_obj.notes = 'a'
+        license_obj.enterprise = 'OTRA'
+        license_obj.save(update_fields=['notes'])
+        assert license_obj.get_dirty_fields() == ['enterprise']
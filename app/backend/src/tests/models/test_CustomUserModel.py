@@ -1,6 +1,18 @@
+import csv
+from datetime import timedelta
+
 import pytest
-from django.db import IntegrityError
+from django.contrib.admin.sites import site
+from django.core.exceptions import ValidationError
+from django.db import connection, IntegrityError, transaction
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from accounts.models import License
 from accounts.models.CustomUserModel import CustomUserModel
+from common.AccountImporter import AccountImporter
+from common.EmailBackEndAuth import EmailBackEndAuth
 
 
 @pytest.mark.django_db
@@ -56,3 +68,149 @@ class TestCustomUserModel:
             email='str@example.com', password='pwd'
         )
         assert str(user) == 'str@example.com'
+
+
+@pytest.mark.django_db
+class TestCustomUserModelEmail:
+
+    @pytest.fixture
+    def user(self):
+        return CustomUserModel.objects.create_user(
+            email='Mixed.Case@Example.com', password='clave'
+        )
+
+    def test_authenticate_ignores_case(self, user):
+        backend = EmailBackEndAuth()
+        for username in ('mixed.case@example.com', 'MIXED.CASE@EXAMPLE.COM'):
+            assert backend.authenticate(
+                None, username=username, password='clave'
+            ) == user
+
+    def test_get_and_natural_key_ignore_case(self, user):
+        assert CustomUserModel.get('mixed.case@EXAMPLE.com') == user
+        assert CustomUserModel.objects.get_by_natural_key(
+            'MIXED.case@example.com'
+        ) == user
+        assert CustomUserModel.get('otro@example.com') is None
+
+    def test_unique_ignoring_case(self, user):
+        with pytest.raises(IntegrityError), transaction.atomic():
+            CustomUserModel.objects.create_user(
+                email='mixed.case@example.com', password='clave'
+            )
+        duplicate = CustomUserModel(email='MIXED.CASE@example.com')
+        with pytest.raises(ValidationError):
+            duplicate.validate_constraints()
+
+    def test_lookup_uses_index(self, user):
+        if connection.vendor != 'sqlite':
+            pytest.skip('Plan de consulta específico de SQLite')
+        queryset = CustomUserModel.objects.filter(
+            email__lower='mixed.case@example.com'
+        )
+        plan = queryset.explain()
+        assert 'customusermodel_email_ci_uniq' in plan
+        assert 'SCAN' not in plan
+
+    def test_admin_search_by_email(self, user):
+        model_admin = site._registry[CustomUserModel]
+        request = RequestFactory().get('/')
+        queryset, _ = model_admin.get_search_results(
+            request, CustomUserModel.objects.all(), 'MIXED.CASE@example.com'
+        )
+        assert list(queryset) == [user]
+        queryset, _ = model_admin.get_search_results(
+            request, CustomUserModel.objects.all(), 'mixed'
+        )
+        assert list(queryset) == [user]
+
+    def test_import_upserts_ignoring_case(self, user, tmp_path):
+        path = tmp_path / 'usuarios.csv'
+        with open(path, 'w', newline='') as file:
+            csv.writer(file).writerows([
+                ['email', 'first_name'],
+                ['MIXED.CASE@EXAMPLE.COM', 'Importado'],
+            ])
+        result = AccountImporter(path, workers=0).run()
+
+        assert result.errors == []
+        assert result.users_updated == 1
+        assert CustomUserModel.objects.count() == 1
+        user.refresh_from_db()
+        assert user.first_name == 'Importado'
+        assert user.email == 'Mixed.Case@example.com'
+
+
+@pytest.mark.django_db
+class TestCustomUserModelAdminLicenses:
+
+    @pytest.fixture
+    def admin_client(self, client):
+        admin_user = CustomUserModel.objects.create_superuser(
+            email='admin-licencias@example.com', password='pwd'
+        )
+        client.force_login(admin_user)
+        return client
+
+    def create_users(self, count, start=0):
+        users = []
+        for index in range(start, start + count):
+            user = CustomUserModel.objects.create_user(
+                email=f'usuario{index}@example.com', password='pwd'
+            )
+            License.objects.create(
+                user=user, license_key=f'vigente-{index}', is_active=True,
+                expires_on=timezone.now() + timedelta(days=30)
+            )
+            License.objects.create(
+                user=user, license_key=f'expirada-{index}', is_active=True,
+                expires_on=timezone.now() - timedelta(days=1)
+            )
+            users.append(user)
+        return users
+
+    def test_count_ignores_inactive_deleted_and_expired(self):
+        user = self.create_users(1)[0]
+        License.objects.create(
+            user=user, license_key='inactiva', is_active=False
+        )
+        License.objects.create(
+            user=user, license_key='eliminada', is_active=True,
+            is_deleted=True
+        )
+        model_admin = site._registry[CustomUserModel]
+        request = RequestFactory().get('/')
+        obj = model_admin.get_queryset(request).get(pk=user.pk)
+
+        assert obj.active_license_count == 1
+        assert '1 licencia(s)' in model_admin.license_count(obj)
+
+    def test_changelist_queries_do_not_depend_on_rows(self, admin_client):
+        url = reverse('admin:accounts_customusermodel_changelist')
+        self.create_users(2)
+        # La primera petición incluye la validación periódica de licencias
+        admin_client.get(url)
+        with CaptureQueriesContext(connection) as few:
+            assert admin_client.get(url).status_code == 200
+
+        self.create_users(20, start=2)
+        with CaptureQueriesContext(connection) as many:
+            response = admin_client.get(url)
+        assert response.status_code == 200
+        assert len(many) == len(few)
+
+    def test_filter_and_sort_by_license_count(self, admin_client):
+        self.create_users(2)
+        url = reverse('admin:accounts_customusermodel_changelist')
+
+        response = admin_client.get(url, {'licencias': 'sin'})
+        emails = [user.email for user in response.context['cl'].result_list]
+        assert emails == ['admin-licencias@example.com']
+
+        response = admin_client.get(url, {'licencias': 'con'})
+        assert response.context['cl'].result_count == 2
+
+        # Columna license_count (posición 6 en list_display con checkbox)
+        response = admin_client.get(url, {'o': '-7'})
+        result = response.context['cl'].result_list
+        assert result[len(result) - 1].email == 'admin-licencias@example.com'
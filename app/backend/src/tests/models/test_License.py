@@ -0,0 +1,118 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.managers.LicenseManager import LicenseQuerySet
+from accounts.models import CustomUserModel, License
+
+
+@pytest.mark.django_db
+class TestLicenseStatus:
+
+    @pytest.fixture
+    def user(self):
+        return CustomUserModel.objects.create_user(
+            email='estado@example.com', password='pwd'
+        )
+
+    @pytest.fixture
+    def licenses(self, user):
+        now = timezone.now()
+        return {
+            'activa': License.objects.create(
+                user=user, license_key='ACTIVA', is_active=True,
+                expires_on=now + timedelta(days=10, hours=1)
+            ),
+            'sin_fecha': License.objects.create(
+                user=user, license_key='SIN-FECHA', is_active=True
+            ),
+            'inactiva': License.objects.create(
+                user=user, license_key='INACTIVA', is_active=False,
+                expires_on=now + timedelta(days=3, hours=1)
+            ),
+            'expirada': License.objects.create(
+                user=user, license_key='EXPIRADA', is_active=True,
+                expires_on=now - timedelta(days=1)
+            ),
+            'eliminada': License.objects.create(
+                user=user, license_key='ELIMINADA', is_active=True,
+                is_deleted=True
+            ),
+        }
+
+    def test_with_status_matches_python_properties(self, licenses):
+        annotated = {
+            obj.license_key: obj for obj in License.objects.with_status()
+        }
+        expected = {
+            'ACTIVA': LicenseQuerySet.ACTIVE,
+            'SIN-FECHA': LicenseQuerySet.ACTIVE,
+            'INACTIVA': LicenseQuerySet.INACTIVE,
+            'EXPIRADA': LicenseQuerySet.EXPIRED,
+            'ELIMINADA': LicenseQuerySet.DELETED,
+        }
+        for key, status in expected.items():
+            obj = annotated[key]
+            assert obj.status == status
+            assert obj.remaining.days == obj.days_remaining
+
+    def test_with_status_filters_and_orders_in_database(self, licenses):
+        queryset = License.objects.with_status()
+        assert list(
+            queryset.filter(status=LicenseQuerySet.EXPIRED)
+        ) == [licenses['expirada']]
+        assert [
+            obj.license_key
+            for obj in queryset.order_by('-remaining', 'license_key')[:2]
+        ] == ['ACTIVA', 'INACTIVA']
+
+    def test_admin_changelist_single_query_per_page(self, user, client):
+        admin_user = CustomUserModel.objects.create_superuser(
+            email='admin-estado@example.com', password='pwd'
+        )
+        client.force_login(admin_user)
+        url = reverse('admin:accounts_license_changelist')
+        # La primera petición incluye la validación periódica de licencias
+        client.get(url)
+
+        License.objects.bulk_create([
+            License(user=user, license_key=f'L-{index}', is_active=True,
+                    expires_on=timezone.now() + timedelta(days=index))
+            for index in range(3)
+        ])
+        with CaptureQueriesContext(connection) as few:
+            assert client.get(url).status_code == 200
+
+        License.objects.bulk_create([
+            License(user=user, license_key=f'L-{index}', is_active=True,
+                    expires_on=timezone.now() + timedelta(days=index))
+            for index in range(3, 60)
+        ])
+        with CaptureQueriesContext(connection) as many:
+            response = client.get(url)
+        assert response.status_code == 200
+        assert len(many) == len(few)
+        # La página trae las licencias con su usuario en una sola consulta
+        license_queries = [
+            query['sql'] for query in many.captured_queries
+            if 'FROM "accounts_license"' in query['sql'] and
+            'JOIN "accounts_customusermodel"' in query['sql']
+        ]
+        assert len(license_queries) == 1
+
+    def test_admin_status_filter(self, licenses, client):
+        admin_user = CustomUserModel.objects.create_superuser(
+            email='admin-filtro@example.com', password='pwd'
+        )
+        client.force_login(admin_user)
+        url = reverse('admin:accounts_license_changelist')
+
+        response = client.get(url, {'estado': LicenseQuerySet.INACTIVE})
+        assert [
+            obj.license_key for obj in response.context['cl'].result_list
+        ] == ['INACTIVA']
+        assert 'Inactiva' in response.content.decode()
@@ -0,0 +1,85 @@
+import pytest
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.test import Client
+from django.urls import reverse
+from accounts.models import CustomUserModel
+from accounts.views.ChangePassUpdtView import ChangePassUpdtView
+
+
+@pytest.mark.django_db
+class TestChangePassUpdtView:
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+        yield
+        cache.clear()
+
+    @pytest.fixture
+    def user(self):
+        return CustomUserModel.objects.create_user(
+            email='cambio@example.com', password='Clave-Actual-2024'
+        )
+
+    @pytest.fixture
+    def client_logged(self, user):
+        client = Client(enforce_csrf_checks=True)
+        client.force_login(user)
+        return client
+
+    def url(self):
+        return reverse('accounts:change_password')
+
+    def test_get_form(self, client_logged):
+        response = client_logged.get(self.url())
+        assert response.status_code == 200
+        html = response.json()['form_html']
+        assert 'id="changePasswordForm"' in html
+        assert 'name="csrfmiddlewaretoken"' in html
+        assert 'Nueva Contraseña' in html
+        assert response['ETag']
+        assert 'private' in response['Cache-Control']
+        assert 'no-cache' in response['Cache-Control']
+
+        # El fragmento estático queda en la caché sin el token CSRF
+        fragment = cache.get(make_template_fragment_key(
+            'change_password_form', [ChangePassUpdtView.get_form_version()]
+        ))
+        assert 'Nueva Contraseña' in fragment
+        assert 'csrfmiddlewaretoken' not in fragment
+
+    def test_repeat_open_returns_not_modified(self, client_logged):
+        first = client_logged.get(self.url())
+        second = client_logged.get(
+            self.url(), HTTP_IF_NONE_MATCH=first['ETag']
+        )
+        assert second.status_code == 304
+        assert second.content == b''
+        assert second['ETag'] == first['ETag']
+
+        assert client_logged.get(
+            self.url(), HTTP_IF_NONE_MATCH='"otra-version"'
+        ).status_code == 200
+
+    def test_etag_changes_with_csrf_secret(self, client_logged, user):
+        first = client_logged.get(self.url())
+        other = Client()
+        other.force_login(user)
+        assert other.get(self.url())['ETag'] != first['ETag']
+
+    def test_token_from_cached_form_is_valid(self, client_logged):
+        first = client_logged.get(self.url())
+        client_logged.get(self.url())
+        html = first.json()['form_html']
+        token = html.split('name="csrfmiddlewaretoken" value="')[1]
+        token = token.split('"')[0]
+
+        response = client_logged.post(self.url(), {
+            'csrfmiddlewaretoken': token,
+            'old_password': 'Clave-Actual-2024',
+            'new_password1': 'Nueva-Segura-2025',
+            'new_password2': 'Nueva-Segura-2025',
+        })
+        assert response.status_code == 200
+        assert response.json()['success'] is True
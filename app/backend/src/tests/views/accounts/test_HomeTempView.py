@@ -1,10 +1,13 @@
 import pytest
 from django.urls import reverse
 from tests.base.BaseTestView import BaseTestView
+from tests.base.QueryBudgetMixin import QueryBudgetMixin
 
 
 @pytest.mark.django_db
-class TestHomeTempView(BaseTestView):
+class TestHomeTempView(QueryBudgetMixin, BaseTestView):
+
+    query_budget = 6
 
     @pytest.fixture
     def url(self):